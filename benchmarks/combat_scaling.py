@@ -0,0 +1,141 @@
+"""
+Time WorldModel.update, broken down by system, for scripted combats of increasing size.
+
+Run with `python -m benchmarks.combat_scaling`. Use the same seed and sizes before and after a change to compare.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING
+
+from nqp.core import ecs
+from nqp.core.constants import SIMULATION_TIME_STEP
+from nqp.simulation.headless import HeadlessGame, prepare_combat
+
+if TYPE_CHECKING:
+    from typing import Callable, Dict, List, Optional
+
+__all__ = ["ScalingResult", "benchmark_combat", "run_scaling"]
+
+
+@dataclass
+class ScalingResult:
+    """
+    Timings for a single combat size. Times are mean milliseconds per frame.
+    """
+
+    units_per_side: int
+    num_entities: int
+    frames: int
+    frame_ms: float
+    system_ms: Dict[str, float] = field(default_factory=dict)
+
+
+def benchmark_combat(
+    player_units: List[str],
+    enemy_units: List[str],
+    frames: int = 300,
+    warmup_frames: int = 30,
+    seed: int = 0,
+    time_step: float = SIMULATION_TIME_STEP,
+) -> ScalingResult:
+    """
+    Run a combat for a fixed number of frames and time each of the WorldModel's update systems.
+    """
+    game = HeadlessGame(seed)
+    model = game.world.model
+    prepare_combat(game, player_units, enemy_units)
+    num_entities = len(model.get_all_entities())
+
+    # settle into combat before timing
+    for _ in range(warmup_frames):
+        game.update(time_step)
+
+    # wrap each system so its time is recorded
+    totals: Dict[str, float] = {name: 0.0 for name, _ in model.update_systems}
+    model.update_systems = [(name, _timed(name, system, totals)) for name, system in model.update_systems]
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        model.update(time_step)
+    elapsed = time.perf_counter() - start
+
+    system_ms = {name: total * 1000 / frames for name, total in totals.items()}
+    return ScalingResult(len(player_units), num_entities, frames, elapsed * 1000 / frames, system_ms)
+
+
+def run_scaling(
+    sizes: List[int],
+    unit_types: List[str],
+    enemy_unit_types: Optional[List[str]] = None,
+    frames: int = 300,
+    seed: int = 0,
+) -> List[ScalingResult]:
+    """
+    Benchmark a combat at each size, in units per side. Unit types are cycled to fill each side.
+    """
+    if enemy_unit_types is None:
+        enemy_unit_types = unit_types
+
+    results = []
+    for size in sizes:
+        player_units = [unit_types[i % len(unit_types)] for i in range(size)]
+        enemy_units = [enemy_unit_types[i % len(enemy_unit_types)] for i in range(size)]
+        results.append(benchmark_combat(player_units, enemy_units, frames=frames, seed=seed))
+
+    return results
+
+
+def _timed(name: str, system: Callable[[float], None], totals: Dict[str, float]) -> Callable[[float], None]:
+    def timed_system(delta_time: float):
+        start = time.perf_counter()
+        system(delta_time)
+        totals[name] += time.perf_counter() - start
+
+    return timed_system
+
+
+def _print_results(results: List[ScalingResult]):
+    system_names = list(results[0].system_ms)
+    header = ["units", "entities", "frame_ms"] + system_names
+    print("  ".join(f"{heading:>11}" for heading in header))
+
+    for result in results:
+        row = [f"{result.units_per_side:>11}", f"{result.num_entities:>11}", f"{result.frame_ms:>11.3f}"]
+        row += [f"{result.system_ms[name]:>11.3f}" for name in system_names]
+        print("  ".join(row))
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="benchmarks.combat_scaling")
+    parser.add_argument("--sizes", default="1,2,4,8,16", help="comma separated units per side")
+    parser.add_argument("--units", default="", help="comma separated player unit types; all units if omitted")
+    parser.add_argument("--combat", default="", help="use the enemy units of this combat from data/combats")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", default="", help="also write the results to this path")
+    args = parser.parse_args()
+
+    game = HeadlessGame()  # only used to read data
+    data = game.data
+    ecs.reset_world()
+
+    unit_types = args.units.split(",") if args.units else sorted(data.units)
+    enemy_unit_types = None
+    if args.combat:
+        enemy_unit_types = [unit_type for unit_type in data.combats[args.combat]["units"] if unit_type in data.units]
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = run_scaling(sizes, unit_types, enemy_unit_types, frames=args.frames, seed=args.seed)
+    _print_results(results)
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump([asdict(result) for result in results], file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
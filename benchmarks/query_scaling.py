@@ -0,0 +1,113 @@
+"""
+Time iterating queries, compiled snecs against cached, for increasing numbers of Entities.
+
+Run with `python -m benchmarks.query_scaling`. Each frame a component is added to and removed from one Entity, so
+cached queries pay for their upkeep as well as their iteration.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+import pygame
+from snecs import Query
+
+from nqp.core import ecs
+from nqp.core.ecs import CachedQuery
+from nqp.world_elements.entity_components import Allegiance, HealReceived, Position
+
+if TYPE_CHECKING:
+    from typing import Iterable, List, Optional
+
+    from snecs.typedefs import EntityID
+
+__all__ = ["QueryScalingResult", "benchmark_queries", "run_scaling"]
+
+
+@dataclass
+class QueryScalingResult:
+    """
+    Timings for a single number of Entities. Times are mean microseconds per frame.
+    """
+
+    num_entities: int
+    iterations_per_frame: int
+    compiled_us: float
+    cached_us: float
+
+
+def benchmark_queries(num_entities: int, iterations_per_frame: int = 4, frames: int = 200) -> QueryScalingResult:
+    """
+    Iterate the same query, both compiled and cached, iterations_per_frame times a frame.
+    """
+    ecs.reset_world()
+    compiled = Query([Position, Allegiance]).compile()
+    cached = CachedQuery([Position, Allegiance])
+
+    entities = [
+        ecs.new_entity((Position(pygame.Vector2(i, 0)), Allegiance("player" if i % 2 else "enemy", None)))
+        for i in range(num_entities)
+    ]
+    changed_entity = entities[0] if entities else None
+
+    compiled_time = _time_frames(compiled, changed_entity, iterations_per_frame, frames)
+    cached_time = _time_frames(cached, changed_entity, iterations_per_frame, frames)
+
+    return QueryScalingResult(
+        num_entities,
+        iterations_per_frame,
+        compiled_time * 1_000_000 / frames,
+        cached_time * 1_000_000 / frames,
+    )
+
+
+def run_scaling(sizes: List[int], iterations_per_frame: int = 4, frames: int = 200) -> List[QueryScalingResult]:
+    return [benchmark_queries(size, iterations_per_frame, frames) for size in sizes]
+
+
+def _time_frames(query: Iterable, changed_entity: Optional[EntityID], iterations_per_frame: int, frames: int) -> float:
+    elapsed = 0.0
+    for _ in range(frames):
+        if changed_entity is not None:
+            ecs.add_component(changed_entity, HealReceived(1, None))
+            ecs.remove_component(changed_entity, HealReceived)
+
+        start = time.perf_counter()
+        for _ in range(iterations_per_frame):
+            for entity, (position, allegiance) in query:
+                pass
+        elapsed += time.perf_counter() - start
+
+    return elapsed
+
+
+def _print_results(results: List[QueryScalingResult]):
+    header = ["entities", "compiled_us", "cached_us"]
+    print("  ".join(f"{heading:>11}" for heading in header))
+
+    for result in results:
+        print(f"{result.num_entities:>11}  {result.compiled_us:>11.1f}  {result.cached_us:>11.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="benchmarks.query_scaling")
+    parser.add_argument("--sizes", default="10,100,1000,10000", help="comma separated numbers of entities")
+    parser.add_argument("--iterations", type=int, default=4, help="times each query is iterated per frame")
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--json", default="", help="also write the results to this path")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = run_scaling(sizes, args.iterations, args.frames)
+    _print_results(results)
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump([asdict(result) for result in results], file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
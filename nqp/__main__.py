@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import argparse
 import logging
 import sys
 import traceback
@@ -7,7 +8,7 @@ import traceback
 import pygame
 
 from nqp.core import debug
-from nqp.core.constants import GameState
+from nqp.core.constants import GameState, INFINITE, ProfilingMode, SIMULATION_TIME_STEP
 from nqp.core.game import Game
 
 
@@ -15,11 +16,17 @@ def main():
     """
     The entry for the game initialisation and game loop
     """
+    args = _parse_args()
+    if args.headless:
+        run_headless(args)
+        raise SystemExit
+
     game = Game()
 
     # initialise profiling
-    if game.debug.is_profiling:
-        game.debug.enable_profiling()
+    profiling_mode = ProfilingMode[args.profile.upper()]
+    if profiling_mode != ProfilingMode.OFF:
+        game.debug.enable_profiling(profiling_mode, args.profile_frames)
 
     # run the game
     try:
@@ -40,7 +47,7 @@ def main():
         # print debug values
         game.debug.print_values_to_console()
     if game.debug.is_profiling:
-        game.debug.kill_profiler()
+        game.debug.disable_profiling()
 
     # clean up pygame resources
     pygame.quit()
@@ -58,5 +65,41 @@ def game_loop(game: Game):
         game.run()
 
 
+def run_headless(args: argparse.Namespace):
+    """
+    Simulate combats without a window and print a summary of each.
+    """
+    from nqp.simulation.headless import simulate_combat  # only needed when headless
+
+    player_units = args.player.split(",")
+    enemy_units = args.enemy.split(",") if args.enemy else None
+
+    for run in range(args.runs):
+        seed = None if args.seed is None else args.seed + run
+        result = simulate_combat(
+            player_units, enemy_units, seed=seed, time_step=args.time_step, max_duration=args.max_duration
+        )
+        print(result)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="nqp")
+    parser.add_argument(
+        "--profile",
+        choices=[mode.name.lower() for mode in ProfilingMode],
+        default="off",
+        help="profile the game, writing a Chrome trace to .debug/profiling",
+    )
+    parser.add_argument("--profile-frames", type=int, default=INFINITE, help="frames to profile for; all if omitted")
+    parser.add_argument("--headless", action="store_true", help="simulate combat without a window")
+    parser.add_argument("--player", default="infantryman", help="comma separated player unit types")
+    parser.add_argument("--enemy", default="", help="comma separated enemy unit types; random combat if omitted")
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None, help="seed of the first run; incremented each run")
+    parser.add_argument("--time-step", type=float, default=SIMULATION_TIME_STEP)
+    parser.add_argument("--max-duration", type=float, default=300, help="simulated seconds before a timeout")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":  # prevents being run from other modules
     main()
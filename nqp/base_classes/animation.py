@@ -11,14 +11,48 @@ from nqp.core.constants import AnimationState, DEFAULT_IMAGE_SIZE
 if TYPE_CHECKING:
     from typing import Dict, List, Tuple
 
-__all__ = ["Animation"]
+__all__ = ["Animation", "AnimationClock"]
+
+
+class AnimationClock:
+    """
+    A shared source of time for animations. Advanced once per frame, rather than every animation tracking its own
+    time.
+    """
+
+    def __init__(self):
+        self.time: float = 0
+
+    def advance(self, delta_time: float):
+        self.time += delta_time
 
 
 class Animation:
     """
-    Class to hold visual information for a series of images
+    Class to hold visual information for a series of images.
+
+    The current frame is worked out when asked for, from the clock and the time the animation started, so an
+    animation costs nothing on frames it isnt drawn.
     """
 
+    __slots__ = (
+        "_frame_sets",
+        "_frame_duration",
+        "_is_looping",
+        "_current_frame_set_name",
+        "uses_simulation_time",
+        "_clock",
+        "_current_num_frames",
+        "_animation_length",
+        "delete_on_finish",
+        "_state",
+        "_start_time",
+        "_held_duration",
+        "_flash_end_time",
+        "_flash_colour",
+        "__weakref__",  # held weakly by the AnimationRegistry
+    )
+
     def __init__(
         self,
         frames: Dict[str, List[Image]],
@@ -26,6 +60,7 @@ class Animation:
         loop: bool = True,
         starting_frame_set_name: str = None,
         uses_simulation_time: bool = True,
+        clock: AnimationClock | None = None,
     ):
         self._frame_sets: Dict[str, List[Image]] = frames
         self._frame_duration: float = max(frame_duration, 0.1)  # must be greater than 1
@@ -35,6 +70,7 @@ class Animation:
         else:
             self._current_frame_set_name: str = list(self._frame_sets)[0]
         self.uses_simulation_time: bool = uses_simulation_time  # simulation or absolute, i.e. uses game speed
+        self._clock: AnimationClock = clock if clock is not None else AnimationClock()
 
         self._current_num_frames: int = len(self.current_frame_set)
         self._animation_length: float = self._current_num_frames * self._frame_duration
@@ -44,39 +80,45 @@ class Animation:
 
         # progress
         self._state: AnimationState = AnimationState.PLAYING
-        self._current_frame_num: int = 0
-        self._duration: float = 0
-        self._flash_timer: float = 0
+        self._start_time: float = self._clock.time
+        self._held_duration: float = 0  # duration at the point the animation stopped playing
+        self._flash_end_time: float = 0
         self._flash_colour: None | Tuple[int, int, int] = None
 
-    def update(self, delta_time: float, game_speed: float):
-        # exit if not playing
+    def _get_duration(self) -> float:
+        """
+        Get the time into the current play through. Also notes when a non-looping animation has reached the end.
+        """
         if self._state != AnimationState.PLAYING:
-            return
+            return self._held_duration
 
-        # mod delta time if needed
-        if self.uses_simulation_time:
-            delta_time = delta_time * game_speed
-        else:
-            delta_time = delta_time
-
-        # update timers
-        self._duration += delta_time
-        if self._flash_timer > 0:
-            self._flash_timer -= delta_time
+        duration = self._clock.time - self._start_time
 
         # have we reached the end?
-        if self._duration >= self._animation_length:
-            # reset duration if looping
+        if duration >= self._animation_length:
             if self._is_looping:
-                self._duration = 0
+                duration %= self._animation_length
             else:
                 self._state = AnimationState.FINISHED
+                self._held_duration = duration
 
-        # update frame
-        self._current_frame_num = (
-            int(self._duration / self._frame_duration * self._current_num_frames) % self._current_num_frames
-        )
+        return duration
+
+    @property
+    def _current_frame_num(self) -> int:
+        return int(self._get_duration() / self._frame_duration * self._current_num_frames) % self._current_num_frames
+
+    @property
+    def loop(self) -> bool:
+        return self._is_looping
+
+    @loop.setter
+    def loop(self, loop: bool):
+        self._is_looping = loop
+
+    @property
+    def _is_flashing(self) -> bool:
+        return self._clock.time < self._flash_end_time
 
     def set_current_frame_set_name(self, frame_set_name: str):
         """
@@ -93,6 +135,7 @@ class Animation:
 
             # update frame count
             self._current_num_frames = len(self.current_frame_set)
+            self._animation_length = self._current_num_frames * self._frame_duration
         else:
             logging.warning(f"Tried to set frame set to {frame_set_name} but it doesnt exist.")
 
@@ -100,18 +143,24 @@ class Animation:
         """
         Resume the animation
         """
+        if self._state == AnimationState.PLAYING:
+            return
+
+        self._start_time = self._clock.time - self._held_duration
         self._state = AnimationState.PLAYING
 
     def pause(self):
         """
         Pause the animation
         """
+        self._held_duration = self._get_duration()
         self._state = AnimationState.PAUSED
 
     def stop(self):
         """
         Finish the animation
         """
+        self._held_duration = self._get_duration()
         self._state = AnimationState.FINISHED
 
     def reset(self):
@@ -119,8 +168,7 @@ class Animation:
         Reset and pause the animation
         """
         self._state = AnimationState.PAUSED
-        self._duration = 0
-        self._current_frame_num = 0
+        self._held_duration = 0
         self.delete_on_finish = True
 
     def get_frame(self, frame_num: int) -> Image:
@@ -151,18 +199,29 @@ class Animation:
         surf = self.get_frame(self._current_frame_num).surface
 
         # apply flash
-        if self._flash_timer > 0:
+        if self._is_flashing:
             surf = surf.copy()
             colour_surf = pygame.Surface(surf.get_size()).convert_alpha()
             colour_surf.fill(self._flash_colour)
             surf.blit(colour_surf, (0, 0), special_flags=pygame.BLEND_ADD)
         return surf
 
+    @property
+    def frame_key(self) -> Tuple[str, int, bool]:
+        """
+        Return a key identifying what the animation currently looks like. The key changes whenever a different
+        surface would be drawn.
+        """
+        return self._current_frame_set_name, self._current_frame_num, self._is_flashing
+
     @property
     def is_finished(self) -> bool:
         """ "
         Return True if this animation has finished playing.
         """
+        # reaching the end is only noticed when the duration is checked
+        self._get_duration()
+
         if self._state == AnimationState.FINISHED:
             result = True
         else:
@@ -186,5 +245,5 @@ class Animation:
         """
         Change the colour of the sprite for a given period.
         """
-        self._flash_timer = duration
+        self._flash_end_time = self._clock.time + duration
         self._flash_colour = colour
@@ -11,14 +11,14 @@ if TYPE_CHECKING:
 __all__ = ["Image"]
 
 
-class Image(pygame.sprite.Sprite):
+class Image:
     """
     Class to hold visual information for static images
     """
 
-    def __init__(self, *args: pygame.sprite.Group, image: pygame.Surface):
-        super().__init__(*args)
+    __slots__ = ("_image",)
 
+    def __init__(self, image: pygame.Surface):
         self._image: pygame.Surface = image
 
     @property
@@ -28,6 +28,12 @@ class Scene(ABC):
     def update(self, delta_time: float):
         pass
 
+    def fixed_update(self, delta_time: float):
+        """
+        Advance the Scene's simulation. Called zero or more times a frame, always with the same delta_time.
+        """
+        pass
+
     @abstractmethod
     def reset(self):
         pass
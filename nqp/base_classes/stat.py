@@ -5,9 +5,9 @@ from abc import ABC
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Any, Callable
+    from typing import Any, Callable, Dict, Optional
 
-__all__ = ["Stat"]
+__all__ = ["Stat", "get_modifier_ref"]
 
 
 class Stat(ABC):
@@ -18,13 +18,18 @@ class Stat(ABC):
     `value` is the result after modifiers are applied.
     `override` forces a specific value to be used, ignoring modifiers.
 
+    `value` is recalculated whenever the base value, override or modifiers change, so reading it is only an
+    attribute access.
+
     """
 
     def __init__(self, base_value):
         self._base_value = base_value
-        # weakkey dict will drop modifiers if they have been deleted
-        self._modifiers = weakref.WeakKeyDictionary()
+        # modifiers are held by a weak reference to their key, where the key allows it, so they are dropped if the
+        # key is deleted
+        self._modifiers: Dict[Any, Callable] = {}
         self._override_value = None
+        self.value = base_value
 
     def reset(self):
         """
@@ -32,15 +37,21 @@ class Stat(ABC):
         """
         self._override_value = None
         self._modifiers.clear()
+        self._recalculate()
 
-    @property
-    def value(self):
+    def _recalculate(self):
+        """
+        Recalculate the value from the base value, override and modifiers.
+        """
         if self._override_value is not None:
-            return self._override_value
+            self.value = self._override_value
+            return
+
+        base_value = self._base_value
         acc = 0
-        for key, func in self._modifiers.items():
-            acc += func(self._base_value)
-        return self._base_value + acc
+        for func in self._modifiers.values():
+            acc += func(base_value)
+        self.value = base_value + acc
 
     @property
     def base_value(self):
@@ -52,6 +63,7 @@ class Stat(ABC):
         Set the base or original value for the Stat.
         """
         self._base_value = value
+        self._recalculate()
 
     def override(self, value):
         """
@@ -59,6 +71,7 @@ class Stat(ABC):
 
         """
         self._override_value = value
+        self._recalculate()
 
     def apply_modifier(self, func: Callable, key: Any):
         """
@@ -71,7 +84,8 @@ class Stat(ABC):
             key: Unique identifier for adding and removing
 
         """
-        self._modifiers[key] = func
+        self._modifiers[get_modifier_ref(key, self._remove_expired_modifier)] = func
+        self._recalculate()
 
     def remove_modifier(self, key: Any):
         """
@@ -81,7 +95,8 @@ class Stat(ABC):
             key: Unique identifier for adding and removing
 
         """
-        del self._modifiers[key]
+        del self._modifiers[get_modifier_ref(key)]
+        self._recalculate()
 
     def has_modifier(self, key: Any):
         """
@@ -91,4 +106,22 @@ class Stat(ABC):
             key: Unique identifier for adding and removing
 
         """
-        return key in self._modifiers
+        return get_modifier_ref(key) in self._modifiers
+
+    def _remove_expired_modifier(self, ref: weakref.ref):
+        """
+        Remove the modifier of a key that has been deleted.
+        """
+        if self._modifiers.pop(ref, None) is not None:
+            self._recalculate()
+
+
+def get_modifier_ref(key: Any, callback: Optional[Callable] = None) -> Any:
+    """
+    Get what a modifier's key is held under: a weak reference to the key, calling callback when the key is deleted.
+    Keys that cannot be weakly referenced, e.g. ints and strings, are held as they are, until removed.
+    """
+    try:
+        return weakref.ref(key, callback)
+    except TypeError:
+        return key
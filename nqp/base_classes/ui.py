@@ -43,6 +43,7 @@ class UI(ABC):
         self._instruction_text: str = ""
 
         self.is_active: bool = False
+        self.reports_dirty_rects: bool = False  # whether all changes are reported to the window as dirty rects
 
     def update(self, delta_time: float):
         self._temporary_instruction_timer -= delta_time
@@ -66,6 +67,8 @@ class UI(ABC):
         self._elements = {}
         self._containers = {}
 
+        self._game.window.mark_full_refresh()
+
     def activate(self):
         """
         Activate the UI. Rebuilds and begins rendering the UI.
@@ -78,6 +81,7 @@ class UI(ABC):
         Deactivate the UI. R
         """
         self.is_active = False
+        self._game.window.mark_full_refresh()
 
     def refresh_info(self):
         pass
@@ -163,6 +167,8 @@ class UI(ABC):
         font.pos = pygame.Vector2(x, y)
         font.draw(surface)
 
+        self._game.window.add_dirty_rect(pygame.Rect(x, y, font.width, font.height))
+
     def _draw_elements(self, surface: pygame.Surface):
         """
         Draw all elements, both those held in _elements and _containers.
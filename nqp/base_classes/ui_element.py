@@ -29,6 +29,7 @@ class UIElement(ABC):
         self.was_previously_selected: bool = False
         self._tooltip_counter: float = 0
         self.show_tooltip: bool = False
+        self._is_dirty: bool = True  # whether the surface needs rebuilding before it is next drawn
 
         self._previously_selected: Animation = self._game.visual.create_animation(
             "selector", "previously_selected", uses_simulation_time=False
@@ -53,12 +54,28 @@ class UIElement(ABC):
             if self.is_selected and self._current_selector is not None:
                 self._draw_selector(surface)
 
+                # selector animates so always needs presenting
+                self._game.window.add_dirty_rect(self._get_selector_rect())
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._is_dirty
+
+    def mark_dirty(self):
+        """
+        Flag that the element's content has changed and its surface needs rebuilding.
+        """
+        self._is_dirty = True
+
     @property
     def is_selected(self) -> bool:
         return self._is_selected
 
     @is_selected.setter
     def is_selected(self, state: bool):
+        if state != self._is_selected:
+            self._is_dirty = True
+
         self._is_selected = state
 
         if state:
@@ -93,7 +110,26 @@ class UIElement(ABC):
         y = self.y - self.size.y
         surface.blit(self._current_selector.surface, (x, y))
 
+    def _get_selector_rect(self) -> pygame.Rect:
+        """
+        Get the area of the display the selector covers when drawn.
+        """
+        selector = self._selected_selector
+        width, height = selector.surface.get_size()
+        return pygame.Rect(self.x - selector.image.width, int(self.y - self.size.y), width, height)
+
+    def _report_dirty_rect(self):
+        """
+        Tell the window the area covered by the element, and its selector, has changed.
+        """
+        rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self._game.window.add_dirty_rect(rect.union(self._get_selector_rect()))
+
     def set_active(self, is_active: bool):
+        if is_active != self.is_active:
+            self._is_dirty = True
+            self._report_dirty_rect()
+
         if is_active:
             self.is_active = True
             self.is_selectable = self._was_selectable
@@ -7,9 +7,11 @@ from snecs.typedefs import EntityID
 
 from nqp.base_classes.entity_behaviour import EntityBehaviour
 from nqp.command.unit import Unit
+from nqp.core import ecs
 from nqp.core.constants import HealingSource, PATH_UPDATE_FREQ
 from nqp.core.utility import distance_to
-from nqp.world_elements.entity_components import Allegiance, HealReceived, IsDead, IsReadyToAttack, Position, Stats
+from nqp.world_elements import entity_flags
+from nqp.world_elements.entity_components import Allegiance, HealReceived, Position, Stats
 
 if TYPE_CHECKING:
     from nqp.core.game import Game
@@ -36,7 +38,7 @@ class BasicEntityBehaviour(EntityBehaviour):
             self.update_target_entity()
 
         if self.target_entity:
-            is_alive = not snecs.has_component(self.target_entity, IsDead)
+            is_alive = not entity_flags.is_dead.has(self.target_entity)
             if (self.target_entity not in self._unit.behaviour.valid_targets) or (not is_alive):
                 self.update_target_entity()
 
@@ -83,9 +85,7 @@ class BasicEntityBehaviour(EntityBehaviour):
 
         # attack intent
         if ((not self._unit.behaviour.check_visibility) or self.visibility_line) and self.attack_timer <= 0:
-            # ensure doesnt al ready have component
-            if not snecs.has_component(self._entity, IsReadyToAttack):
-                snecs.add_component(self._entity, IsReadyToAttack())
+            entity_flags.is_ready_to_attack.add(self._entity)
 
     def update_path(self):
         """
@@ -146,7 +146,7 @@ class BasicEntityBehaviour(EntityBehaviour):
 
         # try to apply
         try:
-            snecs.add_component(self._entity, HealReceived(stats.regen.value, HealingSource.SELF))
+            ecs.add_component(self._entity, HealReceived(stats.regen.value, HealingSource.SELF))
 
         except ValueError:
             heal_received = snecs.entity_component(self._entity, HealReceived)
@@ -6,6 +6,7 @@ from typing import Optional, TYPE_CHECKING
 import pygame
 import snecs
 
+from nqp.core import ecs
 from nqp.core.constants import StatModifiedStatus
 
 if TYPE_CHECKING:
@@ -98,10 +99,10 @@ class Unit:
 
     @property
     def is_alive(self):
-        from nqp.world_elements.entity_components import IsDead  # prevent circular import
+        from nqp.world_elements.entity_flags import is_dead  # prevent circular import
 
         for entity in self.entities:
-            if not snecs.has_component(entity, IsDead):
+            if not is_dead.has(entity):
                 return True
         return False
 
@@ -179,17 +180,17 @@ class Unit:
             # conditional components
             if self.uses_projectiles:
                 img = self._game.visual.get_image(self.projectile_data["img"])
-                speed = self.projectile_data
+                speed = self.projectile_data["speed"]
                 components.append(RangedAttack(self._ammo, img, speed))
 
             # create entity
-            entity = snecs.new_entity(components)
+            entity = ecs.new_entity(components)
             self.entities.append(entity)
 
             # add components that need ref to entity
             from nqp.command.basic_entity_behaviour import BasicEntityBehaviour  # prevent circular import
 
-            snecs.add_component(entity, AI(BasicEntityBehaviour(self._game, self, entity)))
+            ecs.add_component(entity, AI(BasicEntityBehaviour(self._game, self, entity)))
 
         self._align_entity_positions_to_unit()
 
@@ -198,9 +199,9 @@ class Unit:
         Delete all entities. If "immediately" = False this will happen on the next frame.
         """
         if immediately:
-            delete_func = snecs.delete_entity_immediately
+            delete_func = ecs.delete_entity_immediately
         else:
-            delete_func = snecs.schedule_for_deletion
+            delete_func = ecs.schedule_for_deletion
 
         for entity in self.entities:
             delete_func(entity)
@@ -212,7 +213,8 @@ class Unit:
         Reset the in combat values ready to begin combat.
         """
         # prevent circular import
-        from nqp.world_elements.entity_components import DamageReceived, IsDead, IsReadyToAttack, RangedAttack, Stats
+        from nqp.world_elements.entity_components import RangedAttack, Stats
+        from nqp.world_elements.entity_flags import is_dead, is_death_processed, is_ready_to_attack
 
         # get stat attrs
         stat_attrs = Stats.get_stat_names()
@@ -221,12 +223,9 @@ class Unit:
         for entity in self.entities:
 
             # remove flags
-            if snecs.has_component(entity, IsDead):
-                snecs.remove_component(entity, IsDead)
-            if snecs.has_component(entity, IsReadyToAttack):
-                snecs.remove_component(entity, IsReadyToAttack)
-            if snecs.has_component(entity, DamageReceived):
-                snecs.remove_component(entity, DamageReceived)
+            is_dead.remove(entity)
+            is_death_processed.remove(entity)
+            is_ready_to_attack.remove(entity)
 
             # reset ammo
             if snecs.has_component(entity, RangedAttack):
@@ -277,6 +276,7 @@ class Unit:
 
             position = snecs.entity_component(entity, Position)
             position.pos = pygame.Vector2(unit_x + scatter_x, unit_y + scatter_y)
+            position.reset_previous_pos()
 
     def generate_border_surface(self):
         """
@@ -8,7 +8,8 @@ import snecs
 
 from nqp.core.constants import TILE_SIZE
 from nqp.core.utility import distance_to
-from nqp.world_elements.entity_components import AI, Allegiance, IsDead, Position
+from nqp.world_elements import entity_flags
+from nqp.world_elements.entity_components import AI, Allegiance, Position
 
 if TYPE_CHECKING:
     from typing import List, Optional
@@ -50,17 +51,10 @@ class UnitBehaviour:
         """
         Find the nearest enemy from a different team and update the target.
         """
-        nearest = [None, 9999999]
-        for entity in self._game.world.model.get_all_entities():
-            other_team = snecs.entity_component(entity, Allegiance).team
-            if other_team != self.unit.team:
-                other_position = snecs.entity_component(entity, Position)
-                dis = distance_to(self.unit.pos, other_position.pos)
-                if dis < nearest[1]:
-                    nearest = [entity, dis]
-
-        if nearest[0]:
-            self.target_unit = snecs.entity_component(nearest[0], Allegiance).unit
+        nearest = self._game.world.model.targeting.get_nearest_enemy(self.unit)
+
+        if nearest is not None:
+            self.target_unit = snecs.entity_component(nearest, Allegiance).unit
             self.reference_entity = random.choice(self.target_unit.entities)
         else:
             self.target_unit = None
@@ -68,11 +62,11 @@ class UnitBehaviour:
 
     def update_valid_targets(self):
         self.valid_targets = []
-        if self.target_unit:
+        if self.target_unit and self.target_unit.entities:
+            reference_pos = snecs.entity_component(self.reference_entity, Position).pos
             for entity in self.target_unit.entities:
                 position = snecs.entity_component(entity, Position)
-                other_position = snecs.entity_component(self.reference_entity, Position)
-                if distance_to(position.pos, other_position.pos) < self.spread_max:
+                if distance_to(position.pos, reference_pos) < self.spread_max:
                     self.valid_targets.append(entity)
 
     def update(self, delta_time: float):
@@ -111,7 +105,7 @@ class UnitBehaviour:
             if self.reference_entity is None:
                 ref_entity_is_alive = False
             else:
-                ref_entity_is_alive = not snecs.has_component(self.reference_entity, IsDead)
+                ref_entity_is_alive = not entity_flags.is_dead.has(self.reference_entity)
             if self.target_unit and self.target_unit.is_alive and (not ref_entity_is_alive):
                 # if we have possible targets pick another random one to be the reference
                 if len(self.target_unit.entities):
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Iterator, List
+
+    from nqp.base_classes.animation import Animation
+
+__all__ = ["AnimationRegistry"]
+
+
+class AnimationRegistry:
+    """
+    Track the live animations.
+
+    Only weak references are held, so an animation is dropped once whatever owns it, e.g. a UIElement or an
+    entity's Aesthetic, is discarded. Dropped animations are compacted out in a single pass, once they make up
+    half of those held, rather than removed one at a time.
+    """
+
+    def __init__(self):
+        self._refs: List[weakref.ref] = []
+        self._num_collected: int = 0  # refs whose animation has been garbage collected since the last compaction
+
+    def __len__(self) -> int:
+        return len(self._refs) - self._num_collected
+
+    def __iter__(self) -> Iterator[Animation]:
+        for ref in self._refs:
+            animation = ref()
+            if animation is not None:
+                yield animation
+
+    def add(self, animation: Animation):
+        self._refs.append(weakref.ref(animation, self._on_collected))
+
+    def update(self):
+        """
+        Compact out collected animations if enough have built up.
+        """
+        if self._num_collected * 2 > len(self._refs):
+            self._compact()
+
+    def _compact(self):
+        self._refs = [ref for ref in self._refs if ref() is not None]
+        self._num_collected = 0
+
+    def _on_collected(self, ref: weakref.ref):
+        self._num_collected += 1
@@ -31,6 +31,13 @@ CRIT_MOD = 2.5  # value to multiply by
 # ai
 PATH_UPDATE_FREQ = 0.4
 
+# particles
+DEFAULT_MAX_PARTICLES = 2000
+
+# simulation
+SIMULATION_TIME_STEP = 1 / 60  # seconds simulated by each update of the world
+MAX_SIMULATION_STEPS = 8  # per frame, so a long frame cant snowball into longer and longer frames
+
 # UI customisation
 TEXT_FADE_OUT_SPEED = 0.5  # make sure it is slower than the fade in
 TEXT_FADE_IN_SPEED = 4  # font messes up if this is greater than 4
@@ -45,6 +52,12 @@ class GameState(IntEnum):
     EXITING = auto()
 
 
+class ProfilingMode(IntEnum):
+    OFF = auto()
+    SAMPLING = auto()
+    DETERMINISTIC = auto()
+
+
 class WorldState(IntEnum):
     CHOOSE_NEXT_ROOM = auto()
     COMBAT = auto()
@@ -200,6 +213,16 @@ class DamageType(IntEnum):
     MAGICAL = auto()
 
 
+class ParticlePriority(IntEnum):
+    """
+    How much of the particle budget an emitter may fill. Lower priorities stop emitting first as the budget runs out.
+    """
+
+    LOW = auto()
+    MEDIUM = auto()
+    HIGH = auto()
+
+
 class Colour(Enum):
     # basics
     WHITE = (255, 255, 255)
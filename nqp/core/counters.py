@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Optional, TextIO
+
+__all__ = [
+    "increment",
+    "set_value",
+    "end_frame",
+    "get_last_frame",
+    "format_last_frame",
+    "start_stream",
+    "stop_stream",
+    "is_streaming",
+]
+
+
+# Counts of work done this frame, by name, e.g. "path_searches". Anything can add to these, so they are module
+# level, as with queries, and kept to a dict lookup and add.
+_counts: Dict[str, int] = {}
+_last_frame: Dict[str, int] = {}
+_frame_num: int = 0
+_stream: Optional[TextIO] = None
+
+
+def increment(name: str, amount: int = 1):
+    """
+    Add to a counter for this frame.
+    """
+    _counts[name] = _counts.get(name, 0) + amount
+
+
+def set_value(name: str, value: int):
+    """
+    Set a counter for this frame, for things that are a total rather than work done, e.g. particles alive.
+    """
+    _counts[name] = value
+
+
+def end_frame():
+    """
+    Close off this frame's counters, writing them to the stream if there is one, and start afresh.
+    """
+    global _counts, _last_frame, _frame_num
+
+    _last_frame = _counts
+    _counts = {}
+    _frame_num += 1
+
+    if _stream is not None:
+        _stream.write(json.dumps({"frame": _frame_num, **_last_frame}) + "\n")
+
+
+def get_last_frame() -> Dict[str, int]:
+    """
+    Get the counters of the last completed frame.
+    """
+    return _last_frame
+
+
+def format_last_frame() -> str:
+    """
+    Get the counters of the last completed frame as a readable string, sorted by name.
+    """
+    return ", ".join(f"{name}={value}" for name, value in sorted(_last_frame.items()))
+
+
+def start_stream(path: str):
+    """
+    Write each frame's counters to path, as a line of JSON, until stopped.
+    """
+    global _stream
+
+    stop_stream()
+    _stream = open(path, "w")
+
+    logging.info(f"Streaming counters to {path}.")
+
+
+def stop_stream():
+    global _stream
+
+    if _stream is not None:
+        _stream.close()
+        _stream = None
+
+
+def is_streaming() -> bool:
+    return _stream is not None
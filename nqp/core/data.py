@@ -5,9 +5,9 @@ import os
 from pathlib import Path
 from typing import Any, TYPE_CHECKING, Union
 
-import snecs
 import yaml
 
+from nqp.core import ecs
 from nqp.core.constants import DATA_PATH
 from nqp.core.debug import Timer
 from nqp.world_elements.item import Item
@@ -63,6 +63,7 @@ class Data:
         Reload all data
         """
         self.effects = self._load_effects()
+        self.create_effect_processors()
         self.commanders = self._load_commanders()
         self.units = self._load_unit_info()
         self.factions = self._create_factions_list()  # must call after units
@@ -256,6 +257,13 @@ class Data:
         }
         logging.debug(f"Data: {len(effects)} items loaded.")
 
+        return effects
+
+    @staticmethod
+    def create_effect_processors():
+        """
+        Create the Entities that process effects. Must be called again whenever the ecs World is reset.
+        """
         # TODO: replace with autodiscover
         from nqp.effects.burn import OnFireStatusProcessor
         from nqp.effects.processors import EffectProcessorComponent, StatsEffectProcessor
@@ -264,9 +272,7 @@ class Data:
             StatsEffectProcessor,
             OnFireStatusProcessor,
         ):
-            snecs.new_entity([EffectProcessorComponent(processor_class())])
-
-        return effects
+            ecs.new_entity([EffectProcessorComponent(processor_class())])
 
     def get_units_by_category(self, factions: List[str], tiers: List[int] = None) -> List[str]:
         """
@@ -354,5 +360,5 @@ class Data:
             name=item_data.name,
             is_signature=item_data.is_signature,
         )
-        entity = snecs.new_entity((item,))
+        entity = ecs.new_entity((item,))
         return entity
@@ -1,28 +1,40 @@
 from __future__ import annotations
 
-import cProfile
+import contextlib
 import datetime
 import gc
-import io
 import logging
 import os
-import pstats
 import time
 import timeit
+from collections import deque
 from typing import TYPE_CHECKING
 
 import pygame
 
-from nqp.core.constants import DEBUGGING_PATH, FontType, INFINITE, LOGGING_PATH, PROFILING_PATH, VERSION, WorldState
+from nqp.core import counters
+from nqp.core.constants import (
+    Colour,
+    DEBUGGING_PATH,
+    FontType,
+    INFINITE,
+    LOGGING_PATH,
+    PROFILING_PATH,
+    ProfilingMode,
+    VERSION,
+    WorldState,
+)
+from nqp.core.memory_tracker import MemoryTracker
+from nqp.core.profiling import CallTracer, StackSampler, write_chrome_trace
 from nqp.ui_elements.generic.font import Font
 from nqp.ui_elements.tailored.dev_console import DevConsole
 
 if TYPE_CHECKING:
-    from typing import Callable, List, Optional, Tuple, TYPE_CHECKING, Union
+    from typing import Callable, Deque, Dict, List, Optional, Tuple, TYPE_CHECKING, Union
 
     from nqp.core.game import Game
 
-__all__ = ["Debugger", "Timer"]
+__all__ = ["Debugger", "Timer", "FrameProfiler"]
 
 
 class Debugger:
@@ -35,35 +47,40 @@ class Debugger:
             self._create_folders()
 
             # objects
-            self.profiler: Optional[cProfile.Profile] = None
+            self.profiler: Optional[Union[StackSampler, CallTracer]] = None
+            self.frame_profiler: FrameProfiler = FrameProfiler()
+            self.memory_tracker: MemoryTracker = MemoryTracker()
             self._dev_console: Optional[DevConsole] = None
 
             # counters
-            self.current_fps: int = 0
-            self.recent_average_fps: int = 0
-            self.average_fps: int = 0
+            self.current_fps: float = 0
+            self.recent_average_fps: float = 0
+            self.average_fps: float = 0
             self._frames: int = 0
+            self._total_frame_time: float = 0
             self.profile_duration_remaining: int = INFINITE
 
             # flags
-            self.is_profiling: bool = True
+            self.profiling_mode: ProfilingMode = ProfilingMode.OFF
             self.is_logging: bool = True
             self.debug_mode: bool = False
             self._show_debug_info: bool = True
-
-            # values
-            self._num_frames_considered_recent: int = 600
+            self._show_frame_profile: bool = False
 
             # ui
             self._fonts: List[Font] = []
+            self._frame_profile_fonts: List[Font] = []
 
             self.initialise_logging()
 
     def update(self, delta_time: float):
+        frame_pacer = self._game.window.frame_pacer
 
         self._frames += 1
-        self.current_fps = 1  # state.get_internal_clock().get_fps()  # FIXME - fix to new clock
-        self.average_fps += (self.current_fps - self.average_fps) / self._frames
+        self._total_frame_time += delta_time
+        self.current_fps = frame_pacer.current_fps
+        self.recent_average_fps = frame_pacer.average_fps  # over the frames the pacer has recorded
+        self.average_fps = self._frames / self._total_frame_time if self._total_frame_time > 0 else 0
 
         # count down profiler duration, if it isnt running temporarily
         if self.profile_duration_remaining != INFINITE:
@@ -71,14 +88,7 @@ class Debugger:
 
         # check if profiler needs to turn off
         if self.profile_duration_remaining == 0:
-            self.disable_profiling(True)
-
-        # get recent fps
-        if self._frames >= self._num_frames_considered_recent:
-            frames_to_count = self._num_frames_considered_recent
-        else:
-            frames_to_count = self._frames
-        self.recent_average_fps += (self.current_fps - self.average_fps) / frames_to_count
+            self.disable_profiling()
 
         if self._dev_console is not None:
             self._dev_console.update(delta_time)
@@ -86,16 +96,26 @@ class Debugger:
         if self._show_debug_info:
             self._refresh_debug_info()
 
+        if self._show_frame_profile:
+            self._refresh_frame_profile_legend()
+
     def draw(self, surface: pygame.Surface):
         """
         Draw debug info
         """
         if self._show_debug_info:
+            add_dirty_rect = self._game.window.add_dirty_rect
             for font in self._fonts:
                 font.draw(surface)
+                add_dirty_rect(pygame.Rect(font.pos.x, font.pos.y, font.width, font.height))
+
+        if self._show_frame_profile:
+            self._draw_frame_profile(surface)
+            self._game.window.mark_full_refresh()
 
         if self._dev_console is not None:
             self._dev_console.draw(surface)
+            self._game.window.mark_full_refresh()
 
     @staticmethod
     def _create_folders():
@@ -168,65 +188,60 @@ class Debugger:
         logging.shutdown()
         self.is_logging = False
 
-    def _create_profiler(self):
-        """
-        Create the profiler.
-        """
-        self.profiler = cProfile.Profile()
+    @property
+    def is_profiling(self) -> bool:
+        return self.profiling_mode != ProfilingMode.OFF
 
-    def enable_profiling(self, duration: int = INFINITE):
+    def enable_profiling(self, mode: ProfilingMode = ProfilingMode.SAMPLING, duration: int = INFINITE):
         """
-        Enable profiling. Create profiler if one doesnt exist
+        Start profiling the main thread for duration frames. Any current profiling is stopped first.
+
+        Sampling is cheap enough to leave running. Deterministic records every call, so is best limited to a few
+        frames.
         """
-        # if we dont have a profiler create one
-        if not self.profiler:
-            self._create_profiler()
+        self.disable_profiling()
+        if mode == ProfilingMode.OFF:
+            return
+
+        if mode == ProfilingMode.SAMPLING:
+            self.profiler = StackSampler()
+        else:
+            self.profiler = CallTracer()
 
-        # enable, set flag and set duration
-        assert isinstance(self.profiler, cProfile.Profile)
-        self.profiler.enable()
-        self.is_profiling = True
+        self.profiling_mode = mode
         self.profile_duration_remaining = duration
+        self.profiler.start()
 
-    def disable_profiling(self, dump_data: bool = False):
+        logging.info(f"Started {mode.name.lower()} profiling.")
+
+    def disable_profiling(self) -> str:
         """
-        Turn off current profiling. Dump data to file if required.
+        Stop profiling and export what was captured as a Chrome trace. Returns the path written to, if any.
         """
-        if self.profiler:
-            if dump_data:
-                self._dump_profiling_data()
+        if self.profiler is None:
+            return ""
 
-            self.profiler.disable()
-            self.is_profiling = False
+        self.profiler.stop()
+        path = self._dump_profiling_data()
 
-    def kill_profiler(self):
-        """
-        Kill profiling resource
-        """
-        if self.profiler:
-            self.disable_profiling(True)
-            self.profiler = None
+        self.profiler = None
+        self.profiling_mode = ProfilingMode.OFF
+        self.profile_duration_remaining = INFINITE
 
-    def _dump_profiling_data(self):
+        return path
+
+    def _dump_profiling_data(self) -> str:
         """
-        Dump data to a readable file
+        Dump the captured events to a Chrome trace file.
         """
-        if not self.is_profiling:
-            return
-
-        self.profiler.create_stats()
+        date_and_time = datetime.datetime.utcnow()
+        file_name = f"{date_and_time.strftime('%Y%m%d@%H%M%S')}_{VERSION}_{self.profiling_mode.name.lower()}.json"
+        path = str(PROFILING_PATH / file_name)
+        write_chrome_trace(path, self.profiler.events)
 
-        # dump the profiler stats
-        s = io.StringIO()
-        ps = pstats.Stats(self.profiler, stream=s).sort_stats("tottime")
-        profiling_path = str(PROFILING_PATH) + "/"
-        ps.dump_stats(profiling_path + "profile.dump")
+        logging.info(f"Profiling trace written to {path}.")
 
-        # convert profiling to human readable format
-        date_and_time = datetime.datetime.utcnow()
-        out_stream = open(profiling_path + date_and_time.strftime("%Y%m%d@%H%M") + "_" + VERSION + ".profile", "w")
-        ps = pstats.Stats(profiling_path + "profile.dump", stream=out_stream)
-        ps.strip_dirs().sort_stats("tottime").print_stats()
+        return path
 
     @staticmethod
     def performance_test(
@@ -275,6 +290,49 @@ class Debugger:
         """
         print(f"Avg FPS: {format(self.average_fps, '.2f')}, R_Avg: {format(self.recent_average_fps, '.2f')}")
 
+        frame_pacer = self._game.window.frame_pacer
+        percentiles = [
+            f"p{percentile}: {format(frame_pacer.get_frame_time_percentile(percentile) * 1000, '.2f')}"
+            for percentile in (50, 95, 99)
+        ]
+        print(f"Recent frame ms {', '.join(percentiles)}")
+
+    def toggle_frame_profiler(self) -> str:
+        """
+        Toggle recording sections of each frame and showing them as a timeline. Returns a confirmation message.
+        """
+        self._show_frame_profile = not self._show_frame_profile
+        self.frame_profiler.set_enabled(self._show_frame_profile)
+
+        state = "on" if self._show_frame_profile else "off"
+        return f"Frame profiler turned {state}."
+
+    @staticmethod
+    def dump_counters() -> str:
+        """
+        Log the counters of the last frame. Returns them as a message.
+        """
+        message = f"Counters: {counters.format_last_frame()}"
+        logging.info(message)
+
+        return message
+
+    @staticmethod
+    def toggle_counter_stream() -> str:
+        """
+        Toggle writing each frame's counters to a file. Returns a confirmation message.
+        """
+        if counters.is_streaming():
+            counters.stop_stream()
+            return "Stopped streaming counters."
+
+        date_and_time = datetime.datetime.utcnow()
+        file_name = f"{date_and_time.strftime('%Y%m%d@%H%M%S')}_{VERSION}_counters.jsonl"
+        path = str(PROFILING_PATH / file_name)
+        counters.start_stream(path)
+
+        return f"Streaming counters to {path}."
+
     def toggle_debug_info(self):
         """
         Toggle whether the debug info is shown
@@ -290,17 +348,26 @@ class Debugger:
         start_y = 1
 
         # FPS
-        # TODO - add back in when working
         current_x = start_x
         current_y = start_y
-        # current_fps = f"FPS: C={format(self.current_fps, '.2f')}, "
-        # recent_fps = f"R_Avg={format(self.recent_average_fps, '.2f')}, "
-        # avg_fps = f"Avg={format(self.average_fps, '.2f')}"
-        # text = f"{current_fps}; {recent_fps};{avg_fps}"
-        # self._fonts.append(self._game.visuals.create_font(FontType.DEFAULT, text, (current_x, current_y)))
+        current_fps = f"FPS: C={format(self.current_fps, '.2f')}, "
+        recent_fps = f"R_Avg={format(self.recent_average_fps, '.2f')}, "
+        avg_fps = f"Avg={format(self.average_fps, '.2f')}"
+        text = f"{current_fps}{recent_fps}{avg_fps}."
+        self._fonts.append(self._game.visual.create_font(FontType.DEFAULT, text, pygame.Vector2(current_x, current_y)))
+
+        # frame times
+        current_y += 10
+        frame_pacer = self._game.window.frame_pacer
+        percentiles = [
+            f"p{percentile}={format(frame_pacer.get_frame_time_percentile(percentile) * 1000, '.1f')}"
+            for percentile in (50, 95, 99)
+        ]
+        text = f"Frame ms: {', '.join(percentiles)}; target FPS = {frame_pacer.target_fps}."
+        self._fonts.append(self._game.visual.create_font(FontType.DEFAULT, text, pygame.Vector2(current_x, current_y)))
 
         # current state
-        current_y += 0
+        current_y += 10
         world = self._game.world
         world_state = world.model.state
         sub_state_name = "not found"
@@ -322,6 +389,79 @@ class Debugger:
         text = f"Game speed = {game_speed}."
         self._fonts.append(self._game.visual.create_font(FontType.DEFAULT, text, pygame.Vector2(current_x, current_y)))
 
+        # surfaces created by presenting
+        current_y += 10
+        text = f"Window surfaces created = {self._game.window.surfaces_created}."
+        self._fonts.append(self._game.visual.create_font(FontType.DEFAULT, text, pygame.Vector2(current_x, current_y)))
+
+    def _refresh_frame_profile_legend(self):
+        self._frame_profile_fonts = []
+        profiler = self.frame_profiler
+        x = _FRAME_PROFILE_BAR_WIDTH * profiler.frames.maxlen + 12
+        y = self._game.window.height - 10
+
+        for section in ["frame"] + profiler.get_top_level_sections():
+            text = f"{section} {format(profiler.get_average(section) * 1000, '.2f')}ms"
+            font = self._game.visual.create_font(FontType.DEFAULT, text, pygame.Vector2(x, y))
+            self._frame_profile_fonts.append(font)
+            y -= 10
+
+    def _draw_frame_profile(self, surface: pygame.Surface):
+        """
+        Draw each recorded frame as a bar, stacked by top level section, with a line at the target frame time.
+        """
+        profiler = self.frame_profiler
+        sections = profiler.get_top_level_sections()
+        bottom = surface.get_height() - 1
+        px_per_ms = _FRAME_PROFILE_PX_PER_MS
+
+        for i, frame in enumerate(profiler.frames):
+            x = 1 + i * _FRAME_PROFILE_BAR_WIDTH
+            y = bottom
+            untracked = frame["frame"]
+            for section_num, section in enumerate(sections):
+                duration = frame.get(section, 0)
+                untracked -= duration
+                height = duration * 1000 * px_per_ms
+                colour = _FRAME_PROFILE_COLOURS[section_num % len(_FRAME_PROFILE_COLOURS)]
+                pygame.draw.rect(surface, colour, (x, y - height, _FRAME_PROFILE_BAR_WIDTH, height))
+                y -= height
+
+            # time outside any section
+            height = max(untracked, 0) * 1000 * px_per_ms
+            rect = (x, y - height, _FRAME_PROFILE_BAR_WIDTH, height)
+            pygame.draw.rect(surface, _FRAME_PROFILE_UNTRACKED_COLOUR, rect)
+
+        # target frame time
+        target_fps = self._game.window.frame_pacer.target_fps
+        if target_fps > 0:
+            y = bottom - 1000 / target_fps * px_per_ms
+            width = _FRAME_PROFILE_BAR_WIDTH * profiler.frames.maxlen
+            pygame.draw.line(surface, Colour.WHITE.value, (1, y), (width, y))
+
+        # legend, bottom up, matching the order of the bars
+        for font_num, font in enumerate(self._frame_profile_fonts):
+            if font_num == 0:
+                colour = _FRAME_PROFILE_UNTRACKED_COLOUR
+            else:
+                colour = _FRAME_PROFILE_COLOURS[(font_num - 1) % len(_FRAME_PROFILE_COLOURS)]
+            pygame.draw.rect(surface, colour, (font.pos.x - 8, font.pos.y, 6, 6))
+            font.draw(surface)
+
+
+# frame profile timeline
+_FRAME_PROFILE_BAR_WIDTH = 2
+_FRAME_PROFILE_PX_PER_MS = 3
+_FRAME_PROFILE_UNTRACKED_COLOUR = (90, 90, 90)
+_FRAME_PROFILE_COLOURS = [
+    (230, 90, 80),
+    (90, 170, 230),
+    (120, 200, 100),
+    (230, 190, 70),
+    (170, 110, 210),
+    (80, 200, 190),
+]
+
 
 class Timer:
     """
@@ -339,7 +479,104 @@ class Timer:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.duration = time.perf_counter() - self.start
+        self._report()
+
+    def _report(self):
         if self.label:
             logging.debug("%s in %.2f seconds.", self.label, self.duration)
         else:
             logging.debug("took %.2f seconds.", self.duration)
+
+
+class FrameProfiler:
+    """
+    Time named sections of each frame, e.g. each ECS system or draw stage, and keep the most recent frames.
+
+    Sections nest, so a section's name is its path, e.g. "update/simulation/world/movement". A section entered more
+    than once a frame has its times summed. When disabled, sections cost only the check of is_enabled.
+    """
+
+    def __init__(self, num_frames_recorded: int = 120):
+        self.is_enabled: bool = False
+        self._is_enabled_next_frame: bool = False  # so a frame is never partly recorded
+
+        self.frames: Deque[Dict[str, float]] = deque(maxlen=num_frames_recorded)  # section path: seconds
+        self._current_frame: Dict[str, float] = {}
+        self._section_stack: List[str] = []
+        self._frame_start: float = 0
+
+    def set_enabled(self, is_enabled: bool):
+        """
+        Enable or disable recording, from the start of the next frame.
+        """
+        self._is_enabled_next_frame = is_enabled
+
+    def begin_frame(self):
+        self.is_enabled = self._is_enabled_next_frame
+        self._current_frame = {}
+        self._section_stack = []
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if not self.is_enabled:
+            return
+
+        self._current_frame["frame"] = time.perf_counter() - self._frame_start
+        self.frames.append(self._current_frame)
+
+    def section(self, name: str) -> Union[_SectionTimer, contextlib.nullcontext]:
+        """
+        Time the code within the returned context manager as a section of the current frame.
+        """
+        if not self.is_enabled:
+            return _NULL_SECTION
+        return _SectionTimer(self, name)
+
+    def get_average(self, path: str) -> float:
+        """
+        Get the mean seconds spent in a section across the recorded frames, counting frames without it as 0.
+        """
+        if not self.frames:
+            return 0
+        return sum(frame.get(path, 0) for frame in self.frames) / len(self.frames)
+
+    def get_top_level_sections(self) -> List[str]:
+        """
+        Get the paths of the outermost sections seen in the recorded frames, in the order first seen.
+        """
+        sections = {}
+        for frame in self.frames:
+            for path in frame:
+                if "/" not in path and path != "frame":
+                    sections[path] = None
+        return list(sections)
+
+    def _enter_section(self, name: str) -> str:
+        self._section_stack.append(name)
+        return "/".join(self._section_stack)
+
+    def _exit_section(self, path: str, duration: float):
+        self._section_stack.pop()
+        self._current_frame[path] = self._current_frame.get(path, 0) + duration
+
+
+class _SectionTimer(Timer):
+    """
+    Timer that records to the FrameProfiler, rather than logging.
+    """
+
+    def __init__(self, profiler: FrameProfiler, name: str):
+        super().__init__(name)
+        self._profiler: FrameProfiler = profiler
+        self._path: str = ""
+
+    def __enter__(self):
+        self._path = self._profiler._enter_section(self.label)
+        return super().__enter__()
+
+    def _report(self):
+        self._profiler._exit_section(self._path, self.duration)
+
+
+# shared, as it holds no state
+_NULL_SECTION = contextlib.nullcontext()
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import snecs
+from snecs.world import default_world
+
+from nqp.core import counters
+from nqp.world_elements import entity_flags
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Type
+
+    from snecs import Component
+    from snecs.typedefs import EntityID
+
+__all__ = [
+    "CachedQuery",
+    "new_entity",
+    "add_component",
+    "remove_component",
+    "delete_entity_immediately",
+    "schedule_for_deletion",
+    "process_pending_deletions",
+    "reset_world",
+]
+
+
+# Every CachedQuery, by each component type it matches on. Changes to an Entity's components only update the
+# queries for the types that changed.
+_queries_by_type: Dict[Type[Component], List[CachedQuery]] = {}
+_all_queries: List[CachedQuery] = []
+_pending_deletions: Set[EntityID] = set()
+
+
+class CachedQuery:
+    """
+    A query for Entities with all the component types, holding its results rather than finding them on each
+    iteration. The results are updated as components are added and removed, so changes to Entities must be made
+    through this module, rather than snecs directly.
+
+    Rows are (EntityID, (component, ...)), as a compiled snecs query's, and are held as a tuple that is only rebuilt
+    after a change, so iterating several times a frame costs no more than iterating a tuple.
+    """
+
+    __slots__ = ("component_types", "_rows", "_view")
+
+    def __init__(self, component_types: Iterable[Type[Component]]):
+        self.component_types: Tuple[Type[Component], ...] = tuple(component_types)
+        self._rows: Dict[EntityID, Tuple[Component, ...]] = {}
+        self._view: Optional[Tuple[Tuple[EntityID, Tuple[Component, ...]], ...]] = None
+
+        _all_queries.append(self)
+        for component_type in self.component_types:
+            _queries_by_type.setdefault(component_type, []).append(self)
+
+        self._refill()
+
+    def __iter__(self) -> Iterator[Tuple[EntityID, Tuple[Any, ...]]]:
+        return iter(self.rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, entity: EntityID) -> bool:
+        return entity in self._rows
+
+    @property
+    def rows(self) -> Tuple[Tuple[EntityID, Tuple[Any, ...]], ...]:
+        """
+        All matching rows, as (EntityID, (component, ...)).
+        """
+        view = self._view
+        if view is None:
+            view = self._view = tuple(self._rows.items())
+            counters.increment("query_rebuilds")
+
+        return view
+
+    def get(self, entity: EntityID) -> Optional[Tuple[Any, ...]]:
+        """
+        Get the Entity's components, in the order of component_types, or None if it doesn't match.
+        """
+        return self._rows.get(entity)
+
+    def _update_entity(self, entity: EntityID, components: Mapping[Type[Component], Component]):
+        """
+        Add, or remove, the Entity depending on whether it now has all the component types.
+        """
+        try:
+            row = tuple([components[component_type] for component_type in self.component_types])
+        except KeyError:
+            if self._rows.pop(entity, None) is not None:
+                self._view = None
+            return
+
+        if self._rows.get(entity) != row:
+            self._rows[entity] = row
+            self._view = None
+
+    def _remove_entity(self, entity: EntityID):
+        if self._rows.pop(entity, None) is not None:
+            self._view = None
+
+    def _refill(self):
+        """
+        Rebuild the results from the current World.
+        """
+        self._rows = {entity: tuple(components) for entity, components in snecs.Query(self.component_types)}
+        self._view = None
+
+
+def new_entity(components: Iterable[Component] = ()) -> EntityID:
+    """
+    Create an Entity with the components, as per snecs.new_entity.
+    """
+    components = tuple(components)
+    entity = snecs.new_entity(components)
+    _update_queries(entity, [type(component) for component in components])
+
+    counters.increment("entities_created")
+    counters.increment("components_added", len(components))
+
+    return entity
+
+
+def add_component(entity: EntityID, component: Component):
+    """
+    Add a component to the Entity, as per snecs.add_component.
+    """
+    snecs.add_component(entity, component)
+    _update_queries(entity, (type(component),))
+    counters.increment("components_added")
+
+
+def remove_component(entity: EntityID, component_type: Type[Component]):
+    """
+    Remove a component from the Entity, as per snecs.remove_component.
+    """
+    snecs.remove_component(entity, component_type)
+    _update_queries(entity, (component_type,))
+    counters.increment("components_removed")
+
+
+def delete_entity_immediately(entity: EntityID):
+    """
+    Delete the Entity and its components, as per snecs.delete_entity_immediately.
+    """
+    _remove_from_queries(entity)
+    _pending_deletions.discard(entity)
+    snecs.delete_entity_immediately(entity)
+
+
+def schedule_for_deletion(entity: EntityID):
+    """
+    Delete the Entity on the next call of process_pending_deletions. Until then it is still found by queries.
+    """
+    snecs.schedule_for_deletion(entity)
+    _pending_deletions.add(entity)
+
+
+def process_pending_deletions():
+    """
+    Delete all Entities scheduled for deletion.
+    """
+    for entity in _pending_deletions:
+        _remove_from_queries(entity)
+    _pending_deletions.clear()
+
+    snecs.process_pending_deletions()
+
+
+def reset_world():
+    """
+    Replace the ecs World with an empty one, emptying every query and removing every flag, as EntityIDs restart.
+    """
+    snecs.ecs.move_world(snecs.World())
+    _pending_deletions.clear()
+    entity_flags.clear_all()
+
+    for query in _all_queries:
+        query._refill()
+
+
+def _update_queries(entity: EntityID, changed_types: Iterable[Type[Component]]):
+    """
+    Update the queries matching on any of the changed component types.
+    """
+    queries = set()
+    for component_type in changed_types:
+        queries.update(_queries_by_type.get(component_type, ()))
+
+    if queries:
+        components = snecs.all_components(entity)
+        for query in queries:
+            query._update_entity(entity, components)
+
+
+def _remove_from_queries(entity: EntityID):
+    if not snecs.exists(entity, default_world):
+        return
+
+    queries = set()
+    for component_type in snecs.all_components(entity):
+        queries.update(_queries_by_type.get(component_type, ()))
+
+    for query in queries:
+        query._remove_entity(entity)
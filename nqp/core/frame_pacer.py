@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable, Deque
+
+__all__ = ["FramePacer"]
+
+
+class FramePacer:
+    """
+    Measure frame times and hold each frame to the target FPS.
+
+    Limiting sleeps until just before the frame is due, then spins for the remainder, as sleep alone can overshoot by
+    a millisecond or more. A target_fps of 0 leaves the frame rate uncapped.
+
+    The clock and sleep default to time.perf_counter and time.sleep, and can be replaced, e.g. to test without
+    waiting.
+    """
+
+    def __init__(
+        self,
+        target_fps: int = 60,
+        num_frames_recorded: int = 600,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.target_fps: int = target_fps
+        self.spin_duration: float = 0.002  # seconds before the deadline to stop sleeping and start spinning
+
+        self._clock: Callable[[], float] = clock
+        self._sleep: Callable[[float], None] = sleep
+        self._frame_times: Deque[float] = deque(maxlen=num_frames_recorded)  # seconds, most recent last
+        self._last_tick: float = self._clock()
+        self._next_frame_due: float = self._last_tick
+
+    def tick(self) -> float:
+        """
+        Mark the start of a frame. Returns the seconds since the previous frame started.
+        """
+        now = self._clock()
+        frame_time = now - self._last_tick
+        self._last_tick = now
+        self._frame_times.append(frame_time)
+
+        return frame_time
+
+    def limit(self):
+        """
+        Wait until the next frame is due, as per the target FPS.
+        """
+        if self.target_fps <= 0:
+            return
+
+        self._next_frame_due += 1 / self.target_fps
+
+        # if we have fallen behind start again from now, rather than rushing frames to catch up
+        now = self._clock()
+        if self._next_frame_due < now:
+            self._next_frame_due = now
+            return
+
+        sleep_duration = self._next_frame_due - now - self.spin_duration
+        if sleep_duration > 0:
+            self._sleep(sleep_duration)
+
+        while self._clock() < self._next_frame_due:
+            pass
+
+    @property
+    def current_fps(self) -> float:
+        if not self._frame_times or self._frame_times[-1] <= 0:
+            return 0
+        return 1 / self._frame_times[-1]
+
+    @property
+    def average_fps(self) -> float:
+        """
+        FPS across the recorded frames.
+        """
+        total = sum(self._frame_times)
+        if total <= 0:
+            return 0
+        return len(self._frame_times) / total
+
+    def get_frame_time_percentile(self, percentile: float) -> float:
+        """
+        Get the frame time, in seconds, that the given percent of recorded frames took no longer than. Uses the
+        nearest rank.
+        """
+        if not self._frame_times:
+            return 0
+
+        frame_times = sorted(self._frame_times)
+        rank = math.ceil(percentile / 100 * len(frame_times))
+        return frame_times[min(max(rank, 1), len(frame_times)) - 1]
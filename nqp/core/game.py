@@ -6,9 +6,9 @@ from typing import TYPE_CHECKING
 import pygame
 
 from nqp.base_classes.scene import Scene
-from nqp.core import queries
+from nqp.core import counters, queries
 from nqp.core.audio import Audio
-from nqp.core.constants import GameState, SceneType
+from nqp.core.constants import GameState, MAX_SIMULATION_STEPS, SceneType, SIMULATION_TIME_STEP
 from nqp.core.data import Data
 from nqp.core.debug import Debugger, Timer
 from nqp.core.input import Input
@@ -42,10 +42,17 @@ class Game:
             self.state: GameState = GameState.LOADING
             self.master_clock = 0
 
+            # simulation time yet to be stepped and how far through a step it is, for drawing between steps
+            self._unsimulated_time: float = 0
+            self.interpolation: float = 0
+
             # managers
             self.debug: Debugger = Debugger(self)
             self.window: Window = Window(self)
             self.data: Data = Data(self)
+            self.window.is_dirty_rect_mode = self.data.options["dirty_rect_rendering"]
+            self.window.is_scale2x_enabled = self.data.options["scale2x"]
+            self.window.frame_pacer.target_fps = self.data.options["target_fps"]
             self.assets: Assets = Assets(self)  # TODO - deprecate
             self.memory: Memory = Memory(self)
             self.input: Input = Input(self)
@@ -75,6 +82,8 @@ class Game:
         delta_time = self.window.delta_time
         self.master_clock += delta_time  # TODO - is this needed?
 
+        profiler = self.debug.frame_profiler
+
         # update input
         if self.state == GameState.PLAYING:
             self.input.update(delta_time)
@@ -83,36 +92,91 @@ class Game:
                 self.debug.toggle_debug_info()
 
         # update internal assets
-        self.audio.update(delta_time)
-        self.visual.update(delta_time)
+        with profiler.section("audio"):
+            self.audio.update(delta_time)
+        with profiler.section("visual"):
+            self.visual.update(delta_time)
 
         # update effects
-        for _, (effect_system,) in queries.effects_processors:
-            effect_system.effect.update(delta_time, self)
+        with profiler.section("effects"):
+            for _, (effect_system,) in queries.effects_processors:
+                effect_system.effect.update(delta_time, self)
+
+        # step the simulation before the ui so the ui shows the updates
+        with profiler.section("simulation"):
+            self._fixed_update(delta_time)
 
         # update image ui
         for scene in self.scene_stack:
             if scene.ui.is_active:
-                scene.update(delta_time)
+                with profiler.section(scene.type.name.lower()):
+                    scene.update(delta_time)
 
         # update debug last
-        self.debug.update(delta_time)
+        with profiler.section("debug"):
+            self.debug.update(delta_time)
+
+    def _fixed_update(self, delta_time: float):
+        """
+        Step the scenes' simulations in fixed steps for however much time has passed, so a long frame is more steps
+        rather than a longer one. Game speed changes the time simulated, not the size of the step.
+        """
+        self._unsimulated_time += delta_time * self.memory.game_speed
+
+        steps = 0
+        while self._unsimulated_time >= SIMULATION_TIME_STEP:
+            if steps == MAX_SIMULATION_STEPS:
+                # cant keep up, so drop the time rather than falling further behind
+                self._unsimulated_time = 0
+                break
+
+            for scene in self.scene_stack:
+                if scene.ui.is_active:
+                    with self.debug.frame_profiler.section(scene.type.name.lower()):
+                        scene.fixed_update(SIMULATION_TIME_STEP)
+
+            self._unsimulated_time -= SIMULATION_TIME_STEP
+            steps += 1
+
+        self.interpolation = self._unsimulated_time / SIMULATION_TIME_STEP
 
     def _draw(self):
+        profiler = self.debug.frame_profiler
+
         # always refresh first
-        self.window.refresh()
+        with profiler.section("present"):
+            self.window.refresh()
 
         surface = self.window.display
         for scene in self.scene_stack:
             if scene.ui.is_active:
-                scene.ui.draw(surface)
+                with profiler.section(scene.type.name.lower()):
+                    scene.ui.draw(surface)
+
+                # scenes that dont report their changes need the whole display presenting
+                if not scene.ui.reports_dirty_rects:
+                    self.window.mark_full_refresh()
 
-        self.debug.draw(surface)  # always last so it is on top
+        with profiler.section("debug"):
+            self.debug.draw(surface)  # always last so it is on top
 
     def run(self):
-        self._update()
-        self._process_input()
-        self._draw()
+        profiler = self.debug.frame_profiler
+        profiler.begin_frame()
+
+        with profiler.section("update"):
+            self._update()
+        with profiler.section("input"):
+            self._process_input()
+        with profiler.section("draw"):
+            self._draw()
+
+        # hold to the target fps, rather than using the whole cpu
+        with profiler.section("wait"):
+            self.window.frame_pacer.limit()
+
+        profiler.end_frame()
+        counters.end_frame()
 
     def _process_input(self):
         delta_time = self.window.delta_time
@@ -208,3 +272,6 @@ class Game:
             self.remove_scene(scene.type)
 
         self.add_scene(scene_type)
+
+        # only taken if memory is being traced
+        self.debug.memory_tracker.take_snapshot(f"scene_{scene_type.name.lower()}")
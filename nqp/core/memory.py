@@ -33,6 +33,17 @@ class Memory:
 
             self._game_speed: float = GameSpeed.NORMAL.value
 
+    def reset(self):
+        """
+        Reset the world, ready for a new run. Every Entity of the last run is deleted, so this must be called before
+        any of the new run's Entities are created.
+        """
+        if self._game.world is None:
+            logging.error(f"Tried to reset the world but WorldScene doesnt exist.")
+            raise Exception
+
+        self._game.world.model.reset()
+
     def initialise_run(self, troupe: Troupe, gold: int, rations: int, morale: int, charisma: int, leadership: int):
         """
         Initialise the run's values.
@@ -41,8 +52,6 @@ class Memory:
             logging.error(f"Tried to initialise a run but WorldScene doesnt exist.")
             raise Exception
 
-        self._game.world.model.reset()
-
         self._game.world.model.add_troupe(troupe)
         self._game.world.model.amend_gold(gold)
         self._game.world.model.amend_rations(rations)
@@ -72,13 +81,13 @@ class Memory:
 
     def add_flag(self, flag: str | Enum):
         if isinstance(flag, Enum):
-            flag = flag.value.lower()
+            flag = flag.name.lower()
 
         self._flags.append(flag)
 
     def remove_flag(self, flag: str | Enum):
         if isinstance(flag, Enum):
-            flag = flag.value.lower()
+            flag = flag.name.lower()
 
         self._flags.remove(flag)
 
@@ -87,7 +96,7 @@ class Memory:
         Check if a flag exists
         """
         if isinstance(flag, Enum):
-            flag = flag.value.lower()
+            flag = flag.name.lower()
 
         if flag in self._flags:
             return True
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import logging
+import os
+import tracemalloc
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from nqp.core.constants import ROOT_PATH
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional, Tuple
+
+__all__ = ["MemoryTracker"]
+
+
+class MemoryTracker:
+    """
+    Take named snapshots of allocated memory with tracemalloc and compare them, to find where memory grows over a
+    long session. Tracing slows allocation, so is off until started.
+    """
+
+    def __init__(self, max_snapshots: int = 10):
+        self.max_snapshots: int = max_snapshots
+        self.snapshots: OrderedDict[str, tracemalloc.Snapshot] = OrderedDict()  # name: snapshot, oldest first
+
+    @property
+    def is_tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, num_frames: int = 1):
+        """
+        Start tracing allocations, storing num_frames of the stack for each.
+        """
+        if self.is_tracing:
+            return
+
+        tracemalloc.start(num_frames)
+
+        logging.info(f"Started tracing memory allocations.")
+
+    def stop(self):
+        """
+        Stop tracing allocations and forget all snapshots.
+        """
+        if not self.is_tracing:
+            return
+
+        tracemalloc.stop()
+        self.snapshots.clear()
+
+        logging.info(f"Stopped tracing memory allocations.")
+
+    def take_snapshot(self, name: str) -> str:
+        """
+        Take a snapshot, if tracing, and store it under name. Returns the name used, which has a number added if
+        the name was already used, or an empty string if not tracing.
+        """
+        if not self.is_tracing:
+            return ""
+
+        unique_name = name
+        count = 1
+        while unique_name in self.snapshots:
+            count += 1
+            unique_name = f"{name}_{count}"
+
+        # ignore the memory used by tracemalloc and importing
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+                tracemalloc.Filter(False, "<unknown>"),
+            )
+        )
+        self.snapshots[unique_name] = snapshot
+
+        # drop the oldest so memory isnt held forever
+        while len(self.snapshots) > self.max_snapshots:
+            self.snapshots.popitem(last=False)
+
+        logging.debug(f"Took memory snapshot {unique_name}.")
+
+        return unique_name
+
+    def compare(
+        self, older_name: Optional[str] = None, newer_name: Optional[str] = None, limit: int = 10
+    ) -> List[Tuple[str, int, int]]:
+        """
+        Compare two snapshots, grouped by module, and return the top limit modules by change in size, as
+        (module, size difference in bytes, difference in number of blocks). Defaults to the last two snapshots.
+        """
+        names = list(self.snapshots.keys())
+        if older_name is None or newer_name is None:
+            if len(names) < 2:
+                return []
+            older_name, newer_name = names[-2], names[-1]
+
+        if older_name not in self.snapshots or newer_name not in self.snapshots:
+            logging.warning(f"MemoryTracker: snapshot {older_name} or {newer_name} not found.")
+            return []
+
+        differences = self.snapshots[newer_name].compare_to(self.snapshots[older_name], "filename")
+
+        modules: Dict[str, List[int]] = {}
+        for difference in differences:
+            module = _get_module_name(difference.traceback[0].filename)
+            totals = modules.setdefault(module, [0, 0])
+            totals[0] += difference.size_diff
+            totals[1] += difference.count_diff
+
+        ordered = sorted(modules.items(), key=lambda item: abs(item[1][0]), reverse=True)
+        return [(module, size_diff, count_diff) for module, (size_diff, count_diff) in ordered[:limit]]
+
+    def format_comparison(
+        self, older_name: Optional[str] = None, newer_name: Optional[str] = None, limit: int = 10
+    ) -> List[str]:
+        """
+        Compare two snapshots, as per compare, and return a readable line per module.
+        """
+        return [
+            f"{module}: {size_diff / 1024:+.1f} KiB ({count_diff:+} blocks)"
+            for module, size_diff, count_diff in self.compare(older_name, newer_name, limit)
+        ]
+
+
+def _get_module_name(filename: str) -> str:
+    """
+    Get the dotted module name of a file in the project, or the file name relative to the library folder for
+    anything else.
+    """
+    path = os.path.abspath(filename)
+    root = str(ROOT_PATH)
+    if path.startswith(root + os.sep):
+        relative = os.path.relpath(path, root)
+    else:
+        # e.g. .../site-packages/pygame/sprite.py -> pygame/sprite.py
+        parts = path.split(os.sep)
+        for library_folder in ("site-packages", "dist-packages"):
+            if library_folder in parts:
+                parts = parts[parts.index(library_folder) + 1 :]
+                break
+        else:
+            # standard library, where a package is named by its folder
+            parts = parts[-2:] if parts[-1].startswith("__init__") else parts[-1:]
+        relative = os.path.join(*parts)
+
+    module = os.path.splitext(relative)[0].replace(os.sep, ".")
+    if module.endswith(".__init__"):
+        module = module[: -len(".__init__")]
+    return module
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types import CodeType, FrameType
+    from typing import Any, Deque, Dict, Iterable, List, Optional
+
+__all__ = ["StackSampler", "CallTracer", "write_chrome_trace"]
+
+
+class StackSampler:
+    """
+    Statistical profiler. A background thread looks at the profiled thread's stack every interval and records
+    where it is, so the profiled thread pays only for the GIL being taken now and then.
+
+    Samples are turned into Chrome trace events as they are taken: a function starts when it first appears on the
+    stack and ends when it is no longer there. Anything shorter than the interval may be missed.
+
+    Only the most recent max_events are kept, so sampling can be left running without using ever more memory.
+    """
+
+    def __init__(self, interval: float = 0.002, max_events: int = 100_000):
+        self.interval: float = interval
+        self.max_events: int = max_events
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+
+        self._thread: Optional[threading.Thread] = None
+        self._profiled_thread_id: int = 0
+        self._is_running: bool = False
+        self._stack: List[str] = []  # outermost first
+        self._start_time: int = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._is_running
+
+    def start(self):
+        """
+        Start sampling the calling thread.
+        """
+        if self._is_running:
+            return
+
+        self.events = deque(maxlen=self.max_events)
+        self._stack = []
+        self._profiled_thread_id = threading.get_ident()
+        self._start_time = time.perf_counter_ns()
+        self._is_running = True
+
+        self._thread = threading.Thread(target=self._run, name="StackSampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop sampling and end any functions still on the stack.
+        """
+        if not self._is_running:
+            return
+
+        self._is_running = False
+        self._thread.join()
+        self._thread = None
+
+        self._update_stack([], self._get_timestamp())
+
+    def _run(self):
+        while self._is_running:
+            frame = sys._current_frames().get(self._profiled_thread_id)
+            if frame is not None:
+                self._update_stack(_get_stack_names(frame), self._get_timestamp())
+
+            time.sleep(self.interval)
+
+    def _update_stack(self, stack: List[str], timestamp: float):
+        # find where the stacks diverge
+        common = 0
+        for previous_name, name in zip(self._stack, stack):
+            if previous_name != name:
+                break
+            common += 1
+
+        # end what has returned, innermost first, then begin what has been called
+        for name in reversed(self._stack[common:]):
+            self.events.append(_create_event(name, "E", timestamp))
+        for name in stack[common:]:
+            self.events.append(_create_event(name, "B", timestamp))
+
+        self._stack = stack
+
+    def _get_timestamp(self) -> float:
+        return (time.perf_counter_ns() - self._start_time) / 1000
+
+
+class CallTracer:
+    """
+    Deterministic profiler. Every call and return in the profiled thread is recorded as a Chrome trace event.
+    Exact, but slows the thread a great deal, so should only be run for a short while.
+    """
+
+    def __init__(self):
+        self.events: List[Dict[str, Any]] = []
+
+        self._depth: int = 0
+        self._start_time: int = 0
+        self._is_running: bool = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._is_running
+
+    def start(self):
+        """
+        Start tracing the calling thread.
+        """
+        if self._is_running:
+            return
+
+        self.events = []
+        self._depth = 0
+        self._start_time = time.perf_counter_ns()
+        self._is_running = True
+        sys.setprofile(self._trace)
+
+    def stop(self):
+        """
+        Stop tracing and end any calls still open.
+        """
+        if not self._is_running:
+            return
+
+        sys.setprofile(None)
+        self._is_running = False
+
+        # the call to stop is still open, along with its callers
+        timestamp = (time.perf_counter_ns() - self._start_time) / 1000
+        for _ in range(self._depth):
+            self.events.append(_create_event("", "E", timestamp))
+        self._depth = 0
+
+    def _trace(self, frame: FrameType, event: str, arg: Any):
+        timestamp = (time.perf_counter_ns() - self._start_time) / 1000
+
+        if event == "call":
+            self.events.append(_create_event(_get_code_name(frame.f_code), "B", timestamp))
+            self._depth += 1
+
+        elif event == "c_call":
+            self.events.append(_create_event(getattr(arg, "__qualname__", str(arg)), "B", timestamp))
+            self._depth += 1
+
+        elif event in ("return", "c_return", "c_exception"):
+            # ignore returning from calls that began before tracing started
+            if self._depth > 0:
+                self.events.append(_create_event("", "E", timestamp))
+                self._depth -= 1
+
+
+def write_chrome_trace(path: str, events: Iterable[Dict[str, Any]]):
+    """
+    Write the events as Chrome trace-event JSON, which can be opened in chrome://tracing, Perfetto or speedscope.
+
+    Ends without a begin, such as where the oldest events of a StackSampler were dropped, are left out.
+    """
+    with open(path, "w") as file:
+        json.dump({"traceEvents": _drop_unmatched_ends(events), "displayTimeUnit": "ms"}, file)
+
+
+def _drop_unmatched_ends(events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    matched = []
+    depth = 0
+    for event in events:
+        if event["ph"] == "B":
+            depth += 1
+        elif depth > 0:
+            depth -= 1
+        else:
+            continue
+        matched.append(event)
+
+    return matched
+
+
+def _create_event(name: str, phase: str, timestamp: float) -> Dict[str, Any]:
+    # single process and thread, so pid and tid are constant
+    return {"name": name, "ph": phase, "ts": timestamp, "pid": 0, "tid": 0}
+
+
+def _get_stack_names(frame: FrameType) -> List[str]:
+    """
+    Get the names of the functions on the stack, outermost first.
+    """
+    names = []
+    while frame is not None:
+        names.append(_get_code_name(frame.f_code))
+        frame = frame.f_back
+    names.reverse()
+    return names
+
+
+def _get_code_name(code: CodeType) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
@@ -2,21 +2,19 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from snecs import Query
-
+from nqp.core.ecs import CachedQuery
 from nqp.effects.effect_components import StatsEffect, StatsEffectSentinel
 from nqp.effects.processors import EffectProcessorComponent
 from nqp.world_elements.entity_components import (
     Aesthetic,
     AI,
+    Allegiance,
     Attributes,
-    DamageReceived,
     HealReceived,
-    IsDead,
-    IsReadyToAttack,
     Position,
     Stats,
 )
+from nqp.world_elements.entity_flags import FlagFilteredQuery, is_dead, is_death_processed, is_ready_to_attack
 
 if TYPE_CHECKING:
     from typing import Iterator, Tuple
@@ -28,13 +26,12 @@ __all__ = [
     "ai_not_dead",
     "ai_position",
     "attack_position_stats_ai_aesthetic_not_dead",
-    "damage_aesthetic_stats",
-    "dead",
-    "dead_aesthetic_position",
+    "dead_unprocessed_aesthetic_position",
     "effect_stats_query",
     "effects_processors",
     "heal_stats_attributes_not_dead",
     "position",
+    "position_allegiance_not_dead",
     "position_stats_not_dead",
     "position_stats_ai_aesthetic_not_dead",
     "sentinels_query",
@@ -42,50 +39,50 @@ __all__ = [
 ]
 
 heal_stats_attributes_not_dead: Iterator[Tuple[EntityID, Tuple[HealReceived, Stats, Attributes]]]
-heal_stats_attributes_not_dead = Query([HealReceived, Stats, Attributes]).filter(~IsDead).compile()
-
-dead: Iterator[Tuple[EntityID, Tuple[IsDead]]]
-dead = Query([IsDead]).compile()
+heal_stats_attributes_not_dead = FlagFilteredQuery(CachedQuery([HealReceived, Stats, Attributes]), exclude=(is_dead,))
 
 position: Iterator[Tuple[EntityID, Tuple[Position]]]
-position = Query([Position]).compile()
+position = CachedQuery([Position])
 
 ai_position: Iterator[Tuple[EntityID, Tuple[AI, Position]]]
-ai_position = Query([AI, position]).compile()
+ai_position = CachedQuery([AI, Position])
 
 ai_not_dead: Iterator[Tuple[EntityID, Tuple[AI]]]
-ai_not_dead = Query([AI]).filter(~IsDead).compile()
+ai_not_dead = FlagFilteredQuery(CachedQuery([AI]), exclude=(is_dead,))
 
 aesthetic_position: Iterator[Tuple[EntityID, Tuple[Aesthetic, Position]]]
-aesthetic_position = Query([Aesthetic, Position]).compile()
+aesthetic_position = CachedQuery([Aesthetic, Position])
 
-damage_aesthetic_stats: Iterator[Tuple[EntityID, Tuple[DamageReceived, Aesthetic, Stats]]]
-damage_aesthetic_stats = Query([DamageReceived, Aesthetic, Stats]).compile()
+dead_unprocessed_aesthetic_position: Iterator[Tuple[EntityID, Tuple[Aesthetic, Position]]]
+dead_unprocessed_aesthetic_position = FlagFilteredQuery(
+    aesthetic_position, include=(is_dead,), exclude=(is_death_processed,)
+)
 
-dead_aesthetic_position: Iterator[Tuple[EntityID, Tuple[IsDead, Aesthetic, Position]]]
-dead_aesthetic_position = Query([IsDead, Aesthetic, Position]).compile()
+position_allegiance_not_dead: Iterator[Tuple[EntityID, Tuple[Position, Allegiance]]]
+position_allegiance_not_dead = FlagFilteredQuery(CachedQuery([Position, Allegiance]), exclude=(is_dead,))
 
 position_stats_not_dead: Iterator[Tuple[EntityID, Tuple[Position, Stats]]]
-position_stats_not_dead = Query([Position, Stats]).filter(~IsDead).compile()
+position_stats_not_dead = FlagFilteredQuery(CachedQuery([Position, Stats]), exclude=(is_dead,))
+
+# shared by the filtered queries below, so the rows are only cached once
+_position_stats_ai_aesthetic = CachedQuery([Position, Stats, AI, Aesthetic])
 
 position_stats_ai_aesthetic_not_dead: Iterator[Tuple[EntityID, Tuple[Position, Stats, AI, Aesthetic]]]
-position_stats_ai_aesthetic_not_dead = Query([Position, Stats, AI, Aesthetic]).filter(~IsDead).compile()
+position_stats_ai_aesthetic_not_dead = FlagFilteredQuery(_position_stats_ai_aesthetic, exclude=(is_dead,))
 
-attack_position_stats_ai_aesthetic_not_dead: Iterator[
-    Tuple[EntityID, Tuple[IsReadyToAttack, Position, Stats, AI, Aesthetic]]
-]
-attack_position_stats_ai_aesthetic_not_dead = (
-    Query([IsReadyToAttack, Position, Stats, AI, Aesthetic]).filter(~IsDead).compile()
+attack_position_stats_ai_aesthetic_not_dead: Iterator[Tuple[EntityID, Tuple[Position, Stats, AI, Aesthetic]]]
+attack_position_stats_ai_aesthetic_not_dead = FlagFilteredQuery(
+    _position_stats_ai_aesthetic, include=(is_ready_to_attack,), exclude=(is_dead,)
 )
 
 effects_processors: Iterator[Tuple[EntityID, Tuple[EffectProcessorComponent]]]
-effects_processors = Query([EffectProcessorComponent]).compile()
+effects_processors = CachedQuery([EffectProcessorComponent])
 
 stats_query: Iterator[Tuple[EntityID, Tuple[Stats]]]
-stats_query = Query([Stats]).compile()
+stats_query = CachedQuery([Stats])
 
 effect_stats_query: Iterator[Tuple[EntityID, Tuple[StatsEffect, Stats]]]
-effect_stats_query = Query([StatsEffect, Stats]).compile()
+effect_stats_query = CachedQuery([StatsEffect, Stats])
 
 sentinels_query: Iterator[Tuple[EntityID, Tuple[StatsEffectSentinel]]]
-sentinels_query = Query([StatsEffectSentinel]).compile()
+sentinels_query = CachedQuery([StatsEffectSentinel])
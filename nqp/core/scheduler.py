@@ -21,7 +21,7 @@ def remove(items, func):
     return removed
 
 
-# after py 3.10, add slots=True
+# after py 3.10, replace __slots__ with slots=True
 @dataclasses.dataclass()
 class ScheduledItem:
     """
@@ -29,6 +29,8 @@ class ScheduledItem:
 
     """
 
+    __slots__ = ("func", "last_ts", "next_ts", "interval", "repeat")
+
     func: Callable
     last_ts: float
     next_ts: float
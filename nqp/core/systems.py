@@ -7,42 +7,58 @@ from typing import TYPE_CHECKING
 
 import pygame
 import snecs
+from snecs.world import default_world
 
-from nqp.core import queries
+from nqp.core import counters, ecs, queries
 from nqp.core.constants import (
     CRIT_MOD,
     DamageType,
     EntityFacing,
     Flags,
     HealingSource,
+    ParticlePriority,
     PUSH_FORCE,
     TILE_SIZE,
     WEIGHT_SCALE,
 )
 from nqp.core.utility import angle_to, distance_to, get_direction
+from nqp.world_elements import entity_flags
 from nqp.world_elements.entity_components import (
+    Aesthetic,
     AI,
     Allegiance,
-    DamageReceived,
     HealReceived,
-    IsDead,
-    IsReadyToAttack,
     Position,
     RangedAttack,
     Stats,
 )
 
 if TYPE_CHECKING:
-    from typing import List
+    from typing import List, Tuple
+
+    from snecs.typedefs import EntityID
 
     from nqp.core.game import Game
 
-__all__ = ["draw_entities", "apply_damage", "process_death"]
+__all__ = [
+    "draw_entities",
+    "record_previous_positions",
+    "apply_damage",
+    "add_damage",
+    "get_pending_damage",
+    "clear_damage",
+    "process_death",
+]
+
+# hits waiting to be applied, as (entity, amount, damage type, penetration, is crit), in the order they happened.
+# module level so anything can add damage without needing the game, as with queries.
+_damage_events: List[Tuple[EntityID, float, DamageType, float, bool]] = []
 
 
-def draw_entities(surface: pygame.Surface, shift: pygame.Vector2 = (0, 0)):
+def draw_entities(surface: pygame.Surface, shift: pygame.Vector2 = (0, 0), interpolation: float = 1):
     """
-    Draw all entities
+    Draw all entities. Interpolation is the fraction of a simulation step to draw entities between their previous
+    and current positions.
     """
     draw_list = list()
 
@@ -51,10 +67,11 @@ def draw_entities(surface: pygame.Surface, shift: pygame.Vector2 = (0, 0)):
         flip = aesthetic.facing == EntityFacing.LEFT
         animation = aesthetic.animation
         frame = pygame.transform.flip(animation.surface, flip, False)
+        pos = position.interpolate(interpolation)
         # animation frame offset b/c entity's position is where their feet are
-        x = position.x + shift.x - animation.width // 2
-        y = position.y + shift.y - animation.height
-        draw_list.append((position.y, x, y, len(draw_list), frame))
+        x = pos.x + shift.x - animation.width // 2
+        y = pos.y + shift.y - animation.height
+        draw_list.append((pos.y, x, y, len(draw_list), frame))
 
     # sort so entities higher on the screen are drawn first (painters alg)
     draw_list.sort()
@@ -62,57 +79,119 @@ def draw_entities(surface: pygame.Surface, shift: pygame.Vector2 = (0, 0)):
         _, x, y, _, frame = operation
         surface.blit(frame, (x, y))
 
+    # each frame is flipped into a new surface
+    counters.increment("blits", len(draw_list))
+    counters.increment("surfaces_allocated", len(draw_list))
+
+
+def record_previous_positions():
+    """
+    Note each Entity's position before the simulation steps, so drawing can interpolate from it.
+    """
+    for entity, (position,) in queries.position:
+        position.previous_pos = position.pos
+
 
 def apply_damage(game: Game):
     """
-    Consume damage components and apply their value to the Entity, applying any mitigations.
+    Apply all damage added since last called, in the order it was added, applying any mitigations.
     Dodge may negate damage.
     """
-    for entity, (damage, aesthetic, stats) in queries.damage_aesthetic_stats:
-        damage_dealt = damage.amount
+    global _damage_events
 
-        # get defence
-        if damage.type == DamageType.MAGICAL:
-            defence = stats.magic_defence
-        elif damage.type == DamageType.MUNDANE:
-            defence = stats.mundane_defence
-        else:
-            logging.warning(f"Damage type ({damage.type.name}) not recognised. Defaulted to mundane defence.")
-            defence = stats.mundane_defence
+    # swap out, so any damage added while applying is kept for next time
+    damage_events = _damage_events
+    _damage_events = []
 
-        # crit ignores defence
-        if not damage.is_crit:
+    counters.increment("damage_events", len(damage_events))
 
-            # mitigate damage by defence, accounting for penetration
-            damage_dealt = max((defence.value - damage.penetration) - damage_dealt, 0)
+    for entity, amount, damage_type, penetration, is_crit in damage_events:
+        # no need to process further hits once dead, or if the entity has since gone
+        if not snecs.exists(entity, default_world) or entity_flags.is_dead.has(entity):
+            continue
+        if not snecs.has_components(entity, (Aesthetic, Stats)):
+            continue
 
-        # calc dodge
-        dodge_successful = False
-        if game.rng.roll() <= stats.dodge.value:
-            dodge_successful = True
+        aesthetic = snecs.entity_component(entity, Aesthetic)
+        stats = snecs.entity_component(entity, Stats)
+        _apply_hit(game, entity, aesthetic, stats, amount, damage_type, penetration, is_crit)
+
+
+def _apply_hit(
+    game: Game,
+    entity: EntityID,
+    aesthetic: Aesthetic,
+    stats: Stats,
+    amount: int,
+    damage_type: DamageType,
+    penetration: int,
+    is_crit: bool,
+):
+    """
+    Apply a single hit to the Entity, applying any mitigations. Dodge may negate damage.
+    """
+    damage_dealt = amount
+
+    # get defence
+    if damage_type == DamageType.MAGICAL:
+        defence = stats.magic_defence
+    elif damage_type == DamageType.MUNDANE:
+        defence = stats.mundane_defence
+    else:
+        logging.warning(f"Damage type ({damage_type}) not recognised. Defaulted to mundane defence.")
+        defence = stats.mundane_defence
+
+    # crit ignores defence
+    if not is_crit:
+
+        # mitigate damage by defence, accounting for penetration
+        damage_dealt = max(damage_dealt - max(defence.value - penetration, 0), 0)
+
+    # calc dodge
+    dodge_successful = False
+    if game.rng.roll() <= stats.dodge.value:
+        dodge_successful = True
+
+    # apply hit effects if no dodge
+    if not dodge_successful:
+        # reduce defence for being hit
+        defence.base_value = max(defence.value - 1, 0)
+
+        # apply damage
+        stats.health.base_value -= damage_dealt
+
+        # check if dead
+        if stats.health.value <= 0:
+            entity_flags.is_dead.add(entity)
+        else:
+            # apply flash
+            aesthetic.animation.flash((255, 255, 255))
 
-        # apply hit effects if no dodge
-        if dodge_successful:
-            # reduce defence for being hit
-            defence.base_value = max(defence.value - 1, 0)
+            # create blood spray on crit
+            if is_crit:
+                position = snecs.entity_component(entity, Position)
+                game.world.model.particles.create_blood_spray(position.pos, priority=ParticlePriority.LOW)
 
-            # apply damage
-            stats.health.base_value -= damage_dealt
 
-            # check if dead
-            if stats.health.value <= 0:
-                snecs.add_component(entity, IsDead())
-            else:
-                # apply flash
-                aesthetic.animation.flash((255, 255, 255))
+def add_damage(entity: EntityID, amount: int, damage_type: DamageType, penetration: int, is_crit: bool):
+    """
+    Add damage to be applied to the Entity, after any already added.
+    """
+    _damage_events.append((entity, amount, damage_type, penetration, is_crit))
 
-                # create blood spray on crit
-                if damage.is_crit:
-                    position = snecs.entity_component(entity, Position)
-                    game.world.model.particles.create_blood_spray()
 
-        # remove damage flag
-        snecs.remove_component(entity, DamageReceived)
+def get_pending_damage() -> List[Tuple[EntityID, float, DamageType, float, bool]]:
+    """
+    Get the damage added but not yet applied, as (entity, amount, damage type, penetration, is crit).
+    """
+    return _damage_events
+
+
+def clear_damage():
+    """
+    Discard any damage not yet applied, e.g. when the world is reset.
+    """
+    _damage_events.clear()
 
 
 def process_death(game: Game):
@@ -120,14 +199,18 @@ def process_death(game: Game):
     Update Entity's sprites and intentions.
     """
 
-    for entity, (dead, aesthetic, position) in queries.dead_aesthetic_position:
+    for entity, (aesthetic, position) in queries.dead_unprocessed_aesthetic_position:
+        # only process each death once
+        entity_flags.is_death_processed.add(entity)
 
         # update to dead sprite
         aesthetic.animation.set_current_frame_set_name("death")
-        aesthetic.animation.delete_on_finish = False
         aesthetic.animation.loop = False
+        aesthetic.animation.reset()  # play the death from its first frame
+        aesthetic.animation.play()
+        aesthetic.animation.delete_on_finish = False
 
-        game.world.model.particles.create_blood_spray(position.pos)
+        game.world.model.particles.create_blood_spray(position.pos, priority=ParticlePriority.HIGH)
 
 
 def process_movement(delta_time: float, game: Game):
@@ -250,7 +333,7 @@ def process_attack(game: Game):
     """
     Execute any outstanding attacks.
     """
-    for entity, (attack_flag, position, stats, ai, aesthetic) in queries.attack_position_stats_ai_aesthetic_not_dead:
+    for entity, (position, stats, ai, aesthetic) in queries.attack_position_stats_ai_aesthetic_not_dead:
         add_projectile = game.world.model.projectiles.add_projectile
 
         # check we have someone to target
@@ -273,7 +356,7 @@ def process_attack(game: Game):
             aesthetic.animation.set_current_frame_set_name("attack")
 
             # increase damage if in godmode
-            mod = 0
+            mod = 1
             if game.memory.check_for_flag(Flags.GODMODE):
                 if snecs.has_component(entity, Allegiance):
                     if snecs.entity_component(entity, Allegiance).team == "player":
@@ -290,7 +373,15 @@ def process_attack(game: Game):
                 ranged = snecs.entity_component(entity, RangedAttack)
                 ranged.ammo.base_value -= 1
                 projectile_data = {"img": ranged.projectile_sprite, "speed": ranged.projectile_speed}
-                add_projectile(entity, target_entity, projectile_data, stats.attack.value * mod)
+                add_projectile(
+                    entity,
+                    target_entity,
+                    projectile_data,
+                    stats.attack.value * mod,
+                    stats.damage_type,
+                    stats.penetration.value,
+                    is_crit,
+                )
 
                 # switch to melee when out of ammo
                 if ranged.ammo.value <= 0:
@@ -298,14 +389,11 @@ def process_attack(game: Game):
 
             else:
                 # add damage component
-                snecs.add_component(
-                    target_entity,
-                    DamageReceived(stats.attack.value * mod, stats.damage_type, stats.penetration.value, is_crit),
-                )
+                add_damage(target_entity, stats.attack.value * mod, stats.damage_type, stats.penetration.value, is_crit)
 
             # reset attack timer and remove flag
             ai.behaviour.attack_timer = 1 / stats.attack_speed.value
-            snecs.remove_component(entity, IsReadyToAttack)
+            entity_flags.is_ready_to_attack.remove(entity)
 
 
 def push_entities_away_from_one_another(delta_time: float, game: Game):
@@ -366,4 +454,4 @@ def process_healing():
                 stats.health.base_value += amount
 
         # remove component
-        snecs.remove_component(entity, HealReceived)
+        ecs.remove_component(entity, HealReceived)
@@ -6,8 +6,10 @@ from typing import TYPE_CHECKING
 
 import pygame
 
-from nqp.base_classes.animation import Animation
+from nqp.base_classes.animation import Animation, AnimationClock
 from nqp.base_classes.image import Image
+from nqp.core import counters
+from nqp.core.animation_registry import AnimationRegistry
 from nqp.core.constants import ASSET_PATH, DEFAULT_IMAGE_SIZE, FontEffects, FontType, IMG_FORMATS
 from nqp.core.debug import Timer
 from nqp.core.utility import clamp, clip
@@ -73,19 +75,20 @@ class Visual:
             # folder_name: {frame_name, [animation_frames]}
             self._fonts: Dict[FontType, Tuple[str, Tuple[int, int, int]]] = self._load_fonts()  # FontType: path, colour
 
-            self._active_animations: List[Animation] = []
+            self._active_animations: AnimationRegistry = AnimationRegistry()
 
-    def update(self, delta_time: float):
-        active_animations = self._active_animations
+            # animations work out their frame from these, rather than each being updated
+            self._simulation_clock: AnimationClock = AnimationClock()  # affected by game speed
+            self._absolute_clock: AnimationClock = AnimationClock()
 
-        # update animations
-        mod_delta = delta_time
-        for animation in active_animations:
-            animation.update(mod_delta, self._game.memory.game_speed)
+    def update(self, delta_time: float):
+        self._simulation_clock.advance(delta_time * self._game.memory.game_speed)
+        self._absolute_clock.advance(delta_time)
 
-            # remove the finished animations
-            if animation.is_finished and animation.delete_on_finish:
-                self._active_animations.remove(animation)
+        # drop animations no longer referenced elsewhere, and report how many remain, so that animations kept alive
+        # by a leaked reference show as a growing count
+        self._active_animations.update()
+        counters.set_value("animations_alive", len(self._active_animations))
 
     @staticmethod
     def _load_fonts():
@@ -192,13 +195,19 @@ class Visual:
         self, animation_name: str, frame_set_name: str, loop: bool = True, uses_simulation_time: bool = True
     ) -> Animation:
         """
-        Create a new animation and add it to the internal update list.
+        Create a new animation, driven by the simulation or absolute clock, and add it to the internal list. The
+        caller must keep a reference to the animation; it is only held weakly.
         """
         frames = self._animation_frames[animation_name]
+        clock = self._simulation_clock if uses_simulation_time else self._absolute_clock
         anim = Animation(
-            frames, loop=loop, starting_frame_set_name=frame_set_name, uses_simulation_time=uses_simulation_time
+            frames,
+            loop=loop,
+            starting_frame_set_name=frame_set_name,
+            uses_simulation_time=uses_simulation_time,
+            clock=clock,
         )
-        self._active_animations.append(anim)
+        self._active_animations.add(anim)
         return anim
 
     def get_image(
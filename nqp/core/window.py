@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import logging
-import time
 from typing import TYPE_CHECKING
 
 import pygame
 
+from nqp.core import counters
 from nqp.core.constants import ASSET_PATH
 from nqp.core.debug import Timer
+from nqp.core.frame_pacer import FramePacer
 
 if TYPE_CHECKING:
     from typing import List, Tuple, Union
@@ -34,22 +35,136 @@ class Window:
             self.display = pygame.Surface(self.base_resolution)
 
             self.delta_time = 0.1
-            self.frame_start = time.time()
+            self.frame_pacer: FramePacer = FramePacer()
+
+            # dirty rect tracking. Rects are in base resolution.
+            self.is_dirty_rect_mode: bool = False
+            self._dirty_rects: List[pygame.Rect] = []
+            self._previous_dirty_rects: List[pygame.Rect] = []
+            self._is_full_refresh_needed: bool = True
+
+            # upscaling
+            self.is_scale2x_enabled: bool = False  # use scale2x smoothing when the window is exactly double the display
+            # an estimate of what presenting allocates: the Surface objects created whilst presenting the last
+            # frame. The pixels are scaled straight into the window, so the full present creates none.
+            self.surfaces_created: int = 0
+            self._surfaces_created_this_frame: int = 0
 
     def refresh(self):
         """
-        Clear screen.
+        Present the display to the window and clear it ready for the next frame.
+
+        In dirty rect mode only the regions reported since the last refresh, and those from the refresh before,
+        are scaled and presented, unless a full refresh was requested.
         """
-        self.window.blit(pygame.transform.scale(self.display, self.window.get_size()), (0, 0))
-        pygame.display.update()
+        if self.is_dirty_rect_mode and not self._is_full_refresh_needed:
+            self._present_dirty_rects()
+        else:
+            self._present_all()
+
+        self._previous_dirty_rects = self._dirty_rects
+        self._dirty_rects = []
+        self._is_full_refresh_needed = False
+
+        self.surfaces_created = self._surfaces_created_this_frame
+        counters.increment("surfaces_allocated", self._surfaces_created_this_frame)
+        self._surfaces_created_this_frame = 0
+
         self.display.fill((0, 0, 0))
 
+    def add_dirty_rect(self, rect: pygame.Rect):
+        """
+        Report a region of the display, in base resolution, that has changed and needs presenting.
+        """
+        self._dirty_rects.append(rect)
+
+    def mark_full_refresh(self):
+        """
+        Present the whole display on the next refresh, regardless of the dirty rects reported.
+        """
+        self._is_full_refresh_needed = True
+
+    def _present_all(self):
+        """
+        Scale and present the whole display.
+        """
+        self._scale_into(self.display, self.window)
+        pygame.display.update()
+
+    def _scale_into(self, source: pygame.Surface, target: pygame.Surface):
+        """
+        Scale the source to fill the target, writing straight into the target rather than allocating a new surface.
+        """
+        source_width, source_height = source.get_size()
+        target_width, target_height = target.get_size()
+
+        if source_width == target_width and source_height == target_height:
+            target.blit(source, (0, 0))
+        elif self._is_scale2x(source_width, source_height, target_width, target_height):
+            pygame.transform.scale2x(source, target)
+        else:
+            pygame.transform.scale(source, (target_width, target_height), target)
+
+    def _is_scale2x(self, source_width: int, source_height: int, target_width: int, target_height: int) -> bool:
+        return self.is_scale2x_enabled and source_width * 2 == target_width and source_height * 2 == target_height
+
+    def _present_dirty_rects(self):
+        """
+        Scale and present only the dirty regions of the display. Falls back to presenting the whole display if the
+        window isnt an integer multiple of the display or if the regions cover most of it anyway.
+        """
+        display = self.display
+        window = self.window
+        display_rect = display.get_rect()
+        window_width, window_height = window.get_size()
+
+        # scale2x samples neighbouring pixels so regions scaled in isolation would show seams
+        scale = window_width // display_rect.width
+        if (
+            scale * display_rect.width != window_width
+            or scale * display_rect.height != window_height
+            or self._is_scale2x(display_rect.width, display_rect.height, window_width, window_height)
+        ):
+            self._present_all()
+            return
+
+        # clip to the display and drop anything empty
+        rects = []
+        area = 0
+        for rect in self._previous_dirty_rects + self._dirty_rects:
+            rect = rect.clip(display_rect)
+            if rect.width and rect.height:
+                rects.append(rect)
+                area += rect.width * rect.height
+
+        if not rects:
+            return
+
+        # cheaper to present everything at once than many overlapping regions
+        if area > (display_rect.width * display_rect.height) // 2:
+            self._present_all()
+            return
+
+        update_rects = []
+        for rect in rects:
+            scaled_rect = pygame.Rect(rect.x * scale, rect.y * scale, rect.width * scale, rect.height * scale)
+
+            # the subsurfaces share pixels with their parents but are still new surface objects
+            source = display.subsurface(rect)
+            self._surfaces_created_this_frame += 1
+            target = window.subsurface(scaled_rect)
+            self._surfaces_created_this_frame += 1
+
+            pygame.transform.scale(source, scaled_rect.size, target)
+            update_rects.append(scaled_rect)
+
+        pygame.display.update(update_rects)
+
     def update(self):
         """
         Update internal timer
         """
-        self.delta_time = time.time() - self.frame_start
-        self.frame_start = time.time()
+        self.delta_time = self.frame_pacer.tick()
 
     @property
     def height(self) -> int:
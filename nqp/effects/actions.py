@@ -8,9 +8,11 @@ import snecs
 from snecs.typedefs import EntityID
 
 from nqp.base_classes.stat import Stat
+from nqp.core import ecs
 from nqp.core.constants import INFINITE
 from nqp.core.utility import percent_to_float
 from nqp.world_elements.entity_components import Stats
+from nqp.world_elements.stats import BlockStat
 
 if TYPE_CHECKING:
     from typing import List
@@ -25,7 +27,7 @@ def get_modifier(string: str):
 
 
 def new_stats_effect(
-    stat: Stat,
+    stat: Stat | BlockStat,
     stats: Stats,
     modifier: str,
     ttl: float = INFINITE,
@@ -44,7 +46,7 @@ def new_stats_effect(
     from nqp.effects.effect_components import StatsEffect
 
     attrib_modifier = StatsEffect(stat, ttl)
-    eid = snecs.new_entity((attrib_modifier, stats))
+    eid = ecs.new_entity((attrib_modifier, stats))
     stat.apply_modifier(modifier, attrib_modifier)
     return eid
 
@@ -12,6 +12,7 @@ import snecs
 from snecs import RegisteredComponent
 
 from nqp.base_classes.effect_processor import EffectProcessor
+from nqp.core import ecs
 
 if TYPE_CHECKING:
     from nqp.core.game import Game
@@ -29,4 +30,4 @@ class OnFireStatusProcessor(EffectProcessor):
         for eid, (burn,) in list(OnFireStatusProcessor.burning):
             burn.ttl -= time_delta
             if burn.ttl <= 0:
-                snecs.remove_component(eid, OnFireStatusEffect)
+                ecs.remove_component(eid, OnFireStatusEffect)
@@ -3,13 +3,14 @@ from __future__ import annotations
 import uuid
 from typing import Any, Dict, Optional
 
-import snecs
 from snecs import RegisteredComponent
 
 from nqp.base_classes.stat import Stat
+from nqp.core import ecs
 from nqp.core.constants import INFINITE
 from nqp.effects.actions import get_modifier
 from nqp.world_elements.entity_components import Allegiance, Stats
+from nqp.world_elements.stats import BlockStat
 
 __all__ = ["AddItemEffect", "StatsEffect", "StatsEffectSentinel"]
 
@@ -106,12 +107,12 @@ class StatsEffectSentinel(RegisteredComponent):
         elif self.unit_type != allegiance.unit.type:
             return False
         stat = getattr(stats, self.attribute, None)
-        if stat is None or not isinstance(stat, Stat):
+        if stat is None or not isinstance(stat, (Stat, BlockStat)):
             raise ValueError(f"Unsupported attribute {self.attribute}")
         if not stat.has_modifier(self.key):
             stat.apply_modifier(self.modifier, self.key)
             attrib_modifier = StatsEffect(stat)
-            snecs.new_entity((attrib_modifier, stats))
+            ecs.new_entity((attrib_modifier, stats))
 
 
 class StatsEffect(RegisteredComponent):
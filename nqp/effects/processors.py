@@ -6,6 +6,7 @@ import snecs
 from snecs import RegisteredComponent
 
 from nqp.base_classes.effect_processor import EffectProcessor
+from nqp.core import ecs
 from nqp.core.constants import INFINITE
 from nqp.effects.effect_components import AddItemEffect
 
@@ -48,4 +49,4 @@ class StatsEffectProcessor(EffectProcessor):
                 effect.ttl -= time_delta
                 if effect.ttl <= 0:
                     effect.stat.remove_modifier(effect)
-                    snecs.schedule_for_deletion(eid)
+                    ecs.schedule_for_deletion(eid)
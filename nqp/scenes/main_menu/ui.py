@@ -25,6 +25,7 @@ class MainMenuUI(UI):
     def __init__(self, game: Game, parent_scene: MainMenuScene):
         super().__init__(game, True)
         self._parent_scene: MainMenuScene = parent_scene
+        self.reports_dirty_rects = True
 
     def update(self, delta_time: float):
         super().update(delta_time)
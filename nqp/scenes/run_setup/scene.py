@@ -41,6 +41,9 @@ class RunSetupScene(Scene):
         # set the seed
         self._game.rng.set_seed(self.selected_seed)
 
+        # clear the last run, before creating any of this run's entities
+        self._game.memory.reset()
+
         # create commander
         commander = self._game.data.commanders[self.selected_commander]
         self._game.memory.commander = Commander(self._game, commander["type"])
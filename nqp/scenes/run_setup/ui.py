@@ -25,6 +25,7 @@ class RunSetupUI(UI):
     def __init__(self, game: Game, parent_scene: RunSetupScene):
         super().__init__(game, True)
         self._parent_scene: RunSetupScene = parent_scene
+        self.reports_dirty_rects = True
         self._selected_index: int = 0
 
         self.set_instruction_text("Choose who will lead the attempt on the throne.")
@@ -46,22 +46,22 @@ class WorldScene(Scene):
             self.post_combat: PostCombatController = PostCombatController(game, self)
 
     def update(self, delta_time: float):
-        # get the modified delta time
-        mod_delta_time = self._game.memory.game_speed * delta_time
+        # the simulation has already been stepped, so the ui shows the updates
+        self.ui.update(delta_time)
+
+    def fixed_update(self, delta_time: float):
+        # game speed is already applied, by changing how many steps are taken
 
         # update the data
-        self.model.update(mod_delta_time)
+        self.model.update(delta_time)
 
         # update the controllers
-        self.combat.update(mod_delta_time)
-        self.training.update(mod_delta_time)
-        self.choose_room.update(mod_delta_time)
-        self.inn.update(mod_delta_time)
-        self.event.update(mod_delta_time)
-        self.post_combat.update(mod_delta_time)
-
-        # last, to show updates
-        self.ui.update(delta_time)
+        self.combat.update(delta_time)
+        self.training.update(delta_time)
+        self.choose_room.update(delta_time)
+        self.inn.update(delta_time)
+        self.event.update(delta_time)
+        self.post_combat.update(delta_time)
 
     def reset(self):
         game = self._game
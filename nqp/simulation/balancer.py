@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import logging
+import multiprocessing
+import os
+import signal
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+from nqp.core.data import Data
+
+if TYPE_CHECKING:
+    from typing import Dict, Iterable, List, Optional, Tuple
+
+    from nqp.simulation.headless import CombatResult
+
+__all__ = [
+    "BalanceJob",
+    "BalanceSummary",
+    "get_starting_troupes",
+    "create_jobs",
+    "run_jobs",
+    "summarise",
+    "write_summaries",
+]
+
+
+# data loaded once per worker process, rather than once per combat
+_worker_data: Optional[Data] = None
+
+
+@dataclass
+class BalanceJob:
+    """
+    A single seeded combat between a player troupe and the enemies of a combat.
+    """
+
+    combat_type: str
+    troupe_name: str
+    player_units: List[str]
+    enemy_units: List[str]
+    seed: int
+
+
+@dataclass
+class BalanceSummary:
+    """
+    Aggregated results of every run of a combat against a player troupe.
+    """
+
+    combat_type: str
+    troupe_name: str
+    runs: int
+    wins: int
+    losses: int
+    timeouts: int
+    win_rate: float
+    mean_duration: float
+    mean_player_casualties: float
+    mean_enemy_casualties: float
+
+
+def get_starting_troupes(data: Data) -> Dict[str, List[str]]:
+    """
+    Get each commander's starting units, by commander name.
+    """
+    return {name: commander["starting_units"] for name, commander in data.commanders.items()}
+
+
+def create_jobs(
+    data: Data, troupes: Dict[str, List[str]], runs: int, first_seed: int = 0, combat_types: List[str] = None
+) -> List[BalanceJob]:
+    """
+    Create runs jobs for every combat against every troupe. Each run of a pairing gets its own seed.
+
+    Combats and troupes that use unit types without data are skipped.
+    """
+    if combat_types is None:
+        combat_types = list(data.combats)
+
+    known_troupes = {}
+    for troupe_name, player_units in troupes.items():
+        unknown_units = [unit_type for unit_type in player_units if unit_type not in data.units]
+        if unknown_units:
+            logging.warning(f"Balancer: skipped troupe {troupe_name} as units {unknown_units} have no data.")
+            continue
+
+        known_troupes[troupe_name] = player_units
+
+    jobs = []
+    for combat_type in combat_types:
+        enemy_units = data.combats[combat_type]["units"]
+        unknown_units = [unit_type for unit_type in enemy_units if unit_type not in data.units]
+        if unknown_units:
+            logging.warning(f"Balancer: skipped {combat_type} as units {unknown_units} have no data.")
+            continue
+
+        for troupe_name, player_units in known_troupes.items():
+            for run in range(runs):
+                jobs.append(BalanceJob(combat_type, troupe_name, player_units, enemy_units, first_seed + run))
+
+    return jobs
+
+
+def run_jobs(
+    jobs: List[BalanceJob], processes: Optional[int] = None, max_duration: float = 300
+) -> List[Tuple[BalanceJob, CombatResult]]:
+    """
+    Simulate every job across a pool of processes. Each process has its own ECS world, so combats dont interact.
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    # spawn rather than fork, so each worker initialises pygame for itself
+    context = multiprocessing.get_context("spawn")
+    args = [(job, max_duration) for job in jobs]
+    with context.Pool(processes, initializer=_init_worker) as pool:
+        results = pool.starmap(_run_job, args, chunksize=max(1, len(jobs) // (processes * 4)))
+
+        # let the workers exit by themselves. If a job raises, starmap reraises it here and the pool is terminated
+        # instead, which needs the SIGTERM handling reset in _init_worker.
+        pool.close()
+        pool.join()
+
+    return list(zip(jobs, results))
+
+
+def summarise(results: Iterable[Tuple[BalanceJob, CombatResult]]) -> List[BalanceSummary]:
+    """
+    Aggregate results by combat and troupe.
+    """
+    grouped: Dict[Tuple[str, str], List[CombatResult]] = {}
+    for job, result in results:
+        grouped.setdefault((job.combat_type, job.troupe_name), []).append(result)
+
+    summaries = []
+    for (combat_type, troupe_name), combat_results in grouped.items():
+        runs = len(combat_results)
+        wins = sum(1 for result in combat_results if result.winner == "player")
+        losses = sum(1 for result in combat_results if result.winner == "enemy")
+        summaries.append(
+            BalanceSummary(
+                combat_type=combat_type,
+                troupe_name=troupe_name,
+                runs=runs,
+                wins=wins,
+                losses=losses,
+                timeouts=runs - wins - losses,
+                win_rate=wins / runs,
+                mean_duration=sum(result.duration for result in combat_results) / runs,
+                mean_player_casualties=_mean_casualties(combat_results, "player"),
+                mean_enemy_casualties=_mean_casualties(combat_results, "enemy"),
+            )
+        )
+
+    return summaries
+
+
+def write_summaries(summaries: List[BalanceSummary], path: str):
+    """
+    Write the summaries to path, as JSON if it ends in .json, otherwise as CSV.
+    """
+    rows = [asdict(summary) for summary in summaries]
+
+    with open(path, "w", newline="") as file:
+        if path.endswith(".json"):
+            json.dump(rows, file, indent=2)
+        else:
+            writer = csv.DictWriter(file, fieldnames=list(BalanceSummary.__dataclass_fields__))
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+def _mean_casualties(results: List[CombatResult], team: str) -> float:
+    casualties = [result.starting_entities.get(team, 0) - result.surviving_entities.get(team, 0) for result in results]
+    return sum(casualties) / len(casualties)
+
+
+def _init_worker():
+    global _worker_data
+
+    # import inside the worker so pygame is set up with the dummy drivers in each process
+    from nqp.simulation.headless import HeadlessGame
+
+    _worker_data = HeadlessGame().data
+
+    # pygame catches SIGTERM, so without the default the worker ignores the pool terminating it and the pool hangs
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    # only warnings, otherwise every combat logs its setup
+    logging.getLogger().setLevel(logging.WARNING)
+
+
+def _run_job(job: BalanceJob, max_duration: float) -> CombatResult:
+    from nqp.simulation.headless import simulate_combat
+
+    return simulate_combat(
+        job.player_units, job.enemy_units, seed=job.seed, max_duration=max_duration, data=_worker_data
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="nqp.simulation.balancer")
+    parser.add_argument("--runs", type=int, default=10, help="runs of each combat against each troupe")
+    parser.add_argument("--processes", type=int, default=None, help="defaults to the number of cores")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first run of each pairing")
+    parser.add_argument("--combats", default="", help="comma separated combat types; all if omitted")
+    parser.add_argument(
+        "--troupe",
+        action="append",
+        default=[],
+        help="name=unit,unit,... May be repeated. Defaults to each commander's starting units.",
+    )
+    parser.add_argument("--max-duration", type=float, default=300, help="simulated seconds before a timeout")
+    parser.add_argument("--output", default="balance.csv", help="path to write to; .json for JSON, else CSV")
+    args = parser.parse_args()
+
+    from nqp.simulation.headless import HeadlessGame
+
+    data = HeadlessGame().data
+
+    if args.troupe:
+        troupes = {}
+        for troupe in args.troupe:
+            name, units = troupe.split("=")
+            troupes[name] = units.split(",")
+    else:
+        troupes = get_starting_troupes(data)
+
+    combat_types = args.combats.split(",") if args.combats else None
+    jobs = create_jobs(data, troupes, args.runs, args.seed, combat_types)
+    print(f"Balancer: running {len(jobs)} combats.")
+
+    summaries = summarise(run_jobs(jobs, args.processes, args.max_duration))
+    write_summaries(summaries, args.output)
+    print(f"Balancer: results written to {args.output}.")
+
+
+if __name__ == "__main__":
+    main()
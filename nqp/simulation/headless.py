@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import logging
+import os
+import random
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+# must be set before pygame initialises anything
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from nqp.base_classes.animation import Animation, AnimationClock
+from nqp.base_classes.image import Image
+from nqp.core import counters, ecs
+from nqp.core.constants import (
+    BARRIER_SIZE,
+    CombatState,
+    DEFAULT_IMAGE_SIZE,
+    SIMULATION_TIME_STEP,
+    TILE_SIZE,
+    WorldState,
+)
+from nqp.core.data import Data
+from nqp.core.debug import FrameProfiler, Timer
+from nqp.core.memory import Memory
+from nqp.core.memory_tracker import MemoryTracker
+from nqp.core.rng import RNG
+from nqp.world.controllers.combat_controller import CombatController
+from nqp.world.model import WorldModel
+from nqp.world_elements import entity_flags
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional
+
+    from nqp.command.troupe import Troupe
+
+__all__ = ["HeadlessGame", "CombatResult", "simulate_combat", "prepare_combat"]
+
+
+# frame sets the world systems switch between
+_FRAME_SET_NAMES = ["idle", "move", "attack", "death", "icon"]
+
+
+class HeadlessDebugger:
+    """
+    Stand in for the Debugger, holding only what the simulation reads.
+    """
+
+    def __init__(self):
+        self.debug_mode: bool = False
+        self.frame_profiler: FrameProfiler = FrameProfiler()
+        self.memory_tracker: MemoryTracker = MemoryTracker()
+
+
+class HeadlessVisual:
+    """
+    Stand in for Visual that loads no assets. Animations and images are blank placeholders so that entities can be
+    created and their frame sets changed as normal.
+    """
+
+    def __init__(self):
+        self._frame_sets: Dict[str, List[Image]] = {
+            name: [Image(image=pygame.Surface((DEFAULT_IMAGE_SIZE, DEFAULT_IMAGE_SIZE)))] for name in _FRAME_SET_NAMES
+        }
+        self._clock: AnimationClock = AnimationClock()
+
+    def update(self, delta_time: float):
+        self._clock.advance(delta_time)
+
+    def create_animation(
+        self, animation_name: str, frame_set_name: str, loop: bool = True, uses_simulation_time: bool = True
+    ) -> Animation:
+        return Animation(
+            self._frame_sets,
+            loop=loop,
+            starting_frame_set_name=frame_set_name,
+            uses_simulation_time=uses_simulation_time,
+            clock=self._clock,
+        )
+
+    def get_image(
+        self, image_name: str, size: pygame.Vector2 = (DEFAULT_IMAGE_SIZE, DEFAULT_IMAGE_SIZE), copy: bool = False
+    ) -> Image:
+        return Image(image=pygame.Surface(size))
+
+
+class HeadlessWorld:
+    """
+    Stand in for the WorldScene, holding the model and combat controller but no UI.
+    """
+
+    def __init__(self, game: HeadlessGame):
+        self.ui = None
+        self.model: WorldModel = WorldModel(game, self)
+        self.combat: CombatController = CombatController(game, self)
+
+
+class HeadlessGame:
+    """
+    The parts of Game needed to run the world simulation, without a Window, Visual, Audio or Input.
+    """
+
+    def __init__(self, seed: Optional[int] = None, data: Optional[Data] = None):
+        with Timer("HeadlessGame: initialised"):
+            pygame.init()
+
+            self.master_clock: float = 0
+            self.debug: HeadlessDebugger = HeadlessDebugger()
+            self.data: Data = data if data is not None else Data(self)  # data doesnt change so can be shared
+            self.memory: Memory = Memory(self)
+            self.rng: RNG = RNG(self)
+            self.visual: HeadlessVisual = HeadlessVisual()
+
+            # behaviours use the shared random module so seed both
+            if seed is not None:
+                self.rng.set_seed(seed)
+                random.seed(seed)
+
+            # start from a fresh ecs world so previous simulations dont leak in
+            ecs.reset_world()
+            self.data.create_effect_processors()
+
+            self.world: HeadlessWorld = HeadlessWorld(self)
+
+    def update(self, delta_time: float):
+        """
+        Advance the simulation by a single step.
+        """
+        self.master_clock += delta_time
+        mod_delta_time = self.memory.game_speed * delta_time
+
+        self.visual.update(mod_delta_time)
+        self.world.model.update(mod_delta_time)
+        self.world.combat.update(mod_delta_time)
+
+        counters.end_frame()
+
+
+@dataclass
+class CombatResult:
+    """
+    Summary of a simulated combat.
+    """
+
+    winner: Optional[str]  # team name, or None if the combat timed out
+    duration: float  # simulated seconds
+    steps: int
+    seed: Optional[int]
+    starting_entities: Dict[str, int] = field(default_factory=dict)  # team: number at the start
+    surviving_entities: Dict[str, int] = field(default_factory=dict)  # team: number alive
+    surviving_units: Dict[str, List[str]] = field(default_factory=dict)  # team: [unit type, ...]
+
+    @property
+    def is_timed_out(self) -> bool:
+        return self.winner is None
+
+
+def simulate_combat(
+    player_units: List[str],
+    enemy_units: Optional[List[str]] = None,
+    seed: Optional[int] = None,
+    time_step: float = SIMULATION_TIME_STEP,
+    max_duration: float = 300,
+    level: int = 1,
+    data: Optional[Data] = None,
+) -> CombatResult:
+    """
+    Run a single combat to its end as fast as possible, using a fixed time step, and return a summary.
+
+    If no enemy_units are given a random combat for the level is generated, as per the CombatController. Pass
+    data to reuse already loaded Data across many simulations.
+    """
+    game = HeadlessGame(seed, data)
+    model = game.world.model
+    combat = game.world.combat
+    model.level = level
+
+    prepare_combat(game, player_units, enemy_units)
+    starting_entities = _count_alive_entities(game)
+
+    duration = 0.0
+    steps = 0
+    while combat.state == CombatState.WATCH and duration < max_duration:
+        game.update(time_step)
+        duration += time_step
+        steps += 1
+
+    # summarise
+    if combat.state == CombatState.VICTORY:
+        winner = "player"
+    elif combat.state == CombatState.DEFEAT:
+        winner = "enemy"
+    else:
+        winner = None
+        logging.info(f"Simulated combat timed out after {max_duration} seconds.")
+
+    surviving_units = {}
+    for troupe in model.troupes.values():
+        surviving_units.setdefault(troupe.team, [])
+        surviving_units[troupe.team] += [unit.type for unit in troupe.units.values() if unit.is_alive]
+
+    return CombatResult(winner, duration, steps, seed, starting_entities, _count_alive_entities(game), surviving_units)
+
+
+def prepare_combat(game: HeadlessGame, player_units: List[str], enemy_units: Optional[List[str]] = None):
+    """
+    Create both sides, place them on opposite sides of the terrain and begin combat.
+
+    If no enemy_units are given a random combat for the level is generated, as per the CombatController.
+    """
+    model = game.world.model
+    combat = game.world.combat
+
+    player_troupe = model.player_troupe
+    player_troupe.generate_specific_units(player_units)
+    _place_units(game, player_troupe, is_left_side=False)
+
+    if enemy_units is None:
+        combat.generate_combat()
+    else:
+        from nqp.command.troupe import Troupe  # prevent circular import
+
+        enemy_troupe = Troupe(game, "enemy", [])
+        enemy_troupe.generate_specific_units(enemy_units)
+        _place_units(game, enemy_troupe, is_left_side=True)
+        combat.enemy_troupe_id = model.add_troupe(enemy_troupe)
+
+    model.state = WorldState.COMBAT
+    combat.begin_combat()
+
+
+def _count_alive_entities(game: HeadlessGame) -> Dict[str, int]:
+    """
+    Count the living entities of each team.
+    """
+    counts = {}
+    for troupe in game.world.model.troupes.values():
+        alive = [entity for entity in troupe.entities if not entity_flags.is_dead.has(entity)]
+        counts[troupe.team] = counts.get(troupe.team, 0) + len(alive)
+
+    return counts
+
+
+def _place_units(game: HeadlessGame, troupe: Troupe, is_left_side: bool):
+    """
+    Move each unit in the troupe to a random, non-solid, position on one side of the terrain.
+    """
+    rng = game.rng
+    terrain = game.world.model.terrain
+
+    half_width = terrain.size.x // 2
+    if is_left_side:
+        min_x = (BARRIER_SIZE + 1) * TILE_SIZE
+        max_x = (half_width - 1) * TILE_SIZE
+    else:
+        min_x = (half_width + 1) * TILE_SIZE
+        max_x = (terrain.size.x - BARRIER_SIZE - 2) * TILE_SIZE
+    min_y = (BARRIER_SIZE + 1) * TILE_SIZE
+    max_y = (terrain.size.y - BARRIER_SIZE - 2) * TILE_SIZE
+
+    for unit in troupe.units.values():
+        while True:
+            pos = pygame.Vector2(rng.randint(int(min_x), int(max_x)), rng.randint(int(min_y), int(max_y)))
+            if not terrain.check_tile_solid(pos):
+                break
+        unit.set_position(pos)
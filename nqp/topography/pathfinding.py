@@ -1,6 +1,8 @@
 from heapq import heappop, heappush, heappushpop
 from typing import Any, List
 
+from nqp.core import counters
+
 
 class PriorityQueue:
     """
@@ -52,11 +54,13 @@ def search_terrain(terrain, start, end):
     parent[start] = None
     cost_so_far[start] = 0
     queue.put(start, 0)
+    num_expanded = 0
 
     while queue:
         current = queue.get()
         if current == end:
             break
+        num_expanded += 1
         for neighbor in terrain.get_exits(current):
             cost = cost_so_far[current] + terrain.cost(current, neighbor)
             if neighbor not in cost_so_far or cost < cost_so_far[neighbor]:
@@ -71,4 +75,8 @@ def search_terrain(terrain, start, end):
         path.append(current)
     path.pop()
     path.reverse()
+
+    counters.increment("path_searches")
+    counters.increment("path_nodes_expanded", num_expanded)
+
     return path
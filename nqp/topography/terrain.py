@@ -4,6 +4,7 @@ from typing import Dict, Iterator, List, Set
 
 import pygame
 
+from nqp.core import counters
 from nqp.core.constants import BARRIER_SIZE, TILE_SIZE
 from nqp.core.definitions import TileLocation
 from nqp.core.game import Game
@@ -82,6 +83,7 @@ class Terrain:
                     self.walls.add(loc)
 
     def sight_line(self, start: pygame.Vector2, end: pygame.Vector2) -> bool:
+        counters.increment("sight_line_checks")
         start_loc = self.px_to_loc(start)
         end_loc = self.px_to_loc(end)
         points = grid_walk(start_loc, end_loc)
@@ -124,7 +126,9 @@ class Terrain:
         return loc in self.walls
 
     def check_tile_hoverable(self, pos: pygame.Vector2) -> bool:
-        loc = self.px_to_loc(pos)
+        return self.check_loc_hoverable(self.px_to_loc(pos))
+
+    def check_loc_hoverable(self, loc: TileLocation) -> bool:
         if loc in self.tiles:
             for tile in self.tiles[loc]:
                 if not tile.config["hoverable"]:
@@ -174,6 +178,7 @@ class Terrain:
             trap.update(dt)
 
     def draw(self, surface: pygame.Surface, offset: pygame.Vector2):
+        num_blits = 0
         for loc, tiles in self.tiles.items():
             screen_pos = (
                 loc[0] * TILE_SIZE + offset[0],
@@ -181,6 +186,8 @@ class Terrain:
             )
             for tile in tiles:
                 tile.draw(self._game, surface, screen_pos)
+            num_blits += len(tiles)
+        counters.increment("blits", num_blits)
 
         for trap in self.traps:
             trap.draw(surface, offset)
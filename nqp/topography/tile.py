@@ -1,4 +1,8 @@
-from copy import deepcopy
+from typing import Any, Dict, Tuple
+
+# merged configs, shared between tiles of the same type. keyed by the id of the tile config, which is held so the id
+# cant be reused, then by tile type.
+_configs: Dict[int, Tuple[Dict, Dict[Tuple, Dict[str, Any]]]] = {}
 
 
 class Tile:
@@ -7,11 +11,11 @@ class Tile:
 
     """
 
+    __slots__ = ("type", "config")
+
     def __init__(self, tile_type, tile_config):
         self.type = tile_type
-        self.config = deepcopy(tile_config[("default", 0, 0)])
-        if tuple(self.type) in tile_config:
-            self.config.update(tile_config[tuple(self.type)])
+        self.config = _get_config(tuple(tile_type), tile_config)  # shared, so must not be changed
 
     @property
     def group(self):
@@ -31,3 +35,18 @@ class Tile:
             self.type[2] = int((game.master_clock * 2) % len(tileset[self.src_y]))
         img = tileset[self.src_y][self.src_x]
         surf.blit(img, dest)
+
+
+def _get_config(tile_type: Tuple, tile_config: Dict) -> Dict[str, Any]:
+    """
+    Get the default config updated with that of the tile type.
+    """
+    _, configs = _configs.setdefault(id(tile_config), (tile_config, {}))
+
+    if tile_type not in configs:
+        config = dict(tile_config[("default", 0, 0)])
+        if tile_type in tile_config:
+            config.update(tile_config[tile_type])
+        configs[tile_type] = config
+
+    return configs[tile_type]
@@ -8,7 +8,7 @@ from nqp.core.constants import ASSET_PATH, FontEffects, TEXT_FADE_IN_SPEED, TEXT
 from nqp.ui_elements.generic.font import Font
 
 if TYPE_CHECKING:
-    from typing import List, Optional, Tuple
+    from typing import Dict, Iterator, List, Optional, Tuple
 
 
 __all__ = ["FancyFont"]
@@ -54,8 +54,17 @@ class FancyFont:
 
         self._characters: List[List[Character]] = [[]]
         self._base_characters: List[Character] = self._create_base_characters()
+        self._layout_version: int = 0  # incremented whenever the characters are laid out again
         self._generate_characters()
 
+        # cache of the characters that have finished scaling and fading
+        self._settled_surface: Optional[pygame.Surface] = None
+        self._settled_positions: Dict[int, Tuple[int, int]] = {}  # index: offset drawn at in the cache
+        self._settled_surface_padding: int = self._get_settled_surface_padding()
+        self._settled_visible_start: Optional[int] = None  # visible start the cache was drawn for
+        self._checked_layout_version: int = -1  # layout the cached positions were last checked against
+        self._settled_key: Optional[Tuple[int, int, int]] = None  # (layout_version, visible start, visible end)
+
         self._visible_range = [0, self.length]
         self._initial_start_char_index = 0  # can be set to negative to create a delay when being removed.
         self._start_char_index = self._initial_start_char_index
@@ -102,32 +111,119 @@ class FancyFont:
 
             j = self._end_char_index
             # scale to full size
-            self._adjust_scale(j - 20, j - 16, 1)
-            self._adjust_scale(j - 12, j, 0.8)
+            is_scale_changed = self._adjust_scale(j - 20, j - 16, 1)
+            is_scale_changed |= self._adjust_scale(j - 12, j, 0.8)
 
             # fade text in
             self._adjust_alpha(j - 20, j - 16, 255)
             self._adjust_alpha(j - 16, j - 8, 100)
             self._adjust_alpha(j - 8, j, 40)
 
+            # only lay out again if a character changed size, as alpha doesnt move anything
+            if is_scale_changed:
+                self._generate_characters()
+
         else:
             self._end_char_index = self.length
 
     def draw(self, surface: pygame.Surface):
+        """
+        Draw the text. Characters that have finished scaling and fading are composited into a cached surface so
+        only the characters still changing are drawn individually.
+        """
         if isinstance(self.pos, tuple):
             breakpoint()
 
+        visible_start, visible_end = self._visible_range
+        length = self.length
+
+        # the cache is only valid whilst the start of the visible range is unchanged and the characters in it
+        # havent moved. Laying out again usually only moves characters after those still changing.
+        if visible_start != self._settled_visible_start:
+            self._reset_settled_surface()
+            self._settled_visible_start = visible_start
+        elif self._layout_version != self._checked_layout_version and self._has_settled_character_moved():
+            self._reset_settled_surface()
+        self._checked_layout_version = self._layout_version
+
+        # add newly settled characters to the cache and draw anything still changing directly
+        padding = self._settled_surface_padding
+        changing_characters = []
+        state_key = (self._layout_version, visible_start, min(visible_end, length))
+        if state_key != self._settled_key:
+            settled_surface = self._settled_surface
+            settled_positions = self._settled_positions
+            for char, x_offset, y_offset in self._get_character_offsets():
+                if (visible_start <= char.index < visible_end) or (char.index == -1):
+                    if not char.is_settled:
+                        changing_characters.append((char, x_offset, y_offset))
+                    elif char.index not in settled_positions:
+                        char.draw(settled_surface, (x_offset, y_offset + padding))
+                        settled_positions[char.index] = (x_offset, y_offset)
+
+            # nothing in flight so the cache holds the full text until something changes
+            if not changing_characters:
+                self._settled_key = state_key
+
         start_x = self.pos.x
         start_y = self.pos.y
-        x_offset = 0
+        surface.blit(self._settled_surface, (start_x, start_y - padding))
+        for char, x_offset, y_offset in changing_characters:
+            char.draw(surface, (start_x + x_offset, start_y + y_offset))
+
+    @property
+    def is_settled(self) -> bool:
+        """
+        True if every visible character has finished changing and was composited on the last draw.
+        """
+        state_key = (self._layout_version, self._visible_range[0], min(self._visible_range[1], self.length))
+        return state_key == self._settled_key
+
+    def _reset_settled_surface(self):
+        """
+        Clear the cache of settled characters, resizing it to the current layout if needed.
+        """
+        padding = self._settled_surface_padding
+        width = max(self._used_width, self.line_width, self.width) + padding
+        height = self.height + padding * 2
+
+        if self._settled_surface is None or self._settled_surface.get_size() != (width, height):
+            self._settled_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        else:
+            self._settled_surface.fill((0, 0, 0, 0))
+
+        self._settled_positions = {}
+        self._settled_key = None
+
+    def _has_settled_character_moved(self) -> bool:
+        """
+        Check if any character in the cache is no longer where it was drawn, e.g. as a line now wraps differently.
+        """
+        settled_positions = self._settled_positions
+        for char, x_offset, y_offset in self._get_character_offsets():
+            position = settled_positions.get(char.index)
+            if position is not None and char.index != -1 and position != (x_offset, y_offset):
+                return True
+
+        return False
+
+    def _get_character_offsets(self) -> Iterator[Tuple[Character, int, int]]:
+        """
+        Get each laid out character, with its offset from the text's position.
+        """
         y_offset = 0
         for line in self._characters:
+            x_offset = 0
             for char in line:
-                if (self._visible_range[0] <= char.index < self._visible_range[1]) or (char.index == -1):
-                    char.draw(surface, (start_x + x_offset, start_y + y_offset))
+                yield char, x_offset, y_offset
                 x_offset += char.width
             y_offset += self.line_height + self._line_gap
-            x_offset = 0
+
+    def _get_settled_surface_padding(self) -> int:
+        """
+        Space around the cached surface, allowing for characters from taller fonts that are drawn above the line.
+        """
+        return max(font.letters[0].get_height() for font in self._fonts)
 
     def refresh(self):
         """
@@ -159,6 +255,11 @@ class FancyFont:
         # utilise font_swap_markers
         self._initial_font_adjustments(parsed_text, font_swap_markers)
 
+        # characters have been rebuilt so the cache no longer applies
+        self._settled_surface_padding = self._get_settled_surface_padding()
+        self._settled_visible_start = None
+        self._settled_key = None
+
     @staticmethod
     def get_character_width(characters: List[Character]) -> int:
         return sum([char.width for char in characters])
@@ -186,25 +287,36 @@ class FancyFont:
             char.update()
         self._generate_characters()
 
-    def _adjust_alpha(self, start_index: int, end_index: int, new_alpha: int):
+    def _adjust_alpha(self, start_index: int, end_index: int, new_alpha: int) -> bool:
         """
         Adjust the alpha of the characters between 2 indices. new_alpha can be between 0 and 255.
+
+        Returns True if any character changed. Alpha doesnt change a character's size, so they neednt be laid out
+        again.
         """
+        has_changed = False
         start_index = max(0, start_index)
         for char in self._base_characters[start_index:end_index]:
-            char.alpha = new_alpha
-            char.update()
-        self._generate_characters()
+            if char.alpha != new_alpha:
+                char.alpha = new_alpha
+                char.update()
+                has_changed = True
+        return has_changed
 
-    def _adjust_scale(self, start_index: int, end_index: int, new_scale: float):
+    def _adjust_scale(self, start_index: int, end_index: int, new_scale: float) -> bool:
         """
         Adjust the scale of the characters between 2 indices.
+
+        Returns True if any character changed. The caller is responsible for laying the characters out again.
         """
+        has_changed = False
         start_index = max(0, start_index)
         for char in self._base_characters[start_index:end_index]:
-            char.scale = new_scale
-            char.update()
-        self._generate_characters()
+            if char.scale != new_scale:
+                char.scale = new_scale
+                char.update()
+                has_changed = True
+        return has_changed
 
     def _generate_characters(self):
         """
@@ -213,6 +325,7 @@ class FancyFont:
         word = []
         self._characters = [[]]
         self._used_width = 0
+        self._layout_version += 1
 
         current_line_width = 0
         for char in self._base_characters:
@@ -319,11 +432,21 @@ class Character:
         self.scale = 1
         self.width = 0
         self.owning_block = owning_block
+        self._letter_index = -1
         self.update()
 
     def update(self):
+        if self.character not in ["\n", " "]:
+            self._letter_index = self.font.font_order.index(self.character)
         self.width = self.get_width()
 
+    @property
+    def is_settled(self) -> bool:
+        """
+        True if the character is drawn at full size and opacity.
+        """
+        return self.alpha == 255 and self.scale == 1
+
     def __str__(self):
         return "<char: " + self.character + ">"
 
@@ -332,7 +455,7 @@ class Character:
 
     def draw(self, surf, offset=(0, 0)):
         if self.character not in ["\n", " "]:
-            img = self.font.letters[self.font.font_order.index(self.character)]
+            img = self.font.letters[self._letter_index]
             if self.alpha != 255:
                 img = img.copy()
                 img.set_alpha(self.alpha)
@@ -348,9 +471,6 @@ class Character:
         if self.character == "\n":
             return 1
         if self.character != " ":
-            return int(
-                (self.font.letter_spacing[self.font.font_order.index(self.character)] + self.owning_block.character_gap)
-                * self.scale
-            )
+            return int((self.font.letter_spacing[self._letter_index] + self.owning_block.character_gap) * self.scale)
         else:
             return int(self.owning_block.space_gap * self.scale)
@@ -46,6 +46,7 @@ class UIFrame(UIElement):
         self._max_width: Optional[int] = max_width
         self._max_height: Optional[int] = max_height
         self._text_relative_position: Optional[TextRelativePosition] = text_relative_position
+        self._animation_frame_key: Optional[Tuple[str, int, bool]] = None  # frame of the animation last drawn
 
         self._override_font_attrs()
         self._recalculate_size()
@@ -63,27 +64,24 @@ class UIFrame(UIElement):
             # N.B. Animation updates centrally so doesnt need to be updated here
 
     def draw(self, surface: pygame.Surface):
-        super().draw(surface)
-
-        is_dirty = False
-        redraw_font = False
-
         if self.is_active:
-            # FancyFont changes each frame so needs redrawing
-            if isinstance(self._font, FancyFont):
-                is_dirty = True
-                redraw_font = True
+            # FancyFont only needs redrawing whilst its characters are changing
+            if isinstance(self._font, FancyFont) and not self._font.is_settled:
+                self._is_dirty = True
 
-            # Animation changes each frame
+            # Animation only needs redrawing when it moves to a different frame
             if isinstance(self._image, Animation):
-                is_dirty = True
+                frame_key = self._image.frame_key
+                if frame_key != self._animation_frame_key:
+                    self._animation_frame_key = frame_key
+                    self._is_dirty = True
 
-            # rebuild surface first
-            if is_dirty:
+            # rebuild surface before it is drawn
+            if self._is_dirty:
                 self._rebuild_surface()
+                self._report_dirty_rect()
 
-            if redraw_font:
-                self._font.draw(self.surface)
+        super().draw(surface)
 
     def _recalculate_size(self):
         image = self._image
@@ -142,7 +140,12 @@ class UIFrame(UIElement):
         self.size = pygame.Vector2(width, height)
 
     def _rebuild_surface(self):
-        self.surface = pygame.Surface(self.size, SRCALPHA)
+        # reuse the existing surface where we can, rather than allocating a new one
+        size = (int(self.size.x), int(self.size.y))
+        if self.surface.get_size() == size and self.surface.get_flags() & SRCALPHA:
+            self.surface.fill((0, 0, 0, 0))
+        else:
+            self.surface = pygame.Surface(size, SRCALPHA)
 
         surface = self.surface
         image = self._image
@@ -167,11 +170,12 @@ class UIFrame(UIElement):
 
         # draw text
         if font is not None:
-            # Font can be drawn once (FancyFont needs constant redrawing so is handled in the draw method)
             if isinstance(font, Font):
                 font.pos.x += text_position.x
                 font.pos.y += text_position.y
-                font.draw(surface)
+            font.draw(surface)
+
+        self._is_dirty = False
 
     def _override_font_attrs(self):
         """
@@ -223,7 +227,7 @@ class UIFrame(UIElement):
         elif isinstance(font, Font):
             font.text = text
 
-        self._rebuild_surface()
+        self._is_dirty = True
 
     def add_tier_background(self, tier: int):
         """
@@ -247,7 +251,7 @@ class UIFrame(UIElement):
         bg.blit(self._image.surface, (0, 0))
         self._image = bg
 
-        self._rebuild_surface()
+        self._is_dirty = True
 
     def pause_animation(self):
         """
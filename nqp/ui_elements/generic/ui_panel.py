@@ -47,6 +47,16 @@ class UIPanel:
     def is_active(self) -> bool:
         return self._is_active
 
+    @property
+    def is_dirty(self) -> bool:
+        """
+        True if any contained element has changed since it was last drawn.
+        """
+        for element in self._elements:
+            if element.is_dirty:
+                return True
+        return False
+
     @property
     def selected_element(self) -> UIElement | None:
         for element in self._elements:
@@ -202,6 +212,9 @@ class UIPanel:
             self._clear_tooltip()
 
     def _clear_tooltip(self):
+        if self._tooltip_ref is not None:
+            self._game.window.mark_full_refresh()
+
         try:
             self._elements.remove(self._tooltip_ref)
             self._tooltip_ref = None
@@ -211,5 +224,6 @@ class UIPanel:
             self._tooltip_ref = None
 
     def _add_tooltip(self, tooltip: UITooltip):
+        self._game.window.mark_full_refresh()
         self._tooltip_ref = tooltip
         self._elements.append(self._tooltip_ref)
@@ -3,14 +3,18 @@ from __future__ import annotations
 import csv
 import logging
 import os
+from typing import TYPE_CHECKING
 
 import pygame
 import yaml
 
-from nqp.core.constants import ASSET_PATH, DATA_PATH, Flags, SceneType, WorldState
+from nqp.core.constants import ASSET_PATH, DATA_PATH, Flags, INFINITE, ProfilingMode, SceneType, WorldState
 from nqp.core.utility import scene_to_scene_type
 from nqp.ui_elements.generic.ui_input_box import UIInputBox
 
+if TYPE_CHECKING:
+    from typing import List
+
 __all__ = ["DevConsole"]
 
 
@@ -82,6 +86,23 @@ class DevConsole(UIInputBox):
             if SceneType.WORLD in self._game.scene_stack and self._game.world.state == WorldState.COMBAT:
                 confirmation_message = self._process_combat_result(result)
 
+        elif command[:14] == "frame_profiler":
+            confirmation_message = self._game.debug.toggle_frame_profiler()
+
+        elif command[:7] == "profile":
+            values = command[8:].split()  # +1 position to account for space
+            confirmation_message = self._set_profiling(values)
+
+        elif command[:8] == "counters":
+            if command[9:] == "stream":  # +1 position to account for space
+                confirmation_message = self._game.debug.toggle_counter_stream()
+            else:
+                confirmation_message = self._game.debug.dump_counters()
+
+        elif command[:6] == "memory":
+            values = command[7:].split()  # +1 position to account for space
+            confirmation_message = self._handle_memory_command(values)
+
         # update result
         if confirmation_message != "":
             active_scene = self._game.scene_stack[0]
@@ -255,6 +276,69 @@ class DevConsole(UIInputBox):
 
         return confirmation_message
 
+    def _set_profiling(self, values: List[str]) -> str:
+        """
+        Set the profiling mode. Values should be a mode, 'off', 'sampling' or 'deterministic', optionally followed
+        by the number of frames to profile for.
+        """
+        if not values or values[0].upper() not in ProfilingMode.__members__:
+            return f"Profiling mode ({' '.join(values)}) not recognised."
+
+        mode = ProfilingMode[values[0].upper()]
+        duration = int(values[1]) if len(values) > 1 and values[1].isdigit() else INFINITE
+
+        if mode == ProfilingMode.OFF:
+            path = self._game.debug.disable_profiling()
+            confirmation_message = f"Profiling stopped. Trace written to {path}." if path else "Profiling was off."
+
+        else:
+            self._game.debug.enable_profiling(mode, duration)
+            confirmation_message = f"Started {mode.name.lower()} profiling."
+
+        return confirmation_message
+
+    def _handle_memory_command(self, values: List[str]) -> str:
+        """
+        Trace memory allocations. Values should be one of:
+            'start [frames]' to start tracing, storing that many frames of the stack per allocation.
+            'stop' to stop tracing.
+            'snapshot [name]' to take a named snapshot.
+            'diff [older newer] [limit]' to log the modules with the most change between two snapshots, defaulting
+                to the last two.
+        """
+        memory_tracker = self._game.debug.memory_tracker
+        action = values[0] if values else ""
+
+        if action == "start":
+            num_frames = int(values[1]) if len(values) > 1 and values[1].isdigit() else 1
+            memory_tracker.start(num_frames)
+            confirmation_message = "Started tracing memory."
+
+        elif action == "stop":
+            memory_tracker.stop()
+            confirmation_message = "Stopped tracing memory."
+
+        elif action == "snapshot":
+            name = memory_tracker.take_snapshot(values[1] if len(values) > 1 else "manual")
+            confirmation_message = f"Took memory snapshot {name}." if name else "Memory is not being traced."
+
+        elif action == "diff":
+            names = [value for value in values[1:] if not value.isdigit()]
+            limits = [int(value) for value in values[1:] if value.isdigit()]
+            older_name, newer_name = names[:2] if len(names) >= 2 else (None, None)
+            lines = memory_tracker.format_comparison(older_name, newer_name, limits[0] if limits else 10)
+
+            if lines:
+                logging.info("Memory difference by module:\n    " + "\n    ".join(lines))
+                confirmation_message = f"Largest memory change: {lines[0]}. Full diff logged."
+            else:
+                confirmation_message = "Not enough memory snapshots to compare."
+
+        else:
+            confirmation_message = f"Memory command ({' '.join(values)}) not recognised."
+
+        return confirmation_message
+
     def _process_combat_result(self, result: str) -> str:
         """
         Set the result of the current combat. Result should be 'win' or 'lose'.
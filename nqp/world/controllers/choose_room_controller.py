@@ -143,6 +143,7 @@ class ChooseRoomController(Controller):
                 # cannot use move here because it is very buggy when entities are touching
                 position = snecs.entity_component(entity, Position)
                 position.x -= terrain_offset
+                position.reset_previous_pos()
 
             # TODO: decouple this
             self._parent_scene.ui._worldview.clamp_primary_terrain = True
@@ -4,11 +4,14 @@ import logging
 from typing import TYPE_CHECKING
 
 import pygame
+import snecs
 
 from nqp.base_classes.controller import Controller
 from nqp.command.troupe import Troupe
 from nqp.core.constants import BARRIER_SIZE, CombatState, GameSpeed, TILE_SIZE, WorldState
 from nqp.core.debug import Timer
+from nqp.world_elements import entity_flags
+from nqp.world_elements.entity_components import Allegiance
 
 if TYPE_CHECKING:
     from typing import Any, Dict, List
@@ -59,12 +62,16 @@ class CombatController(Controller):
 
         # end combat when either side is empty
         if (self._parent_scene.model.state == WorldState.COMBAT) and (self._combat_ending_timer == -1):
-            all_entities = self._parent_scene.model.get_all_entities()
-            player_entities = [e for e in all_entities if e.team == "player"]
+            alive_entities = [
+                entity for entity in self._parent_scene.model.get_all_entities() if not entity_flags.is_dead.has(entity)
+            ]
+            player_entities = [
+                entity for entity in alive_entities if snecs.entity_component(entity, Allegiance).team == "player"
+            ]
             if len(player_entities) == 0:
                 self._process_defeat()
 
-            elif len(player_entities) == len(all_entities):
+            elif len(player_entities) == len(alive_entities):
                 self._process_victory()
 
         if self.state == CombatState.VICTORY:
@@ -73,11 +80,12 @@ class CombatController(Controller):
                 self._parent_scene.model.remove_troupe(self.enemy_troupe_id)
                 for troupe in self._parent_scene.model.troupes.values():
                     troupe.set_force_idle(False)
-                self._parent_scene.ui.grid.move_units_to_grid()
+                if self._parent_scene.ui is not None:
+                    self._parent_scene.ui.grid.move_units_to_grid()
                 self.end_combat()
 
             # TODO - what is last death?
-            if self.last_unit_death:
+            if self.last_unit_death and self._parent_scene.ui is not None:
                 # average the last positions of the last entity to die and the killer of that entity
                 focus_point = (
                     (self.last_unit_death[0].pos[0] + self.last_unit_death[1].pos[0]) / 2,
@@ -163,6 +171,10 @@ class CombatController(Controller):
         for combat in combats:
             # ensure only combat for this level or lower and of desired type
             if combat["level_available"] <= level and combat["category"] == self.combat_category:
+                # skip combats using units we dont have data for
+                if any(unit_type not in self._game.data.units for unit_type in combat["units"]):
+                    continue
+
                 possible_combats.append(combat)
                 occur_rate = self._game.data.get_combat_occur_rate(combat["type"])
                 possible_combats_occur_rates.append(occur_rate)
@@ -173,14 +185,14 @@ class CombatController(Controller):
         """
         Process the defeat, such as removing morale
         """
-        self.combat_ending_timer = 0
+        self._combat_ending_timer = 0
         self.state = CombatState.DEFEAT
 
     def _process_victory(self):
         """
         Process victory
         """
-        self.combat_ending_timer = 0
+        self._combat_ending_timer = 0
         self.state = CombatState.VICTORY
 
     def end_combat(self):
@@ -192,6 +204,9 @@ class CombatController(Controller):
             troupe.set_force_idle(True)
         self._process_new_injuries()
 
+        # only taken if memory is being traced
+        self._game.debug.memory_tracker.take_snapshot("after_combat")
+
     def _process_new_injuries(self):
         """
         Process new injuries and resulting deaths
@@ -4,22 +4,22 @@ import logging
 from typing import TYPE_CHECKING, Union
 
 import pygame
-import snecs
-from snecs import World
 from snecs.typedefs import EntityID
 
 from nqp.command.commander import Commander
 from nqp.command.troupe import Troupe
 from nqp.command.unit import Unit
-from nqp.core import systems
+from nqp.core import counters, ecs, systems
 from nqp.core.constants import GameSpeed, WorldState
 from nqp.core.debug import Timer
 from nqp.topography.terrain import Terrain
+from nqp.world_elements import entity_flags
 from nqp.world_elements.particle_manager import ParticleManager
 from nqp.world_elements.projectile_manager import ProjectileManager
+from nqp.world_elements.targeting_manager import TargetingManager
 
 if TYPE_CHECKING:
-    from typing import Dict, List, Optional
+    from typing import Callable, Dict, List, Optional, Tuple
 
     from nqp.core.game import Game
     from nqp.scenes.world.scene import WorldScene
@@ -48,14 +48,13 @@ class WorldModel:
             self._game = game
             self._parent_scene = parent_scene
 
-            self._ecs_world = World()
-
             self._previous_state: WorldState = WorldState.CHOOSE_NEXT_ROOM
             self._state: WorldState = WorldState.CHOOSE_NEXT_ROOM
             self._next_state: Optional[WorldState] = None
 
             self.projectiles: ProjectileManager = ProjectileManager(self._game)
-            self.particles: ParticleManager = ParticleManager()
+            self.targeting: TargetingManager = TargetingManager()
+            self.particles: ParticleManager = ParticleManager(self._game.data.options["max_particles"])
             self.terrain: Terrain = Terrain(self._game, "plains")
             self.terrain.generate()
             self.next_terrain: Terrain = Terrain(self._game, "plains")
@@ -92,6 +91,21 @@ class WorldModel:
             # add empty player troupe
             self.add_troupe(Troupe(self._game, "player", []))
 
+            # the systems run each update, in order. Named so they can be timed individually.
+            self.update_systems: List[Tuple[str, Callable[[float], None]]] = [
+                ("positions", self._record_previous_positions),
+                ("particles", self._update_particles),
+                ("projectiles", self._update_projectiles),
+                ("ai", self._process_ai),
+                ("healing", self._process_healing),
+                ("movement", self._process_movement),
+                ("attack", self._process_attack),
+                ("damage", self._apply_damage),
+                ("death", self._process_death),
+                ("targeting", self._update_targeting),
+                ("troupes", self._update_troupes),
+            ]
+
     @property
     def boundaries(self):
         return self.terrain.boundaries
@@ -120,32 +134,65 @@ class WorldModel:
         return self.terrain.px_to_loc(pos)
 
     def update(self, delta_time: float):
-        self.particles.update(delta_time)
-        self.projectiles.update(delta_time)
-        self.process_update_systems(delta_time)
-        for troupe in self.troupes.values():
-            troupe.update(delta_time)
+        profiler = self._game.debug.frame_profiler
+        for name, system in self.update_systems:
+            with profiler.section(name):
+                system(delta_time)
 
         # at the end of the frame, complete any scheduled deletions
-        snecs.process_pending_deletions()
+        ecs.process_pending_deletions()
 
-    def process_update_systems(self, delta_time: float):
-        """
-        Process the non-drawing related ECS systems.
-        """
+    def _record_previous_positions(self, delta_time: float):
+        systems.record_previous_positions()
+
+    def _update_particles(self, delta_time: float):
+        self.particles.update(delta_time)
+
+    def _update_projectiles(self, delta_time: float):
+        self.projectiles.update(delta_time)
+
+    def _process_ai(self, delta_time: float):
         systems.process_ai(delta_time)
+
+    def _process_healing(self, delta_time: float):
         systems.process_healing()
+
+    def _process_movement(self, delta_time: float):
         systems.process_movement(delta_time, self._game)
+        # systems.push_entities_away_from_one_another(delta_time, self._game)
+        # FIXME - this causes everything to go up when moving between rooms
+
+    def _process_attack(self, delta_time: float):
         systems.process_attack(self._game)
+
+    def _apply_damage(self, delta_time: float):
         systems.apply_damage(self._game)
+
+    def _process_death(self, delta_time: float):
         systems.process_death(self._game)
-        # systems.push_entities_away_from_one_another(delta_time, self._game)
-        # FIXME - this causes everything to go up when moving between rooms
+
+    def _update_targeting(self, delta_time: float):
+        self.targeting.update()
+
+    def _update_troupes(self, delta_time: float):
+        num_alive = 0
+        for troupe in self.troupes.values():
+            troupe.update(delta_time)
+            num_alive += sum(1 for entity in troupe.entities if not entity_flags.is_dead.has(entity))
+
+        counters.set_value("entities_alive", num_alive)
 
     def reset(self):
-        self.particles = ParticleManager()
+        """
+        Reset to a clean state, ready for a new run, replacing the ecs World. Every Entity is deleted, so this must
+        be called before any of the new run's Entities are created.
+        """
+        ecs.reset_world()
+        self._game.data.create_effect_processors()
+        systems.clear_damage()
+        self.particles = ParticleManager(self._game.data.options["max_particles"])
         self.projectiles = ProjectileManager(self._game)
-        self._ecs_world = World()
+        self.targeting = TargetingManager()
 
         # units
         self.troupes = {}
@@ -60,14 +60,19 @@ class WorldView:
             area = self.camera.get_rect()
             surface = pygame.Surface(area.size)
 
+        profiler = self._game.debug.frame_profiler
         offset = self.camera.render_offset()
-        self._model.terrain.draw(surface, offset)
-        if not self.clamp_primary_terrain:
-            next_offset = pygame.Vector2(offset.x + self._model.terrain.boundaries.width, offset.y + 0)
-            self._model.next_terrain.draw(surface, next_offset)
-        self._draw_units(surface, offset)
-        self._model.projectiles.draw(surface, offset)
-        self._model.particles.draw(surface, offset)
+        with profiler.section("terrain"):
+            self._model.terrain.draw(surface, offset)
+            if not self.clamp_primary_terrain:
+                next_offset = pygame.Vector2(offset.x + self._model.terrain.boundaries.width, offset.y + 0)
+                self._model.next_terrain.draw(surface, next_offset)
+        with profiler.section("entities"):
+            self._draw_units(surface, offset)
+        with profiler.section("projectiles"):
+            self._model.projectiles.draw(surface, offset)
+        with profiler.section("particles"):
+            self._model.particles.draw(surface, offset)
 
         if self.debug_pathfinding:
             self._draw_path_debug(surface)
@@ -95,7 +100,7 @@ class WorldView:
     def _draw_units(self, surface: pygame.Surface, offset: pygame.Vector2):
         units = self._model.get_all_units()
 
-        systems.draw_entities(surface, shift=offset)
+        systems.draw_entities(surface, shift=offset, interpolation=self._game.interpolation)
 
         # # organize entities for layered rendering
         # entity_list = []
@@ -9,7 +9,7 @@ from nqp.base_classes.animation import Animation
 from nqp.base_classes.image import Image
 from nqp.command.unit import Unit
 from nqp.core.constants import DamageType, EntityFacing, HealingSource
-from nqp.world_elements.stats import FloatStat, IntStat
+from nqp.world_elements.stats import BlockStat, IntStat, StatTable
 from nqp.world_elements.unit_attribute import UnitAttribute
 
 if TYPE_CHECKING:
@@ -25,9 +25,6 @@ __all__ = [
     "Allegiance",
     "AI",
     "RangedAttack",
-    "DamageReceived",
-    "IsDead",
-    "IsReadyToAttack",
     "Attributes",
     "HealReceived",
 ]
@@ -40,6 +37,7 @@ class Position(RegisteredComponent):
 
     def __init__(self, pos: pygame.Vector2):
         self.pos: pygame.Vector2 = pos
+        self.previous_pos: pygame.Vector2 = pos  # pos at the start of the last simulation step
 
     def serialize(self):
         return self.pos
@@ -64,6 +62,19 @@ class Position(RegisteredComponent):
     def y(self, value: int | float):
         self.pos = pygame.Vector2(self.pos.x, value)
 
+    def interpolate(self, alpha: float) -> pygame.Vector2:
+        """
+        Get the position between previous_pos and pos, where alpha is the fraction of a simulation step since pos
+        was reached.
+        """
+        return self.previous_pos.lerp(self.pos, alpha)
+
+    def reset_previous_pos(self):
+        """
+        Prevent interpolating from the previous position, e.g. after being placed rather than moved.
+        """
+        self.previous_pos = self.pos
+
 
 class Aesthetic(RegisteredComponent):
     """
@@ -107,21 +118,48 @@ class Stats(RegisteredComponent):
     An Entity's stats, such as attack.
     """
 
+    # the values of every Stats component are held together, one slot per component
+    table: StatTable = StatTable(
+        (
+            "health",
+            "mundane_defence",
+            "magic_defence",
+            "attack",
+            "range",
+            "attack_speed",
+            "move_speed",
+            "size",
+            "weight",
+            "penetration",
+            "crit_chance",
+            "regen",
+            "dodge",
+        )
+    )
+
     def __init__(self, parent_unit: Unit):
-        self.health: IntStat = IntStat(parent_unit.health)
-        self.mundane_defence: IntStat = IntStat(parent_unit.mundane_defence)
-        self.magic_defence: IntStat = IntStat(parent_unit.magic_defence)
-        self.attack: IntStat = IntStat(parent_unit.attack)
+        table = Stats.table
+        self.slot: int = table.allocate(tuple(getattr(parent_unit, name) for name in table.stat_names))
+
+        self.health: BlockStat = BlockStat(table, self.slot, "health")
+        self.mundane_defence: BlockStat = BlockStat(table, self.slot, "mundane_defence")
+        self.magic_defence: BlockStat = BlockStat(table, self.slot, "magic_defence")
+        self.attack: BlockStat = BlockStat(table, self.slot, "attack")
         self.damage_type: DamageType = DamageType[parent_unit.damage_type.upper()]
-        self.range: IntStat = IntStat(parent_unit.range)
-        self.attack_speed: FloatStat = FloatStat(parent_unit.attack_speed)
-        self.move_speed: IntStat = IntStat(parent_unit.move_speed)
-        self.size: IntStat = IntStat(parent_unit.size)
-        self.weight: IntStat = IntStat(parent_unit.weight)
-        self.penetration: IntStat = IntStat(parent_unit.penetration)
-        self.crit_chance: IntStat = IntStat(parent_unit.crit_chance)
-        self.regen: IntStat = IntStat(parent_unit.regen)
-        self.dodge: IntStat = IntStat(parent_unit.dodge)
+        self.range: BlockStat = BlockStat(table, self.slot, "range")
+        self.attack_speed: BlockStat = BlockStat(table, self.slot, "attack_speed")
+        self.move_speed: BlockStat = BlockStat(table, self.slot, "move_speed")
+        self.size: BlockStat = BlockStat(table, self.slot, "size")
+        self.weight: BlockStat = BlockStat(table, self.slot, "weight")
+        self.penetration: BlockStat = BlockStat(table, self.slot, "penetration")
+        self.crit_chance: BlockStat = BlockStat(table, self.slot, "crit_chance")
+        self.regen: BlockStat = BlockStat(table, self.slot, "regen")
+        self.dodge: BlockStat = BlockStat(table, self.slot, "dodge")
+
+    def __del__(self):
+        # free the slot for the next Stats component, if one was allocated
+        if hasattr(self, "slot"):
+            self.table.release(self.slot)
 
     def serialize(self):
         # TODO - add serialisation
@@ -214,27 +252,6 @@ class RangedAttack(RegisteredComponent):
         return Allegiance(*serialised)
 
 
-class DamageReceived(RegisteredComponent):
-    """
-    Damage to be applied to the Entity.
-    """
-
-    def __init__(self, amount: int, damage_type: DamageType, penetration: int, is_crit: bool):
-        self.amount: int = amount
-        self.type: DamageType = damage_type
-        self.penetration: int = penetration
-        self.is_crit: bool = is_crit
-
-    def serialize(self):
-        # TODO - add serialisation
-        return True
-
-    @classmethod
-    def deserialize(cls, *serialised):
-        # TODO - add deserialisation
-        return DamageReceived(*serialised)
-
-
 class HealReceived(RegisteredComponent):
     """
     Healing to be applied to the Entity.
@@ -250,32 +267,12 @@ class HealReceived(RegisteredComponent):
     @classmethod
     def deserialize(cls, *serialised):
         # TODO - add deserialisation
-        return DamageReceived(*serialised)
+        return HealReceived(*serialised)
 
     def add_heal(self, amount: int, healing_source: HealingSource):
         self.heals.append((amount, healing_source))
 
 
-class IsDead(RegisteredComponent):
-    """
-    Flag to indicate if the Entity is dead.
-    """
-
-    def __init__(self):
-        self.is_processed: bool = False
-
-    # doesnt need serialising as will never be dead when saving.
-
-
-class IsReadyToAttack(RegisteredComponent):
-    """
-    Flag to indicate if the Entity is ready to attack.
-    """
-
-    # doesnt need init as has no details
-    # doesnt need serialising as will never be about to attack when saving.
-
-
 class Attributes(RegisteredComponent):
     """
     A series of flags defining the attributes of a Unit
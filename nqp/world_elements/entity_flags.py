@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Iterator, List, Tuple
+
+    from snecs.typedefs import EntityID
+
+    from nqp.core.ecs import CachedQuery
+
+__all__ = ["EntityFlag", "FlagFilteredQuery", "clear_all", "is_dead", "is_death_processed", "is_ready_to_attack"]
+
+# a byte per Entity, indexed by EntityID, with a bit per flag
+_bits: bytearray = bytearray(512)
+
+_all_flags: List[EntityFlag] = []
+
+
+class EntityFlag:
+    """
+    A boolean marker on Entities, held as a bit in a bitset indexed by EntityID, rather than as a component.
+    Setting, clearing and checking are constant time and, once the bitset has grown to fit the Entities, allocate
+    nothing.
+    """
+
+    __slots__ = ("name", "mask")
+
+    def __init__(self, name: str):
+        if len(_all_flags) >= 8:
+            raise ValueError(f"EntityFlag: can't add {name}, as there is only room for 8 flags.")
+
+        self.name: str = name
+        self.mask: int = 1 << len(_all_flags)
+
+        _all_flags.append(self)
+
+    def __iter__(self) -> Iterator[EntityID]:
+        mask = self.mask
+        return iter([entity for entity, byte in enumerate(_bits) if byte & mask])
+
+    def has(self, entity: EntityID) -> bool:
+        try:
+            return _bits[entity] & self.mask != 0
+        except IndexError:
+            # not grown to fit the Entity yet, so never set
+            return False
+
+    def add(self, entity: EntityID):
+        if entity >= len(_bits):
+            # grow to at least double, so growing is rare
+            _bits.extend(bytes(max(entity + 1, len(_bits) * 2) - len(_bits)))
+        _bits[entity] |= self.mask
+
+    def remove(self, entity: EntityID):
+        if entity < len(_bits):
+            _bits[entity] &= ~self.mask & 0xFF
+
+    def clear(self):
+        """
+        Remove the flag from all Entities.
+        """
+        keep = ~self.mask & 0xFF
+        _bits[:] = _bits.translate(bytes(byte & keep for byte in range(256)))
+
+
+class FlagFilteredQuery:
+    """
+    A CachedQuery, filtered to the Entities that have every flag in include and none in exclude. Rows are as the
+    query's, so can be iterated repeatedly in the same way.
+
+    Where there are flags to include, the bitset is scanned for matching Entities first, so only they are looked
+    up, as the flags are usually on few Entities. Otherwise the query's rows are filtered.
+    """
+
+    __slots__ = ("_query", "_include_mask", "_checked_mask", "_match_table")
+
+    def __init__(self, query: CachedQuery, include: Tuple[EntityFlag, ...] = (), exclude: Tuple[EntityFlag, ...] = ()):
+        self._query: CachedQuery = query
+
+        self._include_mask: int = 0
+        for flag in include:
+            self._include_mask |= flag.mask
+
+        self._checked_mask: int = self._include_mask
+        for flag in exclude:
+            self._checked_mask |= flag.mask
+
+        # for translating the bitset to 1 where an Entity matches and 0 where not
+        self._match_table: bytes = bytes(byte & self._checked_mask == self._include_mask for byte in range(256))
+
+    def __iter__(self) -> Iterator[Tuple[EntityID, Tuple[Any, ...]]]:
+        if self._include_mask:
+            return iter(self._get_included_rows())
+
+        # every flag is checked at once, as one masked compare
+        bits = _bits
+        size = len(bits)
+        include_mask = self._include_mask
+        checked_mask = self._checked_mask
+
+        return iter(
+            [row for row in self._query.rows if (bits[row[0]] if row[0] < size else 0) & checked_mask == include_mask]
+        )
+
+    def _get_included_rows(self) -> List[Tuple[EntityID, Tuple[Any, ...]]]:
+        get_components = self._query.get
+        matches = _bits.translate(self._match_table)
+
+        rows = []
+        entity = matches.find(1)
+        while entity != -1:
+            components = get_components(entity)
+            if components is not None:
+                rows.append((entity, components))
+            entity = matches.find(1, entity + 1)
+
+        return rows
+
+
+def clear_all():
+    """
+    Remove every flag from every Entity. EntityIDs restart with each ecs World, so this must be called whenever the
+    World is replaced.
+    """
+    _bits[:] = bytes(len(_bits))
+
+
+is_dead = EntityFlag("is_dead")
+is_death_processed = EntityFlag("is_death_processed")
+is_ready_to_attack = EntityFlag("is_ready_to_attack")
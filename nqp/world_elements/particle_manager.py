@@ -3,26 +3,53 @@ from __future__ import annotations
 import logging
 import math
 import random
+from array import array
 from typing import TYPE_CHECKING
 
 import pygame
 
-from nqp.core.constants import Colour
-from nqp.world_elements.particle import Particle
+from nqp.core import counters
+from nqp.core.constants import Colour, DEFAULT_MAX_PARTICLES, ParticlePriority
 
 if TYPE_CHECKING:
     from typing import Dict, List, Optional, Tuple, Union
 
 __all__ = ["ParticleManager"]
 
+# the share of max_particles each priority can fill
+_PRIORITY_SHARES = {
+    ParticlePriority.LOW: 0.5,
+    ParticlePriority.MEDIUM: 0.8,
+    ParticlePriority.HIGH: 1.0,
+}
+
 
 class ParticleManager:
     """
     Class to manage all particles and their functionality, including creating, drawing and deletion.
+
+    Particles are held as columns, one typed array per property, rather than as an object each, so that updating and
+    culling work on whole columns and drawing is a single batched blit.
+
+    The number of particles is capped at max_particles. As the cap is neared, bursts are cut short, lowest priority
+    first, rather than the columns growing without bound.
     """
 
-    def __init__(self):
-        self._particles = []
+    def __init__(self, max_particles: int = DEFAULT_MAX_PARTICLES):
+        self.max_particles: int = max_particles
+
+        self._time: float = 0
+        self._xs: array = array("d")
+        self._ys: array = array("d")
+        self._velocity_xs: array = array("d")
+        self._velocity_ys: array = array("d")
+        self._end_times: array = array("d")  # time the particle dies
+        self._pixels: List[pygame.Surface] = []  # a pixel of the particle's colour, to blit
+
+        self._pixel_cache: Dict[Tuple[int, int, int], pygame.Surface] = {}
+
+    def __len__(self) -> int:
+        return len(self._end_times)
 
     def _create_particle_burst(
         self,
@@ -32,6 +59,7 @@ class ParticleManager:
         speed_range: List[int, int] = None,
         duration_range: List[int, int] = None,
         allow_shade_variations: bool = False,
+        priority: ParticlePriority = ParticlePriority.MEDIUM,
     ):
         """
         Create a short burst of coloured circles from a target location in a randomised direction.
@@ -41,6 +69,7 @@ class ParticleManager:
             speed_range: the range of the speed of the particles movement
             duration_range: the range of how long the particles will last, in seconds.
             allow_shade_variations: whether the colour used can vary slightly from the one given
+            priority: how much of the particle budget the burst can use
         """
 
         # handle mutable defaults
@@ -49,9 +78,20 @@ class ParticleManager:
         if speed_range is None:
             speed_range = [30, 60]
 
-        # get random count
-        count = random.randint(count_range[0], count_range[1])
+        # unwrap enum
+        if isinstance(colour, Colour):
+            colour = colour.value
+        base_colour = colour
 
+        # get random count, limited to what is left of the budget for the priority
+        requested_count = random.randint(count_range[0], count_range[1])
+        budget = int(self.max_particles * _PRIORITY_SHARES[priority]) - len(self._end_times)
+        count = min(requested_count, max(budget, 0))
+        if count < requested_count:
+            counters.increment("particles_dropped", requested_count - count)
+
+        x, y = position
+        pixel = self._get_pixel(colour)
         for i in range(count):
             speed = random.random() * (speed_range[1] - speed_range[0]) + speed_range[0]
             dur = random.random() * (duration_range[1] - duration_range[0]) + duration_range[0]
@@ -59,22 +99,64 @@ class ParticleManager:
 
             if allow_shade_variations:
                 variation = random.randint(-5, 5)
-                colour = (colour[0] - variation, colour[1] - variation, colour[2] - variation)
+                colour = tuple(min(max(channel - variation, 0), 255) for channel in base_colour)
+                pixel = self._get_pixel(colour)
 
-            p = Particle(position, pygame.Vector2(math.cos(angle) * speed, math.sin(angle) * speed), dur, colour)
-            self._particles.append(p)
+            self._xs.append(x)
+            self._ys.append(y)
+            self._velocity_xs.append(math.cos(angle) * speed)
+            self._velocity_ys.append(math.sin(angle) * speed)
+            self._end_times.append(self._time + dur)
+            self._pixels.append(pixel)
 
-    def create_blood_spray(self, pos: pygame.Vector2, blood_colour: Tuple[int, int, int] = Colour.BLOOD_RED):
-        self._create_particle_burst(pos, blood_colour, [10, 16], allow_shade_variations=True)
+    def create_blood_spray(
+        self,
+        pos: pygame.Vector2,
+        blood_colour: Tuple[int, int, int] = Colour.BLOOD_RED,
+        priority: ParticlePriority = ParticlePriority.MEDIUM,
+    ):
+        self._create_particle_burst(pos, blood_colour, [10, 16], allow_shade_variations=True, priority=priority)
 
-    def create_smoke(self, pos: pygame.Vector2):
-        self._create_particle_burst(pos, Colour.GREY_SMOKE, [30, 40])
+    def create_smoke(self, pos: pygame.Vector2, priority: ParticlePriority = ParticlePriority.LOW):
+        self._create_particle_burst(pos, Colour.GREY_SMOKE, [30, 40], priority=priority)
 
     def update(self, delta_time: float):
-        for i, p in sorted(enumerate(self._particles), reverse=True):
-            if not p.update(delta_time):
-                self._particles.pop(i)
+        # each column is rebuilt whole, as comprehensions are far cheaper than indexing element by element
+        self._time += delta_time
+        self._xs = array("d", [x + velocity_x * delta_time for x, velocity_x in zip(self._xs, self._velocity_xs)])
+        self._ys = array("d", [y + velocity_y * delta_time for y, velocity_y in zip(self._ys, self._velocity_ys)])
+
+        # drop the dead, if there are any
+        now = self._time
+        end_times = self._end_times
+        if end_times and min(end_times) < now:
+            alive = [i for i, end_time in enumerate(end_times) if end_time >= now]
+            self._xs = array("d", [self._xs[i] for i in alive])
+            self._ys = array("d", [self._ys[i] for i in alive])
+            self._velocity_xs = array("d", [self._velocity_xs[i] for i in alive])
+            self._velocity_ys = array("d", [self._velocity_ys[i] for i in alive])
+            self._end_times = array("d", [end_times[i] for i in alive])
+            self._pixels = [self._pixels[i] for i in alive]
+
+        counters.set_value("particles", len(self._end_times))
 
     def draw(self, surface: pygame.Surface, offset=(0, 0)):
-        for p in self._particles:
-            p.draw(surface, offset=offset)
+        offset_x, offset_y = offset
+
+        surface.blits(
+            [(pixel, (x + offset_x, y + offset_y)) for x, y, pixel in zip(self._xs, self._ys, self._pixels)], False
+        )
+
+        counters.increment("blits", len(self._end_times))
+
+    def _get_pixel(self, colour: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Get a single pixel surface of the given colour.
+        """
+        pixel = self._pixel_cache.get(colour)
+        if pixel is None:
+            pixel = pygame.Surface((1, 1))
+            pixel.fill(colour)
+            self._pixel_cache[colour] = pixel
+
+        return pixel
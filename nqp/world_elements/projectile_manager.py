@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import math
+from array import array
 from typing import TYPE_CHECKING
 
 import pygame
+import snecs
 
 from nqp.base_classes.image import Image
-from nqp.core.constants import DamageType
-from nqp.world_elements.projectile import Projectile
+from nqp.core import counters
+from nqp.core.constants import DamageType, TILE_SIZE
+from nqp.core.utility import angle_to
+from nqp.world_elements.entity_components import Allegiance, Position
+from nqp.world_elements.spatial_grid import fill_team_grids, SpatialGrid
 
 if TYPE_CHECKING:
-    from typing import Dict, List, Union
+    from typing import Dict, List, Optional, Tuple, Union
 
     from snecs.typedefs import EntityID
 
@@ -17,11 +23,44 @@ if TYPE_CHECKING:
 
 __all__ = ["ProjectileManager"]
 
+# how close a projectile must pass to an entity to hit it
+_HIT_RADIUS = 4
+
+# how far above an entity's position, i.e. their feet, their centre is. projectiles fly at and hit at this height.
+_CENTRE_HEIGHT = 5
+
+# how far apart the points checked for leaving the terrain are. less than a tile, so no tile is skipped over.
+_BOUNDS_CHECK_STEP = TILE_SIZE / 2
+
 
 class ProjectileManager:
+    """
+    Class to manage all projectiles, including moving them, resolving hits, drawing and deletion.
+
+    Projectiles are held as columns, one per property, rather than as an object each. Each update moves every
+    projectile along a straight segment and finds the first enemy the segment passes within _HIT_RADIUS of, using a
+    spatial grid of each team's entities, so only nearby entities are checked.
+    """
+
     def __init__(self, game: Game):
         self._game: Game = game
-        self.projectiles: List[Projectile] = []
+
+        self._xs: array = array("d")
+        self._ys: array = array("d")
+        self._direction_xs: array = array("d")
+        self._direction_ys: array = array("d")
+        self._speeds: array = array("d")
+        self._damages: array = array("d")
+        self._penetrations: array = array("d")
+        self._teams: List[str] = []
+        self._damage_types: List[DamageType] = []
+        self._is_crits: List[bool] = []
+        self._surfaces: List[pygame.Surface] = []  # already rotated to the direction of travel
+
+        self._team_grids: Dict[str, SpatialGrid] = {}
+
+    def __len__(self) -> int:
+        return len(self._xs)
 
     def add_projectile(
         self,
@@ -33,16 +72,153 @@ class ProjectileManager:
         penetration: int,
         is_crit: bool,
     ):
-        self.projectiles.append(
-            Projectile(self._game, owner, target, projectile_data, damage, damage_type, penetration, is_crit)
-        )
+        position = snecs.entity_component(owner, Position)
+        target_pos = snecs.entity_component(target, Position)
+        angle = angle_to(position.pos, target_pos.pos)
+        image: Image = projectile_data["img"]
+
+        # move base firing position towards center of entity
+        self._xs.append(position.x)
+        self._ys.append(position.y - _CENTRE_HEIGHT)
+        self._direction_xs.append(math.cos(angle))
+        self._direction_ys.append(math.sin(angle))
+        self._speeds.append(projectile_data["speed"])
+        self._damages.append(damage)
+        self._penetrations.append(penetration)
+        self._teams.append(snecs.entity_component(owner, Allegiance).team)
+        self._damage_types.append(damage_type)
+        self._is_crits.append(is_crit)
+        self._surfaces.append(pygame.transform.rotate(image.surface, -math.degrees(angle)))
 
     def update(self, delta_time: float):
-        for i, projectile in enumerate(self.projectiles):
-            projectile.update(delta_time)
-            if not projectile.is_active:
-                self.projectiles.pop(i)
-
-    def draw(self, surf, offset: pygame.Vector2):
-        for projectile in self.projectiles:
-            projectile.draw(surf, offset)
+        if not self._xs:
+            counters.set_value("projectiles", 0)
+            return
+
+        from nqp.core.systems import add_damage  # prevent circular import
+
+        # at the height projectiles fly
+        fill_team_grids(self._team_grids, -_CENTRE_HEIGHT)
+        terrain = self._game.world.model.terrain
+
+        xs = self._xs
+        ys = self._ys
+        direction_xs = self._direction_xs
+        direction_ys = self._direction_ys
+        speeds = self._speeds
+        teams = self._teams
+
+        # move every projectile, noting those that hit something or leave the terrain
+        inactive = []
+        for i in range(len(xs)):
+            x = xs[i]
+            y = ys[i]
+            direction_x = direction_xs[i]
+            direction_y = direction_ys[i]
+            distance = speeds[i] * delta_time
+
+            # how far the projectile can go before it leaves the terrain
+            max_distance = distance
+            checked_distance = 0.0
+            while checked_distance < distance:
+                checked_distance = min(checked_distance + _BOUNDS_CHECK_STEP, distance)
+                check_loc = (
+                    int((x + direction_x * checked_distance) // TILE_SIZE),
+                    int((y + direction_y * checked_distance) // TILE_SIZE),
+                )
+                if not terrain.check_loc_hoverable(check_loc):
+                    max_distance = checked_distance
+                    break
+
+            hit_entity = self._find_first_hit(x, y, direction_x, direction_y, max_distance, teams[i])
+            if hit_entity is not None:
+                add_damage(
+                    hit_entity, self._damages[i], self._damage_types[i], self._penetrations[i], self._is_crits[i]
+                )
+                inactive.append(i)
+            elif max_distance < distance:
+                inactive.append(i)
+
+            xs[i] = x + direction_x * max_distance
+            ys[i] = y + direction_y * max_distance
+
+        if inactive:
+            self._remove(inactive)
+
+        counters.set_value("projectiles", len(self._xs))
+
+    def _find_first_hit(
+        self, x: float, y: float, direction_x: float, direction_y: float, distance: float, team: str
+    ) -> Optional[EntityID]:
+        """
+        Find the first entity not on the team that the segment from (x, y), along the direction for the distance,
+        passes within _HIT_RADIUS of.
+        """
+        end_x = x + direction_x * distance
+        end_y = y + direction_y * distance
+        left = min(x, end_x) - _HIT_RADIUS
+        top = min(y, end_y) - _HIT_RADIUS
+        right = max(x, end_x) + _HIT_RADIUS
+        bottom = max(y, end_y) + _HIT_RADIUS
+        radius_squared = _HIT_RADIUS * _HIT_RADIUS
+
+        first_entity = None
+        first_distance = distance
+        for other_team, grid in self._team_grids.items():
+            if other_team == team:
+                continue
+
+            for entity, entity_x, entity_y in grid.query_rect(left, top, right, bottom):
+                # solve |start + direction * t - entity| = radius for the smallest t
+                offset_x = x - entity_x
+                offset_y = y - entity_y
+                b = offset_x * direction_x + offset_y * direction_y
+                c = offset_x * offset_x + offset_y * offset_y - radius_squared
+
+                if c <= 0:
+                    # already within reach at the start
+                    hit_distance = 0.0
+                else:
+                    discriminant = b * b - c
+                    if discriminant < 0 or b > 0:
+                        # never within reach, or moving away
+                        continue
+                    hit_distance = -b - math.sqrt(discriminant)
+
+                if hit_distance <= first_distance:
+                    first_entity = entity
+                    first_distance = hit_distance
+
+        return first_entity
+
+    def _remove(self, indices: List[int]):
+        """
+        Remove the projectiles at the given indices.
+        """
+        removed = set(indices)
+        kept = [i for i in range(len(self._xs)) if i not in removed]
+
+        self._xs = array("d", [self._xs[i] for i in kept])
+        self._ys = array("d", [self._ys[i] for i in kept])
+        self._direction_xs = array("d", [self._direction_xs[i] for i in kept])
+        self._direction_ys = array("d", [self._direction_ys[i] for i in kept])
+        self._speeds = array("d", [self._speeds[i] for i in kept])
+        self._damages = array("d", [self._damages[i] for i in kept])
+        self._penetrations = array("d", [self._penetrations[i] for i in kept])
+        self._teams = [self._teams[i] for i in kept]
+        self._damage_types = [self._damage_types[i] for i in kept]
+        self._is_crits = [self._is_crits[i] for i in kept]
+        self._surfaces = [self._surfaces[i] for i in kept]
+
+    def draw(self, surf: pygame.Surface, offset: pygame.Vector2):
+        offset_x, offset_y = offset
+
+        surf.blits(
+            [
+                (surface, (x - surface.get_width() // 2 + offset_x, y - surface.get_height() // 2 + offset_y))
+                for x, y, surface in zip(self._xs, self._ys, self._surfaces)
+            ],
+            False,
+        )
+
+        counters.increment("blits", len(self._xs))
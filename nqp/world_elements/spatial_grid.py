@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+from nqp.core import queries
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+__all__ = ["SpatialGrid", "fill_team_grids"]
+
+
+class SpatialGrid:
+    """
+    A uniform grid of points, to find those near a position without checking them all. Entities move every step, so
+    the grid is cleared and refilled, rather than points moved between cells.
+    """
+
+    def __init__(self, cell_size: float = 32):
+        self.cell_size: float = cell_size
+        self._cells: Dict[Tuple[int, int], List[Tuple[Any, float, float]]] = {}  # cell: [(item, x, y), ...]
+
+        # (min x, min y, max x, max y) of the filled cells, worked out when needed
+        self._cell_bounds: Optional[Tuple[int, int, int, int]] = None
+
+    def __len__(self) -> int:
+        return sum(len(cell) for cell in self._cells.values())
+
+    def clear(self):
+        self._cells.clear()
+        self._cell_bounds = None
+
+    def insert(self, item: Any, x: float, y: float):
+        """
+        Add an item at the given position.
+        """
+        cell = (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+        self._cells.setdefault(cell, []).append((item, x, y))
+        self._cell_bounds = None
+
+    def query_rect(self, left: float, top: float, right: float, bottom: float) -> Iterator[Tuple[Any, float, float]]:
+        """
+        Get (item, x, y) for every item in a cell touching the rect. Items may be outside the rect, but none inside
+        are missed.
+        """
+        cell_size = self.cell_size
+        cells = self._cells
+
+        for cell_x in range(math.floor(left / cell_size), math.floor(right / cell_size) + 1):
+            for cell_y in range(math.floor(top / cell_size), math.floor(bottom / cell_size) + 1):
+                cell = cells.get((cell_x, cell_y))
+                if cell is not None:
+                    yield from cell
+
+    def query_radius(self, x: float, y: float, radius: float) -> Iterator[Tuple[Any, float, float]]:
+        """
+        Get (item, x, y) for every item in a cell touching the circle. Items may be outside the circle, but none
+        inside are missed.
+        """
+        return self.query_rect(x - radius, y - radius, x + radius, y + radius)
+
+    def find_nearest(self, x: float, y: float) -> Optional[Tuple[Any, float, float]]:
+        """
+        Get (item, x, y) for the item nearest the position, or None if the grid is empty. Cells are searched in
+        rings outward from the position's cell, stopping once no further ring can hold anything nearer.
+        """
+        cells = self._cells
+        if not cells:
+            return None
+
+        if self._cell_bounds is None:
+            cell_xs = [cell[0] for cell in cells]
+            cell_ys = [cell[1] for cell in cells]
+            self._cell_bounds = (min(cell_xs), min(cell_ys), max(cell_xs), max(cell_ys))
+        min_x, min_y, max_x, max_y = self._cell_bounds
+
+        cell_size = self.cell_size
+        centre_x = math.floor(x / cell_size)
+        centre_y = math.floor(y / cell_size)
+        last_ring = max(centre_x - min_x, max_x - centre_x, centre_y - min_y, max_y - centre_y)
+
+        nearest = None
+        nearest_distance_squared = math.inf
+        for ring in range(last_ring + 1):
+            for cell in _get_ring(centre_x, centre_y, ring):
+                for entry in cells.get(cell, ()):
+                    distance_squared = (entry[1] - x) ** 2 + (entry[2] - y) ** 2
+                    if distance_squared < nearest_distance_squared:
+                        nearest = entry
+                        nearest_distance_squared = distance_squared
+
+            # anything in the next ring out is at least this far away
+            reach = ring * cell_size
+            if nearest is not None and nearest_distance_squared <= reach * reach:
+                break
+
+        return nearest
+
+
+def fill_team_grids(grids: Dict[str, SpatialGrid], y_offset: float = 0):
+    """
+    Refill the grid of each team with its living Entities, adding a grid for any team without one. Entities are
+    inserted at their position, offset vertically by y_offset.
+    """
+    for grid in grids.values():
+        grid.clear()
+
+    for entity, (position, allegiance) in queries.position_allegiance_not_dead:
+        grid = grids.get(allegiance.team)
+        if grid is None:
+            grid = grids[allegiance.team] = SpatialGrid()
+        grid.insert(entity, position.x, position.y + y_offset)
+
+
+def _get_ring(centre_x: int, centre_y: int, ring: int) -> Iterator[Tuple[int, int]]:
+    """
+    Get the cells making up the square ring the given number of cells out from the centre.
+    """
+    if ring == 0:
+        yield centre_x, centre_y
+        return
+
+    for cell_x in range(centre_x - ring, centre_x + ring + 1):
+        yield cell_x, centre_y - ring
+        yield cell_x, centre_y + ring
+    for cell_y in range(centre_y - ring + 1, centre_y + ring):
+        yield centre_x - ring, cell_y
+        yield centre_x + ring, cell_y
@@ -1,25 +1,26 @@
 from __future__ import annotations
 
+import weakref
+from array import array
+from functools import partial
 from typing import TYPE_CHECKING
 
-from nqp.base_classes.stat import Stat
+from nqp.base_classes.stat import get_modifier_ref, Stat
 
 if TYPE_CHECKING:
-    pass
+    from typing import Any, Callable, Dict, List, Tuple
 
-__all__ = ["IntStat", "FloatStat"]
+__all__ = ["IntStat", "FloatStat", "StatTable", "BlockStat"]
 
 
 class IntStat(Stat):
+    value: int
+
     def __init__(self, base_value: int):
         super().__init__(base_value)
 
     # methods readded to specify types
 
-    @property
-    def value(self) -> int:
-        return super().value
-
     @property
     def base_value(self) -> int:
         return self._base_value
@@ -27,18 +28,17 @@ class IntStat(Stat):
     @base_value.setter
     def base_value(self, value: int):
         self._base_value = value
+        self._recalculate()
 
 
 class FloatStat(Stat):
+    value: float
+
     def __init__(self, base_value: float):
         super().__init__(base_value)
 
     # methods readded to specify types
 
-    @property
-    def value(self) -> float:
-        return super().value
-
     @property
     def base_value(self) -> float:
         return self._base_value
@@ -46,3 +46,170 @@ class FloatStat(Stat):
     @base_value.setter
     def base_value(self, value: float):
         self._base_value = value
+        self._recalculate()
+
+
+class StatTable:
+    """
+    The values of the stats of every Stats component, held as shared typed arrays, one column per stat and one
+    slot per Stats component. Systems can read a whole column, e.g. every entity's range, at once.
+
+    Modifiers and overrides are rare, so are held in sparse tables keyed by (slot, stat name).
+    """
+
+    def __init__(self, stat_names: Tuple[str, ...]):
+        self.stat_names: Tuple[str, ...] = stat_names
+        self.base_values: Dict[str, array] = {name: array("d") for name in stat_names}
+        self.values: Dict[str, array] = {name: array("d") for name in stat_names}  # after modifiers
+        self.modifiers: Dict[Tuple[int, str], Dict[Any, Callable]] = {}
+        self.overrides: Dict[Tuple[int, str], float] = {}
+
+        self._free_slots: List[int] = []
+
+    @property
+    def num_slots(self) -> int:
+        return len(self.values[self.stat_names[0]])
+
+    def allocate(self, base_values: Tuple[float, ...]) -> int:
+        """
+        Get a slot holding the given base values, in the order of stat_names.
+        """
+        # convert first, so a bad value cant leave the columns different lengths
+        base_values = tuple(float(base_value) for base_value in base_values)
+
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            for name, base_value in zip(self.stat_names, base_values):
+                self.base_values[name][slot] = base_value
+                self.values[name][slot] = base_value
+
+        else:
+            slot = self.num_slots
+            for name, base_value in zip(self.stat_names, base_values):
+                self.base_values[name].append(base_value)
+                self.values[name].append(base_value)
+
+        return slot
+
+    def release(self, slot: int):
+        """
+        Free a slot to be reused, removing its modifiers and overrides.
+        """
+        for name in self.stat_names:
+            key = (slot, name)
+            self.modifiers.pop(key, None)
+            self.overrides.pop(key, None)
+
+        self._free_slots.append(slot)
+
+    def recalculate(self, slot: int, name: str) -> float:
+        """
+        Recalculate the value of a stat from its base value, override and modifiers. Returns the new value.
+        """
+        key = (slot, name)
+        override = self.overrides.get(key)
+        if override is None:
+            base_value = self.base_values[name][slot]
+            acc = 0
+            for func in self.modifiers.get(key, {}).values():
+                acc += func(base_value)
+            override = base_value + acc
+
+        # read back, so the value matches the column's precision
+        values = self.values[name]
+        values[slot] = override
+        return values[slot]
+
+
+class BlockStat:
+    """
+    A stat of a Stats component, with the same interface as Stat, whose values are held in a slot of a StatTable
+    rather than on the object.
+
+    value is read every frame, so is also held as a plain attribute, as with Stat. It is set whenever the value in
+    the table is recalculated, so the two always match.
+    """
+
+    __slots__ = ("value", "_table", "_slot", "_name", "_base_values")
+
+    def __init__(self, table: StatTable, slot: int, name: str):
+        self._table: StatTable = table
+        self._slot: int = slot
+        self._name: str = name
+        self._base_values: array = table.base_values[name]
+        self.value: float = table.values[name][slot]
+
+    @property
+    def base_value(self) -> float:
+        return self._base_values[self._slot]
+
+    @base_value.setter
+    def base_value(self, value: float):
+        self._base_values[self._slot] = value
+        self._recalculate()
+
+    def reset(self):
+        """
+        Remove any modifiers and override.
+        """
+        key = (self._slot, self._name)
+        self._table.modifiers.pop(key, None)
+        self._table.overrides.pop(key, None)
+        self._recalculate()
+
+    def override(self, value: float):
+        """
+        Force the value and ignore modifiers
+
+        """
+        self._table.overrides[(self._slot, self._name)] = value
+        self._recalculate()
+
+    def apply_modifier(self, func: Callable, key: Any):
+        """
+        Add a modifier
+
+        When value is calculated, ``func`` will be called with the base value
+
+        Args:
+            func: Any callable function
+            key: Unique identifier for adding and removing
+
+        """
+        modifiers = self._table.modifiers.setdefault((self._slot, self._name), {})
+        callback = partial(_remove_expired_modifier, modifiers, self)
+        modifiers[get_modifier_ref(key, callback)] = func
+        self._recalculate()
+
+    def remove_modifier(self, key: Any):
+        """
+        Remove a modifier
+
+        Args:
+            key: Unique identifier for adding and removing
+
+        """
+        del self._table.modifiers[(self._slot, self._name)][get_modifier_ref(key)]
+        self._recalculate()
+
+    def has_modifier(self, key: Any):
+        """
+        Check if modifier is applied
+
+        Args:
+            key: Unique identifier for adding and removing
+
+        """
+        return get_modifier_ref(key) in self._table.modifiers.get((self._slot, self._name), {})
+
+    def _recalculate(self):
+        self.value = self._table.recalculate(self._slot, self._name)
+
+
+def _remove_expired_modifier(modifiers: Dict[Any, Callable], stat: BlockStat, ref: weakref.ref):
+    """
+    Remove the modifier of a key that has been deleted. The modifiers are checked, rather than looked up by slot, as
+    the slot may have since been released and reused.
+    """
+    if modifiers.pop(ref, None) is not None and stat._table.modifiers.get((stat._slot, stat._name)) is modifiers:
+        stat._recalculate()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from nqp.core import counters
+from nqp.world_elements.spatial_grid import fill_team_grids, SpatialGrid
+
+if TYPE_CHECKING:
+    from typing import Dict, Optional
+
+    from snecs.typedefs import EntityID
+
+    from nqp.command.unit import Unit
+
+__all__ = ["TargetingManager"]
+
+
+class TargetingManager:
+    """
+    Class to find the nearest enemy of each Unit. At most once per update, every living Entity is put in a spatial
+    grid of its team. A Unit's nearest enemy is then found from the other teams' grids the first time it is asked
+    for in that update, and reused after, so Units don't each check every Entity.
+
+    Units only look for a target when they have none, so the grids are only filled in updates where one is asked
+    for.
+    """
+
+    def __init__(self):
+        self._team_grids: Dict[str, SpatialGrid] = {}
+        self._is_grids_stale: bool = True
+        self._nearest_enemies: Dict[Unit, Optional[EntityID]] = {}  # unit: nearest enemy entity this update
+
+    def update(self):
+        """
+        Forget the grids and nearest enemies of the last update, as Entities have since moved.
+        """
+        self._is_grids_stale = True
+        self._nearest_enemies.clear()
+
+    def get_nearest_enemy(self, unit: Unit) -> Optional[EntityID]:
+        """
+        Get the living Entity, not on the Unit's team, nearest the Unit's position, or None if there are none.
+        """
+        if unit in self._nearest_enemies:
+            return self._nearest_enemies[unit]
+
+        counters.increment("nearest_enemy_searches")
+        if self._is_grids_stale:
+            fill_team_grids(self._team_grids)
+            self._is_grids_stale = False
+
+        x, y = unit.pos
+        nearest = None
+        nearest_distance_squared = None
+        for team, grid in self._team_grids.items():
+            if team == unit.team:
+                continue
+
+            found = grid.find_nearest(x, y)
+            if found is None:
+                continue
+
+            entity, entity_x, entity_y = found
+            distance_squared = (entity_x - x) ** 2 + (entity_y - y) ** 2
+            if nearest_distance_squared is None or distance_squared < nearest_distance_squared:
+                nearest = entity
+                nearest_distance_squared = distance_squared
+
+        self._nearest_enemies[unit] = nearest
+        return nearest
@@ -0,0 +1,60 @@
+import gc
+import unittest
+
+import pygame
+
+from nqp.base_classes.animation import Animation, AnimationClock
+from nqp.base_classes.image import Image
+from nqp.core.animation_registry import AnimationRegistry
+
+
+def _create_animation(clock: AnimationClock = None, loop: bool = True) -> Animation:
+    frames = {"idle": [Image(image=pygame.Surface((1, 1))) for _ in range(2)]}
+    return Animation(frames, loop=loop, clock=clock)
+
+
+class AnimationRegistryTestCase(unittest.TestCase):
+    def test_discarded_animation_dropped(self):
+        registry = AnimationRegistry()
+        kept = _create_animation()
+        registry.add(kept)
+        registry.add(_create_animation())
+        registry.add(_create_animation())
+        gc.collect()
+        self.assertEqual(1, len(registry))
+        registry.update()
+        self.assertEqual([kept], list(registry))
+        self.assertEqual(1, len(registry._refs))
+
+
+class AnimationClockTestCase(unittest.TestCase):
+    def test_frame_follows_clock(self):
+        clock = AnimationClock()
+        animation = _create_animation(clock)
+        self.assertEqual(0, animation.frame_key[1])
+        clock.advance(0.4)
+        self.assertEqual(1, animation.frame_key[1])
+
+    def test_pause_holds_frame(self):
+        clock = AnimationClock()
+        animation = _create_animation(clock)
+        clock.advance(0.4)
+        animation.pause()
+        clock.advance(0.2)
+        self.assertEqual(1, animation.frame_key[1])
+        animation.play()
+        clock.advance(0.2)
+        self.assertEqual(0, animation.frame_key[1])
+
+    def test_finishes_without_loop(self):
+        clock = AnimationClock()
+        animation = _create_animation(clock, loop=False)
+        clock.advance(2)
+        self.assertTrue(animation.is_finished)
+
+    def test_loop_can_be_stopped(self):
+        clock = AnimationClock()
+        animation = _create_animation(clock)
+        animation.loop = False
+        clock.advance(2)
+        self.assertTrue(animation.is_finished)
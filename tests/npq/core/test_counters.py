@@ -0,0 +1,45 @@
+import json
+import os
+import tempfile
+import unittest
+
+from nqp.core import counters
+
+
+class CountersTestCase(unittest.TestCase):
+    def tearDown(self):
+        counters.stop_stream()
+        counters.end_frame()
+
+    def test_end_frame(self):
+        counters.end_frame()
+        counters.increment("path_searches")
+        counters.increment("path_searches", 2)
+        counters.set_value("particles", 10)
+        counters.set_value("particles", 4)
+        counters.end_frame()
+
+        self.assertEqual({"path_searches": 3, "particles": 4}, counters.get_last_frame())
+        self.assertEqual("particles=4, path_searches=3", counters.format_last_frame())
+
+        # counts start afresh each frame
+        counters.end_frame()
+        self.assertEqual({}, counters.get_last_frame())
+
+    def test_stream(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "counters.jsonl")
+            counters.start_stream(path)
+            counters.increment("blits", 5)
+            counters.end_frame()
+            counters.end_frame()
+            counters.stop_stream()
+
+            self.assertFalse(counters.is_streaming())
+            with open(path) as file:
+                lines = [json.loads(line) for line in file]
+
+        self.assertEqual(2, len(lines))
+        self.assertEqual(5, lines[0]["blits"])
+        self.assertEqual(lines[0]["frame"] + 1, lines[1]["frame"])
+        self.assertNotIn("blits", lines[1])
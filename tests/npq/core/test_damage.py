@@ -0,0 +1,48 @@
+import unittest
+from unittest import mock
+
+from nqp.core import ecs, systems
+from nqp.core.constants import DamageType
+from nqp.world_elements import entity_flags
+from nqp.world_elements.entity_components import Aesthetic, Stats
+
+
+class DamageTestCase(unittest.TestCase):
+    def setUp(self):
+        ecs.reset_world()
+        systems.clear_damage()
+
+        # never dodge
+        self.game = mock.Mock()
+        self.game.rng.roll.return_value = 100
+
+        unit = mock.Mock(damage_type="mundane")
+        for stat_name in Stats.table.stat_names:
+            setattr(unit, stat_name, 0)
+        unit.health = 10
+        self.stats = Stats(unit)
+        self.entity = ecs.new_entity((Aesthetic(mock.Mock()), self.stats))
+
+    def test_many_hits_in_one_step(self):
+        systems.add_damage(self.entity, 3, DamageType.MUNDANE, 0, False)
+        systems.add_damage(self.entity, 4, DamageType.MUNDANE, 0, False)
+        systems.apply_damage(self.game)
+
+        self.assertEqual(3, self.stats.health.value)
+        self.assertEqual([], systems.get_pending_damage())
+
+    def test_hits_stop_once_dead(self):
+        for amount in (6, 6, 6):
+            systems.add_damage(self.entity, amount, DamageType.MUNDANE, 0, False)
+        systems.apply_damage(self.game)
+
+        self.assertEqual(-2, self.stats.health.value)
+        self.assertTrue(entity_flags.is_dead.has(self.entity))
+
+    def test_deleted_entity_ignored(self):
+        systems.add_damage(self.entity, 3, DamageType.MUNDANE, 0, False)
+        ecs.delete_entity_immediately(self.entity)
+
+        systems.apply_damage(self.game)
+
+        self.assertEqual([], systems.get_pending_damage())
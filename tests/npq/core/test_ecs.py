@@ -0,0 +1,65 @@
+import unittest
+
+import pygame
+
+from nqp.core import counters, ecs
+from nqp.core.ecs import CachedQuery
+from nqp.world_elements.entity_components import Allegiance, HealReceived, Position
+
+
+class CachedQueryTestCase(unittest.TestCase):
+    def setUp(self):
+        ecs.reset_world()
+        self.query = CachedQuery([Position, HealReceived])
+
+        self.position = Position(pygame.Vector2(0, 0))
+        self.entity = ecs.new_entity((self.position,))
+
+    def test_add_and_remove_component(self):
+        self.assertEqual((), self.query.rows)
+
+        heal = HealReceived(1, None)
+        ecs.add_component(self.entity, heal)
+        self.assertEqual(((self.entity, (self.position, heal)),), self.query.rows)
+
+        ecs.remove_component(self.entity, HealReceived)
+        self.assertEqual((), self.query.rows)
+
+    def test_unrelated_change_keeps_rows(self):
+        ecs.add_component(self.entity, HealReceived(1, None))
+        rows = self.query.rows
+
+        ecs.add_component(self.entity, Allegiance("player", None))
+        ecs.new_entity((Position(pygame.Vector2(1, 1)),))
+
+        self.assertIs(rows, self.query.rows)
+
+    def test_deletion(self):
+        other = ecs.new_entity((Position(pygame.Vector2(1, 1)), HealReceived(1, None)))
+        ecs.add_component(self.entity, HealReceived(1, None))
+
+        ecs.delete_entity_immediately(self.entity)
+        ecs.schedule_for_deletion(other)
+        self.assertEqual([other], [entity for entity, _ in self.query])
+
+        ecs.process_pending_deletions()
+        self.assertEqual(0, len(self.query))
+
+    def test_reset_world(self):
+        ecs.add_component(self.entity, HealReceived(1, None))
+
+        ecs.reset_world()
+
+        self.assertEqual((), self.query.rows)
+
+    def test_component_changes_counted(self):
+        counters.end_frame()
+        ecs.new_entity((Position(pygame.Vector2(1, 1)), HealReceived(1, None)))
+        ecs.add_component(self.entity, HealReceived(1, None))
+        ecs.remove_component(self.entity, HealReceived)
+        counters.end_frame()
+
+        last_frame = counters.get_last_frame()
+        self.assertEqual(1, last_frame["entities_created"])
+        self.assertEqual(3, last_frame["components_added"])
+        self.assertEqual(1, last_frame["components_removed"])
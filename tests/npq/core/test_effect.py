@@ -3,7 +3,7 @@ from unittest import mock
 
 import snecs
 
-from nqp.core import queries
+from nqp.core import ecs, queries
 from nqp.core.data import Data
 from nqp.effects.actions import apply_effects, new_stats_effect
 from nqp.effects.burn import OnFireStatusEffect
@@ -19,11 +19,13 @@ class EffectTestCase(unittest.TestCase):
 
     def setUp(self) -> None:
         # clear existing world
-        snecs.ecs.move_world(snecs.World())
+        ecs.reset_world()
         self.data = Data(mock.Mock())
         self.game = mock.Mock()
         # unit 0
         self.unit0 = mock.Mock(team="team0", type="ranged")
+        for stat_name in Stats.table.stat_names:
+            setattr(self.unit0, stat_name, 1)
         self.unit0.attack_speed = 1.0
         self.unit0.damage_type = "mundane"
         self.stats0 = Stats(self.unit0)
@@ -33,9 +35,11 @@ class EffectTestCase(unittest.TestCase):
             self.stats0,
             Allegiance("team0", self.unit0),
         ]
-        self.entity_id0 = snecs.new_entity(components)
+        self.entity_id0 = ecs.new_entity(components)
         # unit 1
         self.unit1 = mock.Mock(team="team0", type="not-ranged")
+        for stat_name in Stats.table.stat_names:
+            setattr(self.unit1, stat_name, 1)
         self.unit1.attack_speed = 1.0
         self.unit1.damage_type = "mundane"
         self.stats1 = Stats(self.unit0)
@@ -45,7 +49,7 @@ class EffectTestCase(unittest.TestCase):
             self.stats1,
             Allegiance("team1", self.unit1),
         ]
-        self.entity_id1 = snecs.new_entity(components)
+        self.entity_id1 = ecs.new_entity(components)
 
     def tick(self, dt=1000):
         for _, (effect_system,) in queries.effects_processors:
@@ -103,7 +107,7 @@ class EffectTestCase(unittest.TestCase):
             modifier="50%",
             params={"team": "team0"},
         )
-        snecs.new_entity((sentinel,))
+        ecs.new_entity((sentinel,))
         apply_effects([self.entity_id0, self.entity_id1])
         self.assertEqual(1.5, self.stats0.attack_speed.value)
         self.assertEqual(1.0, self.stats1.attack_speed.value)
@@ -115,7 +119,7 @@ class EffectTestCase(unittest.TestCase):
             attribute="attack_speed",
             modifier="50%",
         )
-        snecs.new_entity((sentinel,))
+        ecs.new_entity((sentinel,))
         apply_effects([self.entity_id0, self.entity_id1])
         self.assertEqual(1.5, self.stats0.attack_speed.value)
         self.assertEqual(1.0, self.stats1.attack_speed.value)
@@ -127,7 +131,7 @@ class EffectTestCase(unittest.TestCase):
             modifier="50",
         )
         self.assertEqual(51, self.stats0.attack_speed.value)
-        snecs.delete_entity_immediately(eid)
+        ecs.delete_entity_immediately(eid)
         self.assertEqual(1, self.stats0.attack_speed.value)
 
     def test_item_no_errors(self):
@@ -139,7 +143,7 @@ class EffectTestCase(unittest.TestCase):
         item = self.data.create_item("thracks_item")
 
     def test_fire(self):
-        snecs.add_component(self.entity_id0, OnFireStatusEffect())
+        ecs.add_component(self.entity_id0, OnFireStatusEffect())
         self.assertTrue(snecs.has_component(self.entity_id0, OnFireStatusEffect))
         self.tick()
         self.assertFalse(snecs.has_component(self.entity_id0, OnFireStatusEffect))
@@ -0,0 +1,68 @@
+import unittest
+
+from nqp.core.frame_pacer import FramePacer
+
+
+class FramePacerTestCase(unittest.TestCase):
+    def test_percentiles(self):
+        frame_pacer = FramePacer(num_frames_recorded=100)
+        frame_pacer._frame_times.extend(i / 1000 for i in range(1, 101))
+
+        self.assertEqual(0.05, frame_pacer.get_frame_time_percentile(50))
+        self.assertEqual(0.095, frame_pacer.get_frame_time_percentile(95))
+        self.assertEqual(0.1, frame_pacer.get_frame_time_percentile(100))
+        self.assertEqual(0.001, frame_pacer.get_frame_time_percentile(0))
+
+    def test_limit_holds_to_target(self):
+        clock = _FakeClock()
+        frame_pacer = FramePacer(target_fps=50, clock=clock, sleep=clock.sleep)
+        frame_pacer.tick()
+
+        for _ in range(5):
+            clock.now += 0.005  # work done during the frame
+            frame_pacer.limit()
+            frame_pacer.tick()
+
+        self.assertEqual(5, clock.num_sleeps)
+        self.assertAlmostEqual(50, frame_pacer.current_fps, delta=0.5)
+        self.assertAlmostEqual(5 / 50, clock.now, delta=0.001)
+
+    def test_limit_starts_again_when_behind(self):
+        clock = _FakeClock()
+        frame_pacer = FramePacer(target_fps=50, clock=clock, sleep=clock.sleep)
+
+        clock.now += 0.1
+        frame_pacer.limit()
+        self.assertEqual(0, clock.num_sleeps)
+
+        # the next frame is due a frame from now, not from when the missed frames were due
+        clock.now += 0.005
+        frame_pacer.limit()
+        self.assertAlmostEqual(0.1 + 1 / 50, clock.now, delta=0.001)
+
+    def test_uncapped(self):
+        clock = _FakeClock()
+        frame_pacer = FramePacer(target_fps=0, clock=clock, sleep=clock.sleep)
+
+        start = clock.now
+        frame_pacer.limit()
+        self.assertEqual(0, clock.num_sleeps)
+        self.assertEqual(start, clock.now)
+
+
+class _FakeClock:
+    """
+    Time that only passes when slept through, or a little on each reading, so spinning ends.
+    """
+
+    def __init__(self):
+        self.now: float = 0.0
+        self.num_sleeps: int = 0
+
+    def __call__(self) -> float:
+        self.now += 0.0001
+        return self.now
+
+    def sleep(self, duration: float):
+        self.num_sleeps += 1
+        self.now += duration
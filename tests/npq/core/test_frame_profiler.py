@@ -0,0 +1,36 @@
+import time
+import unittest
+
+from nqp.core.debug import FrameProfiler
+
+
+class FrameProfilerTestCase(unittest.TestCase):
+    def test_nested_sections(self):
+        profiler = FrameProfiler()
+        profiler.set_enabled(True)
+
+        for _ in range(2):
+            profiler.begin_frame()
+            with profiler.section("update"):
+                for _ in range(3):
+                    with profiler.section("movement"):
+                        time.sleep(0.001)
+            profiler.end_frame()
+
+        self.assertEqual(2, len(profiler.frames))
+        self.assertEqual(["update"], profiler.get_top_level_sections())
+        self.assertGreaterEqual(profiler.get_average("update/movement"), 0.003)
+        self.assertGreaterEqual(profiler.get_average("update"), profiler.get_average("update/movement"))
+        self.assertGreaterEqual(profiler.get_average("frame"), profiler.get_average("update"))
+
+    def test_disabled_records_nothing(self):
+        profiler = FrameProfiler()
+
+        profiler.begin_frame()
+        with profiler.section("update"):
+            profiler.set_enabled(True)  # only applies from the next frame
+            with profiler.section("movement"):
+                pass
+        profiler.end_frame()
+
+        self.assertEqual(0, len(profiler.frames))
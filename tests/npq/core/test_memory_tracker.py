@@ -0,0 +1,34 @@
+import unittest
+
+from nqp.core.memory_tracker import MemoryTracker
+
+
+class MemoryTrackerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.memory_tracker = MemoryTracker(max_snapshots=3)
+
+    def tearDown(self):
+        self.memory_tracker.stop()
+
+    def test_snapshot_needs_tracing(self):
+        self.assertEqual("", self.memory_tracker.take_snapshot("before"))
+        self.assertEqual([], self.memory_tracker.compare())
+
+    def test_compare_by_module(self):
+        self.memory_tracker.start()
+        self.memory_tracker.take_snapshot("before")
+        leaked = [bytearray(1024) for _ in range(100)]
+        self.memory_tracker.take_snapshot("after")
+
+        module, size_diff, count_diff = self.memory_tracker.compare()[0]
+        self.assertEqual(__name__.split(".")[-1], module.split(".")[-1])
+        self.assertGreaterEqual(size_diff, 100 * 1024)
+        self.assertGreaterEqual(count_diff, 100)
+        self.assertEqual(len(leaked), 100)
+
+    def test_names_and_limit(self):
+        self.memory_tracker.start()
+        for _ in range(4):
+            self.memory_tracker.take_snapshot("scene")
+
+        self.assertEqual(["scene_2", "scene_3", "scene_4"], list(self.memory_tracker.snapshots.keys()))
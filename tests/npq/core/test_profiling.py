@@ -0,0 +1,64 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from nqp.core.profiling import CallTracer, StackSampler, write_chrome_trace
+
+
+def _busy(duration: float):
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        pass
+
+
+def _count_phases(events):
+    begins = sum(1 for event in events if event["ph"] == "B")
+    ends = sum(1 for event in events if event["ph"] == "E")
+    return begins, ends
+
+
+class ProfilingTestCase(unittest.TestCase):
+    def test_sampler_sees_busy_function(self):
+        sampler = StackSampler(interval=0.001)
+        sampler.start()
+        _busy(0.05)
+        sampler.stop()
+
+        names = [event["name"] for event in sampler.events if event["ph"] == "B"]
+        self.assertTrue(any(name.startswith("_busy") for name in names))
+
+        begins, ends = _count_phases(sampler.events)
+        self.assertEqual(begins, ends)
+
+    def test_sampler_keeps_most_recent_events(self):
+        sampler = StackSampler(interval=0.001, max_events=10)
+        sampler.start()
+        for _ in range(20):
+            _busy(0.002)
+            time.sleep(0.002)
+        sampler.stop()
+        self.assertLessEqual(len(sampler.events), 10)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            write_chrome_trace(path, sampler.events)
+            with open(path) as file:
+                events = json.load(file)["traceEvents"]
+
+        begins, ends = _count_phases(events)
+        self.assertEqual(begins, ends)
+
+    def test_tracer_records_every_call(self):
+        tracer = CallTracer()
+        tracer.start()
+        for _ in range(3):
+            _busy(0)
+        tracer.stop()
+
+        names = [event["name"] for event in tracer.events if event["ph"] == "B"]
+        self.assertEqual(3, sum(1 for name in names if name.startswith("_busy")))
+
+        begins, ends = _count_phases(tracer.events)
+        self.assertEqual(begins, ends)
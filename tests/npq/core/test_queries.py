@@ -0,0 +1,27 @@
+import unittest
+from unittest import mock
+
+import pygame
+
+from nqp.core import ecs, queries
+from nqp.world_elements.entity_components import AI, Position
+
+
+class QueriesTestCase(unittest.TestCase):
+    def setUp(self):
+        ecs.reset_world()
+
+    def test_ai_position(self):
+        ai = AI(mock.Mock())
+        position = Position(pygame.Vector2(0, 0))
+        entity = ecs.new_entity((ai, position))
+        ecs.new_entity((Position(pygame.Vector2(1, 1)),))
+
+        self.assertEqual(((entity, (ai, position)),), queries.ai_position.rows)
+
+    def test_filtered_queries_share_base_query(self):
+        self.assertIs(queries.aesthetic_position, queries.dead_unprocessed_aesthetic_position._query)
+        self.assertIs(
+            queries.position_stats_ai_aesthetic_not_dead._query,
+            queries.attack_position_stats_ai_aesthetic_not_dead._query,
+        )
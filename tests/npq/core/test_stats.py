@@ -12,6 +12,7 @@ data = Data(mock.Mock())
 class StatsTestCase(unittest.TestCase):
     def setUp(self):
         self.parent = mock.Mock(
+            health=1,
             mundane_defence=1,
             magic_defence=1,
             attack=1,
@@ -23,6 +24,8 @@ class StatsTestCase(unittest.TestCase):
             weight=1,
             penetration=1,
             crit_chance=1,
+            regen=1,
+            dodge=1,
         )
         self.stats = Stats(self.parent)
 
@@ -52,3 +55,39 @@ class StatsTestCase(unittest.TestCase):
         self.assertEqual(1.25, self.stats.attack_speed.value)
         self.stats.attack_speed.remove_modifier(1)
         self.assertEqual(1.0, self.stats.attack_speed.value)
+
+    def test_base_value_and_override(self):
+        self.stats.attack_speed.apply_modifier(partial(operator.mul, 0.50), 0)
+        self.stats.attack_speed.base_value = 2.0
+        self.assertEqual(3.0, self.stats.attack_speed.value)
+        self.stats.attack_speed.override(5.0)
+        self.assertEqual(5.0, self.stats.attack_speed.value)
+        self.stats.attack_speed.reset()
+        self.assertEqual(2.0, self.stats.attack_speed.value)
+
+    def test_modifier_dropped_with_key(self):
+        key = mock.Mock()
+        self.stats.attack_speed.apply_modifier(partial(operator.mul, 0.50), key)
+        self.assertTrue(self.stats.attack_speed.has_modifier(key))
+        self.assertEqual(1.5, self.stats.attack_speed.value)
+        del key
+        self.assertEqual(1.0, self.stats.attack_speed.value)
+
+    def test_value_matches_table(self):
+        column = Stats.table.values["attack_speed"]
+        self.stats.attack_speed.apply_modifier(partial(operator.mul, 0.50), 0)
+        self.assertEqual(column[self.stats.slot], self.stats.attack_speed.value)
+        self.stats.attack_speed.override(5.0)
+        self.assertEqual(column[self.stats.slot], self.stats.attack_speed.value)
+
+    def test_slot_released(self):
+        table = Stats.table
+        slot = self.stats.slot
+        self.stats.attack_speed.apply_modifier(partial(operator.mul, 0.50), 0)
+        self.assertEqual(1.5, table.values["attack_speed"][slot])
+
+        del self.stats
+        stats = Stats(self.parent)
+        self.assertEqual(slot, stats.slot)
+        self.assertEqual(1.0, stats.attack_speed.value)
+        self.assertFalse(stats.attack_speed.has_modifier(0))
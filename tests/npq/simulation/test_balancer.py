@@ -0,0 +1,42 @@
+import unittest
+
+from nqp.simulation.balancer import BalanceJob, create_jobs, get_starting_troupes, run_jobs, summarise
+from nqp.simulation.headless import CombatResult, HeadlessGame
+
+
+class BalancerTestCase(unittest.TestCase):
+    def test_create_jobs_skips_unknown_units(self):
+        data = HeadlessGame().data
+        jobs = create_jobs(data, {"skirmishers": ["skirmisher"]}, 3, combat_types=["empire1", "cabalist1"])
+        self.assertEqual(3, len(jobs))
+        self.assertEqual({"empire1"}, {job.combat_type for job in jobs})
+        self.assertEqual([0, 1, 2], [job.seed for job in jobs])
+
+    def test_create_jobs_skips_unknown_troupe_units(self):
+        data = HeadlessGame().data
+        troupes = get_starting_troupes(data)
+        jobs = create_jobs(data, troupes, 1, combat_types=["empire1"])
+        job_troupes = {job.troupe_name for job in jobs}
+        self.assertTrue(job_troupes)
+        for troupe_name, player_units in troupes.items():
+            is_known = all(unit_type in data.units for unit_type in player_units)
+            self.assertEqual(is_known, troupe_name in job_troupes)
+
+    def test_run_jobs_raises_worker_error(self):
+        job = BalanceJob("empire1", "unknown", ["not_a_unit"], ["infantryman"], 0)
+        with self.assertRaises(KeyError):
+            run_jobs([job], processes=1, max_duration=1)
+
+    def test_summarise(self):
+        job = BalanceJob("empire1", "skirmishers", ["skirmisher"], ["infantryman"], 0)
+        results = [
+            (job, CombatResult("player", 10, 600, 0, {"player": 5, "enemy": 5}, {"player": 3, "enemy": 0})),
+            (job, CombatResult(None, 20, 1200, 1, {"player": 5, "enemy": 5}, {"player": 5, "enemy": 4})),
+        ]
+        summary = summarise(results)[0]
+        self.assertEqual(2, summary.runs)
+        self.assertEqual(1, summary.timeouts)
+        self.assertEqual(0.5, summary.win_rate)
+        self.assertEqual(15, summary.mean_duration)
+        self.assertEqual(1, summary.mean_player_casualties)
+        self.assertEqual(3, summary.mean_enemy_casualties)
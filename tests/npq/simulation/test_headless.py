@@ -0,0 +1,15 @@
+import unittest
+
+from nqp.simulation.headless import simulate_combat
+
+
+class HeadlessTestCase(unittest.TestCase):
+    def test_combat_resolves(self):
+        result = simulate_combat(["skirmisher"], ["bandit"], seed=5)
+        self.assertEqual("player", result.winner)
+        self.assertEqual(0, result.surviving_entities["enemy"])
+
+    def test_same_seed_same_result(self):
+        first = simulate_combat(["skirmisher"], ["bandit"], seed=5, max_duration=10)
+        second = simulate_combat(["skirmisher"], ["bandit"], seed=5, max_duration=10)
+        self.assertEqual(first, second)
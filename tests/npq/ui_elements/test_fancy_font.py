@@ -0,0 +1,48 @@
+import unittest
+from unittest import mock
+
+import pygame
+
+from nqp.core.constants import FontEffects
+from nqp.ui_elements.generic.fancy_font import FancyFont
+from nqp.ui_elements.generic.font import Font
+
+
+def _load_font_img(path: str, colour):
+    # the font images aren't needed, only letters of a consistent size
+    letters = [pygame.Surface((4, 7)) for _ in range(100)]
+    return letters, [4] * len(letters)
+
+
+@mock.patch.object(Font, "_load_font_img", staticmethod(_load_font_img))
+class FancyFontTestCase(unittest.TestCase):
+    def test_fade_in_keeps_cache(self):
+        text = "the quick brown fox jumps over the lazy dog " * 7
+        font = FancyFont(text, pygame.Vector2(0, 0), line_width=200, font_effects=[FontEffects.FADE_IN])
+        surface = pygame.Surface((300, 300))
+
+        num_frames = 0
+        with mock.patch.object(font, "_reset_settled_surface", wraps=font._reset_settled_surface) as reset:
+            while num_frames < 2 or not font.is_settled:
+                font.update(0.016)
+                font.draw(surface)
+                num_frames += 1
+
+        # once for the first draw, then only when a wrapping word moves characters already drawn
+        self.assertGreater(num_frames, 50)
+        self.assertLess(reset.call_count, len(font._characters) + 2)
+
+    def test_settled_matches_direct_draw(self):
+        text = "the quick brown fox jumps over the lazy dog " * 3
+        font = FancyFont(text, pygame.Vector2(0, 0), line_width=150, font_effects=[FontEffects.FADE_IN])
+        surface = pygame.Surface((300, 300))
+        font.update(0.016)
+        while not font.is_settled:
+            font.update(0.016)
+            font.draw(surface)
+
+        expected = {}
+        for char, x_offset, y_offset in font._get_character_offsets():
+            if char.index != -1:
+                expected[char.index] = (x_offset, y_offset)
+        self.assertEqual(expected, {index: pos for index, pos in font._settled_positions.items() if index != -1})
@@ -0,0 +1,20 @@
+import unittest
+
+from nqp.core import queries
+from nqp.simulation.headless import HeadlessGame, prepare_combat
+from nqp.world_elements import entity_flags
+
+
+class WorldModelTestCase(unittest.TestCase):
+    def test_reset_deletes_entities(self):
+        game = HeadlessGame(seed=1)
+        prepare_combat(game, ["bandit"], ["bandit"])
+        dead_entity = next(iter(queries.position))[0]
+        entity_flags.is_dead.add(dead_entity)
+
+        game.world.model.reset()
+
+        self.assertEqual(0, len(queries.position))
+        self.assertEqual([], list(queries.position_allegiance_not_dead))
+        self.assertEqual([], list(entity_flags.is_dead))
+        self.assertEqual(2, len(queries.effects_processors))
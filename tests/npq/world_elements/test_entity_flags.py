@@ -0,0 +1,75 @@
+import unittest
+
+import pygame
+
+from nqp.core import ecs
+from nqp.core.ecs import CachedQuery
+from nqp.world_elements import entity_flags
+from nqp.world_elements.entity_components import Position
+from nqp.world_elements.entity_flags import FlagFilteredQuery, is_dead, is_ready_to_attack
+
+
+class EntityFlagTestCase(unittest.TestCase):
+    def setUp(self):
+        entity_flags.clear_all()
+
+    def test_add_remove(self):
+        is_dead.add(3)
+        is_dead.add(9)
+        is_ready_to_attack.add(3)
+
+        self.assertTrue(is_dead.has(3))
+        self.assertFalse(is_dead.has(4))
+        self.assertEqual([3, 9], list(is_dead))
+
+        is_dead.remove(3)
+        is_dead.remove(3)
+
+        self.assertFalse(is_dead.has(3))
+        self.assertTrue(is_ready_to_attack.has(3))
+        self.assertEqual([9], list(is_dead))
+
+    def test_grows_to_fit(self):
+        self.assertFalse(is_dead.has(100_000))
+
+        is_dead.add(100_000)
+
+        self.assertTrue(is_dead.has(100_000))
+        self.assertEqual([100_000], list(is_dead))
+
+    def test_clear(self):
+        is_dead.add(1)
+        is_ready_to_attack.add(1)
+
+        is_dead.clear()
+
+        self.assertEqual([], list(is_dead))
+        self.assertEqual([1], list(is_ready_to_attack))
+
+
+class FlagFilteredQueryTestCase(unittest.TestCase):
+    def setUp(self):
+        ecs.reset_world()
+
+        self.entities = [ecs.new_entity((Position(pygame.Vector2(i, 0)),)) for i in range(4)]
+        is_dead.add(self.entities[0])
+        is_ready_to_attack.add(self.entities[0])
+        is_ready_to_attack.add(self.entities[1])
+
+    def test_filter(self):
+        not_dead = FlagFilteredQuery(CachedQuery([Position]), exclude=(is_dead,))
+        ready_not_dead = FlagFilteredQuery(CachedQuery([Position]), include=(is_ready_to_attack,), exclude=(is_dead,))
+
+        self.assertEqual(self.entities[1:], sorted(entity for entity, _ in not_dead))
+        self.assertEqual([self.entities[1]], [entity for entity, _ in ready_not_dead])
+
+        # reflects flags as they are when iterated
+        is_dead.add(self.entities[1])
+        self.assertEqual([], list(ready_not_dead))
+
+    def test_deleted_entity_ignored(self):
+        ready = FlagFilteredQuery(CachedQuery([Position]), include=(is_ready_to_attack,))
+
+        ecs.delete_entity_immediately(self.entities[1])
+
+        self.assertEqual([self.entities[0]], [entity for entity, _ in ready])
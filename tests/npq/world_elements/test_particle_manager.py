@@ -0,0 +1,50 @@
+import unittest
+
+import pygame
+
+from nqp.core.constants import ParticlePriority
+from nqp.world_elements.particle_manager import ParticleManager
+
+
+class ParticleManagerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.particles = ParticleManager()
+        self.particles._create_particle_burst(pygame.Vector2(10, 10), (255, 0, 0), [5, 5], [10, 10], [1, 1])
+        self.particles._create_particle_burst(pygame.Vector2(10, 10), (0, 255, 0), [5, 5], [10, 10], [2, 2])
+
+    def test_particles_move(self):
+        self.particles.update(0.5)
+
+        self.assertEqual(10, len(self.particles))
+        for x, y in zip(self.particles._xs, self.particles._ys):
+            self.assertAlmostEqual(5, pygame.Vector2(x, y).distance_to((10, 10)))
+
+    def test_dead_particles_removed(self):
+        self.particles.update(1.5)
+
+        self.assertEqual(5, len(self.particles))
+        for pixel in self.particles._pixels:
+            self.assertEqual((0, 255, 0), tuple(pixel.get_at((0, 0)))[:3])
+
+        self.particles.update(1)
+        self.assertEqual(0, len(self.particles))
+
+    def test_draw(self):
+        surface = pygame.Surface((20, 20))
+        self.particles.update(0)
+        self.particles.draw(surface, (-5, -5))
+
+        self.assertEqual((0, 255, 0), tuple(surface.get_at((5, 5)))[:3])
+
+    def test_budget_by_priority(self):
+        particles = ParticleManager(max_particles=100)
+
+        # low priority can only fill half the budget
+        for _ in range(10):
+            particles.create_smoke(pygame.Vector2(0, 0))
+        self.assertEqual(50, len(particles))
+
+        # high priority can fill the rest, but no more
+        for _ in range(10):
+            particles.create_blood_spray(pygame.Vector2(0, 0), priority=ParticlePriority.HIGH)
+        self.assertEqual(100, len(particles))
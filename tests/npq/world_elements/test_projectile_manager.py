@@ -0,0 +1,51 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import pygame
+
+from nqp.base_classes.image import Image
+from nqp.core import ecs, systems
+from nqp.core.constants import DamageType
+from nqp.world_elements.entity_components import Allegiance, Position
+from nqp.world_elements.projectile_manager import ProjectileManager
+
+
+class ProjectileManagerTestCase(unittest.TestCase):
+    def setUp(self):
+        ecs.reset_world()
+        systems.clear_damage()
+
+        terrain = SimpleNamespace(check_loc_hoverable=lambda loc: 0 <= loc[0] < 10)  # 160px wide
+        game = SimpleNamespace(world=SimpleNamespace(model=SimpleNamespace(terrain=terrain)))
+        self.projectiles = ProjectileManager(game)
+        self.projectile_data = {"img": Image(image=pygame.Surface((4, 1))), "speed": 100}
+
+        self.archer = self._create_entity(10, 105, "player")
+        self.ally = self._create_entity(50, 100, "player")
+        self.enemy = self._create_entity(80, 100, "enemy")
+
+    @staticmethod
+    def _create_entity(x: float, y: float, team: str):
+        return ecs.new_entity((Position(pygame.Vector2(x, y)), Allegiance(team, mock.Mock())))
+
+    def test_hits_first_enemy(self):
+        self.projectiles.add_projectile(self.archer, self.enemy, self.projectile_data, 5, DamageType.MUNDANE, 0, False)
+
+        # passes the ally, then covers the rest of the 70px to the enemy in one long step
+        self.projectiles.update(0.3)
+        self.assertEqual(1, len(self.projectiles))
+        self.projectiles.update(1)
+
+        self.assertEqual(0, len(self.projectiles))
+        self.assertEqual([(self.enemy, 5, DamageType.MUNDANE, 0, False)], systems.get_pending_damage())
+
+    def test_leaves_terrain(self):
+        ecs.schedule_for_deletion(self.enemy)
+        ecs.process_pending_deletions()
+        target = self._create_entity(-50, 105, "enemy")
+        self.projectiles.add_projectile(self.archer, target, self.projectile_data, 5, DamageType.MUNDANE, 0, False)
+
+        self.projectiles.update(0.5)
+
+        self.assertEqual(0, len(self.projectiles))
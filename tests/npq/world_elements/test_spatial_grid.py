@@ -0,0 +1,29 @@
+import unittest
+
+from nqp.world_elements.spatial_grid import SpatialGrid
+
+
+class SpatialGridTestCase(unittest.TestCase):
+    def test_query_radius(self):
+        grid = SpatialGrid(cell_size=10)
+        grid.insert("near", 5, 5)
+        grid.insert("edge", 14, 5)
+        grid.insert("far", 100, 100)
+
+        found = {item for item, _, _ in grid.query_radius(8, 5, 5)}
+
+        self.assertEqual({"near", "edge"}, found)
+        self.assertEqual(3, len(grid))
+
+    def test_find_nearest(self):
+        grid = SpatialGrid(cell_size=10)
+        self.assertIsNone(grid.find_nearest(0, 0))
+
+        grid.insert("same_cell_far", 9, 9)
+        grid.insert("next_cell_near", 11, 0)
+        grid.insert("far", -100, 50)
+
+        self.assertEqual("next_cell_near", grid.find_nearest(8, 0)[0])
+        self.assertEqual("same_cell_far", grid.find_nearest(9, 8)[0])
+        self.assertEqual("far", grid.find_nearest(-70, 40)[0])
+        self.assertEqual("far", grid.find_nearest(-500, 500)[0])
@@ -0,0 +1,45 @@
+import unittest
+from unittest import mock
+
+import pygame
+
+from nqp.core import ecs
+from nqp.world_elements import entity_flags
+from nqp.world_elements.entity_components import Allegiance, Position
+from nqp.world_elements.targeting_manager import TargetingManager
+
+
+class TargetingManagerTestCase(unittest.TestCase):
+    def setUp(self):
+        ecs.reset_world()
+        self.targeting = TargetingManager()
+
+        self.unit = mock.Mock(team="player", pos=pygame.Vector2(0, 0))
+        self._create_entity(5, 0, "player")
+        self.far_enemy = self._create_entity(100, 0, "enemy")
+        self.near_enemy = self._create_entity(-40, 30, "enemy")
+
+    @staticmethod
+    def _create_entity(x: float, y: float, team: str) -> int:
+        return ecs.new_entity((Position(pygame.Vector2(x, y)), Allegiance(team, mock.Mock())))
+
+    def test_nearest_enemy(self):
+        self.targeting.update()
+
+        self.assertEqual(self.near_enemy, self.targeting.get_nearest_enemy(self.unit))
+
+    def test_dead_ignored_after_update(self):
+        self.targeting.update()
+        self.targeting.get_nearest_enemy(self.unit)
+
+        entity_flags.is_dead.add(self.near_enemy)
+
+        # the same for the rest of the update
+        self.assertEqual(self.near_enemy, self.targeting.get_nearest_enemy(self.unit))
+
+        self.targeting.update()
+        self.assertEqual(self.far_enemy, self.targeting.get_nearest_enemy(self.unit))
+
+        entity_flags.is_dead.add(self.far_enemy)
+        self.targeting.update()
+        self.assertIsNone(self.targeting.get_nearest_enemy(self.unit))